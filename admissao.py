@@ -0,0 +1,310 @@
+"""Controle de admissão para a geração do plano mestre.
+
+Quando muita gente aperta "Gerar Plano Mestre" ao mesmo tempo, cada sessão
+dispararia sua rajada de chamadas contra a mesma cota do Gemini e todo mundo
+ficaria lento. Aqui só ``vagas`` planos rodam por vez; o resto espera numa
+fila limitada a ``max_fila``, ordenada por:
+
+1. classe: pedidos baratos (local interno, sem Agente de Localização) primeiro;
+   quem espera mais que ``envelhecimento`` segundos sobe para a classe barata,
+   para ninguém ficar para trás para sempre;
+2. justiça entre usuários: quem já foi atendido menos vezes passa na frente;
+3. ordem de chegada.
+
+Cada usuário (sessão) ocupa no máximo uma ficha. Fila cheia ou espera longa
+demais não viram erro: o plano sai em modo econômico, só com respostas do
+cache e os textos prontos de fallback dos agentes (``modo_economico``).
+
+O controle vale por processo (as sessões do Streamlit são threads); a cota
+global entre workers continua em ``cache.consumir_cota``.
+"""
+import contextvars
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+CLASSE_BARATA = 0
+CLASSE_NORMAL = 1
+
+_somente_cache = contextvars.ContextVar("somente_cache", default=False)
+
+
+class FilaCheia(Exception):
+    """A fila de geração de planos está lotada."""
+
+
+class CargaAlta(Exception):
+    """Modo econômico: a resposta não está no cache e não vamos chamar o LLM agora."""
+
+
+def em_modo_economico():
+    return _somente_cache.get()
+
+
+@contextmanager
+def modo_economico():
+    """Dentro do bloco, ``chamar_llm`` só devolve o que já estiver no cache."""
+    token = _somente_cache.set(True)
+    try:
+        yield
+    finally:
+        _somente_cache.reset(token)
+
+
+class Ficha:
+    __slots__ = ("usuario", "classe", "seq", "chegada", "inicio", "ativa", "medir")
+
+    def __init__(self, usuario, classe, seq, medir=True):
+        self.usuario, self.classe, self.seq = usuario, classe, seq
+        self.medir = medir # Entra na média de duração de um plano?
+        self.chegada = time.monotonic()
+        self.inicio = None
+        self.ativa = False
+
+
+class ControleAdmissao:
+    """Fila de prioridade limitada com justiça por usuário e ``vagas`` execuções simultâneas."""
+
+    def __init__(self, vagas=4, max_fila=20, envelhecimento=20.0, duracao_inicial=10.0):
+        self.vagas = vagas
+        self.max_fila = max_fila
+        self.envelhecimento = envelhecimento
+        self.duracao_media = duracao_inicial # Média móvel (s) de um plano, para estimar a espera
+        self._espera = [] # Fichas aguardando (pequena: varrer é mais simples que manter um heap com envelhecimento)
+        self._ativas = {} # usuario -> ficha em execução
+        self._atendimentos = {} # usuario -> planos já gerados
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+    def _chave(self, ficha, agora):
+        classe = CLASSE_BARATA if agora - ficha.chegada >= self.envelhecimento else ficha.classe
+        return (classe, self._atendimentos.get(ficha.usuario, 0), ficha.seq)
+
+    def _ordem(self):
+        agora = time.monotonic()
+        return sorted(self._espera, key=lambda ficha: self._chave(ficha, agora))
+
+    def entrar(self, usuario, classe=CLASSE_NORMAL, medir=True):
+        """Ficha do usuário na fila (a mesma, se ele clicar de novo). Lança ``FilaCheia``."""
+        with self._cond:
+            for ficha in itertools.chain(self._ativas.values(), self._espera):
+                if ficha.usuario == usuario:
+                    return ficha
+            if len(self._espera) >= self.max_fila:
+                raise FilaCheia(f"{len(self._espera)} planos já aguardam na fila")
+            ficha = Ficha(usuario, classe, next(self._seq), medir)
+            self._espera.append(ficha)
+            return ficha
+
+    def posicao(self, ficha):
+        """0 se já está rodando; senão, 1 para o próximo da fila, 2 para o seguinte..."""
+        with self._cond:
+            if ficha.ativa:
+                return 0
+            return self._ordem().index(ficha) + 1 if ficha in self._espera else None
+
+    def _admitir_se_for_a_vez(self, ficha):
+        if ficha.ativa:
+            return True
+        if len(self._ativas) < self.vagas and self._ordem()[0] is ficha:
+            self._espera.remove(ficha)
+            self._ativas[ficha.usuario] = ficha
+            ficha.ativa = True
+            ficha.inicio = time.monotonic()
+            return True
+        return False
+
+    def espera_estimada(self, ficha):
+        """Segundos até a vez da ficha, supondo que cada vaga atende um plano por ``duracao_media``."""
+        posicao = self.posicao(ficha)
+        if not posicao:
+            return 0.0
+        return (posicao + len(self._ativas) - 1) // self.vagas * self.duracao_media
+
+    def aguardar(self, ficha, espera_max=60.0, ao_esperar=None):
+        """Bloqueia até a vez da ficha. Devolve False (e sai da fila) se passar de ``espera_max``.
+
+        ``ao_esperar(posicao, tamanho_fila)`` é chamado sempre que a posição
+        muda, para a interface mostrar quanto falta. Ele roda fora da trava e
+        pode lançar (no Streamlit, aba fechada no meio da espera vira
+        ``StopException``): a ficha sai da fila antes de a exceção subir, senão
+        ficaria na frente de todo mundo para sempre.
+        """
+        limite = time.monotonic() + espera_max
+        ultima = None
+        try:
+            while True:
+                with self._cond:
+                    if self._admitir_se_for_a_vez(ficha):
+                        return True
+                    restante = limite - time.monotonic()
+                    if restante <= 0:
+                        self._espera.remove(ficha)
+                        self._cond.notify_all()
+                        return False
+                    posicao = self._ordem().index(ficha) + 1
+                    tamanho_fila = len(self._espera)
+                    if not ao_esperar or posicao == ultima:
+                        # Acorda também periodicamente: o envelhecimento muda a ordem sem ninguém notificar
+                        self._cond.wait(min(restante, 1.0))
+                        continue
+                ultima = posicao
+                ao_esperar(posicao, tamanho_fila)
+        except BaseException:
+            self.liberar(ficha)
+            raise
+
+    def liberar(self, ficha):
+        with self._cond:
+            if self._ativas.get(ficha.usuario) is ficha:
+                del self._ativas[ficha.usuario]
+                self._atendimentos[ficha.usuario] = self._atendimentos.get(ficha.usuario, 0) + 1
+                if ficha.medir:
+                    self.duracao_media = 0.8 * self.duracao_media + 0.2 * (time.monotonic() - ficha.inicio)
+            elif ficha in self._espera:
+                self._espera.remove(ficha)
+            ficha.ativa = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def vaga(self, usuario, classe=CLASSE_NORMAL, espera_max=60.0, ao_esperar=None, medir=True):
+        """``with controle.vaga(...) as admitido:``; sem vaga, o bloco roda em modo econômico.
+
+        Se a espera estimada já passa de ``espera_max``, nem entra na fila:
+        melhor um plano econômico agora do que um completo depois do timeout.
+        Quem já está rodando entra direto e não devolve a vaga ao sair (uma
+        seção dentro do próprio plano). ``medir=False`` deixa a execução fora
+        da média de duração: uma seção sozinha não é um plano inteiro.
+        """
+        with self._cond:
+            ja_rodando = usuario in self._ativas
+        if ja_rodando:
+            yield True
+            return
+        try:
+            ficha = self.entrar(usuario, classe, medir)
+        except FilaCheia:
+            ficha = None
+        if ficha is not None and self.espera_estimada(ficha) > espera_max:
+            self.liberar(ficha)
+            ficha = None
+        if ficha is None or not self.aguardar(ficha, espera_max, ao_esperar):
+            with modo_economico():
+                yield False
+            return
+        try:
+            yield True
+        finally:
+            self.liberar(ficha)
+
+    def estatisticas(self):
+        with self._cond:
+            return {"rodando": len(self._ativas), "na_fila": len(self._espera), "vagas": self.vagas}
+
+
+# --- Teste de carga com um LLM de mentirinha ---
+class LLMLocal:
+    """Substituto local do Gemini: ``capacidade`` chamadas em paralelo sem degradar.
+
+    Acima disso a latência cresce com a concorrência (como um servidor
+    compartilhando CPU) e, passando de ``limite_erros`` chamadas simultâneas,
+    responde com erro de cota, como o 429 da API.
+    """
+
+    def __init__(self, capacidade=4, latencia=0.05, limite_erros=64):
+        self.capacidade, self.latencia, self.limite_erros = capacidade, latencia, limite_erros
+        self.em_voo = 0
+        self.erros = 0
+        self._mutex = threading.Lock()
+
+    def chamar(self):
+        with self._mutex:
+            self.em_voo += 1
+            carga = self.em_voo
+        try:
+            if carga > self.limite_erros:
+                with self._mutex:
+                    self.erros += 1
+                time.sleep(self.latencia) # Até o erro demora a voltar
+                raise CargaAlta("429: cota esgotada")
+            time.sleep(self.latencia * max(1.0, carga / self.capacidade))
+        finally:
+            with self._mutex:
+                self.em_voo -= 1
+
+
+def simular_carga(usuarios=120, chamadas_por_plano=5, controle=None, llm=None, espera_max=3.0):
+    """Todos os ``usuarios`` pedem o plano ao mesmo tempo; devolve as latências (s) e contadores."""
+    llm = llm or LLMLocal()
+    latencias = []
+    contadores = {"completos": 0, "economicos": 0, "com_erro": 0}
+    mutex = threading.Lock()
+    largada = threading.Event()
+
+    def gerar_plano(i):
+        classe = CLASSE_BARATA if i % 3 == 0 else CLASSE_NORMAL
+        chamadas = chamadas_por_plano - 1 if classe == CLASSE_BARATA else chamadas_por_plano
+        largada.wait()
+        inicio = time.perf_counter()
+        resultado = "completos"
+        if controle is None:
+            admitido_ctx = contextmanager(lambda: (yield True))()
+        else:
+            admitido_ctx = controle.vaga(f"usuario-{i}", classe, espera_max=espera_max)
+        with admitido_ctx as admitido:
+            if not admitido:
+                resultado = "economicos" # Fallbacks prontos: nenhuma chamada ao LLM
+            else:
+                for _ in range(chamadas):
+                    try:
+                        llm.chamar()
+                    except CargaAlta:
+                        resultado = "com_erro"
+        with mutex:
+            latencias.append(time.perf_counter() - inicio)
+            contadores[resultado] += 1
+
+    threads = [threading.Thread(target=gerar_plano, args=(i,)) for i in range(usuarios)]
+    for t in threads:
+        t.start()
+    largada.set()
+    for t in threads:
+        t.join()
+    return sorted(latencias), contadores
+
+
+def _percentil(valores, p):
+    return valores[min(len(valores) - 1, int(len(valores) * p))]
+
+
+def benchmark_admissao(rajadas=(30, 120, 240), espera_max=5.0, chamadas_por_plano=5):
+    """Com controle, o p99 fica preso em ``espera_max`` + um plano e nenhuma chamada leva 429.
+
+    O controle não cria capacidade: o LLM falso atende ``capacidade / latencia``
+    chamadas por segundo, então numa rajada só cabem uns ``vazao * espera_max``
+    planos completos e o resto sai no modo econômico. A linha "cabem" mostra
+    esse piso, para comparar com o descarte medido.
+
+    ``vagas`` é o dobro da capacidade do LLM: com exatamente a capacidade, o
+    intervalo entre um plano terminar e o próximo começar deixa o LLM ocioso
+    e o p99 de rajadas pequenas fica pior que sem controle.
+    """
+    llm = LLMLocal()
+    chamadas_medias = chamadas_por_plano - 1 / 3 # Um terço dos planos é barato (uma chamada a menos)
+    vazao = llm.capacidade / llm.latencia / chamadas_medias
+    duracao_plano = chamadas_medias * llm.latencia * 2 # Com o LLM saturado pelas 2x vagas
+    for usuarios in rajadas:
+        cabem = min(usuarios, int(vazao * (espera_max + duracao_plano)))
+        print(f"{usuarios:>4} usuários: cabem ~{cabem} planos completos em {espera_max:.0f}s "
+              f"(descarte mínimo ~{1 - cabem / usuarios:.0%})")
+        for nome, controle in (("sem controle", None),
+                               ("com controle", ControleAdmissao(vagas=2 * llm.capacidade, max_fila=cabem,
+                                                                 envelhecimento=2.0, duracao_inicial=duracao_plano))):
+            latencias, contadores = simular_carga(usuarios, chamadas_por_plano, controle=controle, espera_max=espera_max)
+            print(f"      {nome}: p50 {_percentil(latencias, 0.50):.2f}s  p99 {_percentil(latencias, 0.99):.2f}s  "
+                  f"econômicos {contadores['economicos'] / usuarios:.0%}  {contadores}")
+
+
+if __name__ == "__main__":
+    benchmark_admissao()
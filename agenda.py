@@ -0,0 +1,245 @@
+"""Agenda compartilhada dos espaços: quem já reservou o auditório naquele dia?
+
+Os eventos planejados ficam num arquivo JSON Lines só de acréscimos (uma
+reserva ou cancelamento por linha). Checar conflito e gravar acontecem sob
+uma trava do sistema operacional no próprio arquivo (``flock``), que vale
+entre todos os processos da máquina com ou sem Redis, e também sob a trava
+do backend de cache, se houver. Cada processo mantém um índice em memória e
+só lê as linhas novas do arquivo.
+
+Índice: por local, os inícios ordenados (em ordinais de data) com os fins e
+ids em listas paralelas, mais a maior duração já vista. Um evento
+``[inicio, fim)`` só pode cruzar ``[a, b)`` se ``a - duracao_max < inicio < b``,
+então dois ``bisect`` delimitam os candidatos e a consulta é O(log n + k).
+"""
+import datetime
+import json
+import os
+import threading
+import time
+import uuid
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager, nullcontext
+
+try:
+    import fcntl
+except ImportError: # Windows: fica só a trava do backend de cache
+    fcntl = None
+
+ARQUIVO_AGENDA = os.getenv("AGENDA_ARQUIVO", "agenda_eventos.jsonl")
+LOCAIS_SEM_CONFLITO = {"Outro Espaço Interno"} # Genérico demais para afirmar que é o mesmo lugar
+LOTE_INSERCAO_INCREMENTAL = 256 # Acima disso, reordenar de uma vez sai mais barato que inserir um a um
+
+
+class _AgendaLocal:
+    __slots__ = ("inicios", "fins", "ids", "duracao_max")
+
+    def __init__(self):
+        self.inicios, self.fins, self.ids = [], [], []
+        self.duracao_max = 0
+
+
+class AgendaLocais:
+    """Índice de reservas por local, sincronizado com o arquivo da agenda."""
+
+    def __init__(self, caminho=ARQUIVO_AGENDA, cache=None):
+        self.caminho = caminho
+        self.cache = cache # Backend de cache.py; a trava dele serializa as gravações entre workers
+        self.eventos = {} # id -> registro
+        self._locais = {}
+        self._lidos = 0 # Bytes do arquivo já aplicados ao índice
+        self._mutex = threading.Lock()
+        self.atualizar()
+
+    # --- Índice em memória ---
+    def _inserir(self, registro):
+        agenda = self._locais.setdefault(registro["local"], _AgendaLocal())
+        inicio, fim = registro["inicio"], registro["fim"]
+        pos = bisect_right(agenda.inicios, inicio)
+        agenda.inicios.insert(pos, inicio)
+        agenda.fins.insert(pos, fim)
+        agenda.ids.insert(pos, registro["id"])
+        agenda.duracao_max = max(agenda.duracao_max, fim - inicio)
+        self.eventos[registro["id"]] = registro
+
+    def _retirar(self, id_evento):
+        registro = self.eventos.pop(id_evento, None)
+        if registro is None:
+            return
+        agenda = self._locais[registro["local"]]
+        pos = bisect_left(agenda.inicios, registro["inicio"])
+        while agenda.ids[pos] != id_evento:
+            pos += 1
+        del agenda.inicios[pos], agenda.fins[pos], agenda.ids[pos]
+
+    def _aplicar(self, registros):
+        """Reservas primeiro, cancelamentos depois (um cancelamento só cita ids mais antigos)."""
+        novos = [r for r in registros if not r.get("cancelado")]
+        if len(novos) <= LOTE_INSERCAO_INCREMENTAL:
+            for registro in novos:
+                self._inserir(registro)
+        else: # Carga inicial ou lote grande: acrescenta tudo e reordena cada local uma vez
+            tocados = set()
+            for registro in novos:
+                agenda = self._locais.setdefault(registro["local"], _AgendaLocal())
+                agenda.inicios.append(registro["inicio"])
+                agenda.fins.append(registro["fim"])
+                agenda.ids.append(registro["id"])
+                agenda.duracao_max = max(agenda.duracao_max, registro["fim"] - registro["inicio"])
+                self.eventos[registro["id"]] = registro
+                tocados.add(registro["local"])
+            for local in tocados:
+                agenda = self._locais[local]
+                ordem = sorted(range(len(agenda.inicios)), key=agenda.inicios.__getitem__)
+                agenda.inicios = [agenda.inicios[i] for i in ordem]
+                agenda.fins = [agenda.fins[i] for i in ordem]
+                agenda.ids = [agenda.ids[i] for i in ordem]
+        for registro in registros:
+            if registro.get("cancelado"):
+                self._retirar(registro["id"])
+
+    def atualizar(self):
+        """Aplica as linhas que outros workers acrescentaram desde a última leitura."""
+        with self._mutex:
+            if not os.path.exists(self.caminho) or os.path.getsize(self.caminho) <= self._lidos:
+                return
+            registros = []
+            with open(self.caminho, "rb") as arquivo:
+                arquivo.seek(self._lidos)
+                for linha in arquivo:
+                    if not linha.endswith(b"\n"): # Linha ainda sendo escrita: fica para a próxima
+                        break
+                    self._lidos += len(linha)
+                    if linha.strip():
+                        registros.append(json.loads(linha))
+            self._aplicar(registros)
+
+    # --- Consultas ---
+    def conflitos(self, local, data, duracao_dias=1, ignorar_id=None):
+        """Eventos no ``local`` que cruzam ``duracao_dias`` a partir de ``data``."""
+        agenda = self._locais.get(local)
+        if agenda is None or local in LOCAIS_SEM_CONFLITO:
+            return []
+        inicio = data.toordinal()
+        fim = inicio + duracao_dias
+        with self._mutex: # As sessões do Streamlit são threads: nada de ler listas pela metade
+            primeiro = bisect_right(agenda.inicios, inicio - agenda.duracao_max)
+            ultimo = bisect_left(agenda.inicios, fim)
+            return [self.eventos[agenda.ids[i]] for i in range(primeiro, ultimo)
+                    if agenda.fins[i] > inicio and agenda.ids[i] != ignorar_id]
+
+    def datas_livres_proximas(self, local, data, duracao_dias=1, quantidade=3, horizonte_dias=365,
+                              ignorar_id=None, hoje=None):
+        """As ``quantidade`` datas livres mais próximas de ``data`` (antes ou depois, nunca no passado)."""
+        hoje = hoje or datetime.date.today()
+        livres = []
+        for distancia in range(1, horizonte_dias + 1):
+            for candidata in (data + datetime.timedelta(days=distancia), data - datetime.timedelta(days=distancia)):
+                if candidata >= hoje and not self.conflitos(local, candidata, duracao_dias, ignorar_id):
+                    livres.append(candidata)
+            if len(livres) >= quantidade:
+                break
+        return sorted(livres, key=lambda d: (abs((d - data).days), d))[:quantidade]
+
+    # --- Gravação ---
+    def _acrescentar(self, registros):
+        linhas = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in registros)
+        with open(self.caminho, "a", encoding="utf-8") as arquivo:
+            arquivo.write(linhas)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+
+    def reservar(self, local, data, nome_evento=None, duracao_dias=1, substituir_id=None, aceitar_conflito=False):
+        """Grava a reserva (cancelando ``substituir_id``, se houver) e devolve o id novo.
+
+        Lança ``ValueError`` se, já com a trava na mão, o local estiver ocupado:
+        alguém pode ter reservado entre a checagem da página 3 e agora. Com
+        ``aceitar_conflito`` (o organizador já viu o conflito e topou dividir),
+        grava do mesmo jeito.
+        """
+        with self._travada():
+            return self._reservar(local, data, nome_evento, duracao_dias, substituir_id, aceitar_conflito)
+
+    def cancelar(self, id_evento):
+        """Libera a reserva (por exemplo, quando o evento trocou de local)."""
+        with self._travada():
+            return self._cancelar(id_evento)
+
+    @contextmanager
+    def _travada(self):
+        """Exclusão mútua para checar e gravar: ``flock`` no arquivo mais a trava do cache, se houver.
+
+        Sem Redis, a trava do cache é um ``CacheLocal`` por processo e não
+        impediria dois workers de reservar o mesmo dia; o ``flock`` impede (e
+        também separa threads, porque cada uma abre o arquivo de novo).
+        """
+        trava_cache = self.cache.lock("agenda", timeout=10, espera=10) if self.cache is not None else nullcontext()
+        with trava_cache, open(self.caminho, "a", encoding="utf-8") as arquivo:
+            if fcntl is not None:
+                fcntl.flock(arquivo.fileno(), fcntl.LOCK_EX) # Solta sozinho ao fechar o arquivo
+            yield
+
+    def _cancelar(self, id_evento):
+        self.atualizar()
+        if id_evento in self.eventos:
+            self._acrescentar([{"id": id_evento, "cancelado": True}])
+            self.atualizar()
+
+    def _reservar(self, local, data, nome_evento, duracao_dias, substituir_id, aceitar_conflito):
+        self.atualizar()
+        if not aceitar_conflito and self.conflitos(local, data, duracao_dias, ignorar_id=substituir_id):
+            raise ValueError(f"'{local}' já está reservado em {data.strftime('%d/%m/%Y')}")
+        registro = {
+            "id": uuid.uuid4().hex, "local": local, "inicio": data.toordinal(),
+            "fim": data.toordinal() + duracao_dias, "nome": nome_evento, "criado_em": time.time(),
+        }
+        registros = [{"id": substituir_id, "cancelado": True}] if substituir_id in self.eventos else []
+        self._acrescentar(registros + [registro])
+        self.atualizar()
+        return registro["id"]
+
+
+def benchmark_agenda(n=50_000, locais=20, caminho="agenda_benchmark.jsonl"):
+    import random
+    rng = random.Random(42)
+    hoje = datetime.date.today()
+    if os.path.exists(caminho):
+        os.remove(caminho)
+    try:
+        linhas = []
+        for i in range(n):
+            inicio = (hoje + datetime.timedelta(days=rng.randrange(3650))).toordinal()
+            linhas.append({"id": f"b{i}", "local": f"Sala {rng.randrange(locais)}", "inicio": inicio,
+                           "fim": inicio + rng.choice((1, 1, 1, 2, 3)), "nome": None})
+        agenda = AgendaLocais(caminho)
+        agenda._acrescentar(linhas)
+        inicio = time.perf_counter()
+        agenda.atualizar()
+        print(f"{n} eventos indexados em {(time.perf_counter() - inicio) * 1000:.0f} ms")
+
+        piores = {"conflitos": 0.0, "datas livres": 0.0, "reserva": 0.0}
+        for _ in range(200):
+            local, data = f"Sala {rng.randrange(locais)}", hoje + datetime.timedelta(days=rng.randrange(3650))
+            t0 = time.perf_counter()
+            agenda.conflitos(local, data)
+            t1 = time.perf_counter()
+            agenda.datas_livres_proximas(local, data)
+            t2 = time.perf_counter()
+            piores["conflitos"] = max(piores["conflitos"], t1 - t0)
+            piores["datas livres"] = max(piores["datas livres"], t2 - t1)
+        for _ in range(50):
+            t0 = time.perf_counter()
+            data = hoje + datetime.timedelta(days=rng.randrange(3650))
+            local = f"Sala {rng.randrange(locais)}"
+            if not agenda.conflitos(local, data):
+                agenda.reservar(local, data)
+            piores["reserva"] = max(piores["reserva"], time.perf_counter() - t0)
+        for nome, segundos in piores.items():
+            print(f"pior {nome}: {segundos * 1000:.2f} ms")
+        return piores
+    finally:
+        os.remove(caminho)
+
+
+if __name__ == "__main__":
+    benchmark_agenda()
@@ -0,0 +1,569 @@
+"""Agentes do planejador: configuração do Gemini, chamadas ao LLM e cada agente especializado.
+
+Importado uma vez por processo, só quando a página de resultados precisa dele.
+"""
+import streamlit as st
+import json
+import os
+import google.generativeai as genai
+from dotenv import load_dotenv
+import hashlib
+import time
+from admissao import CargaAlta, em_modo_economico
+from cache import criar_cache, single_flight, consumir_cota
+from convidados import validar_e_normalizar, ler_registros, hash_arquivo
+from transporte import planejar_transporte
+
+# --- Configuração Inicial e Carregamento da API Key ---
+try:
+    load_dotenv()
+    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+    if not GEMINI_API_KEY:
+        if hasattr(st, 'secrets') and 'GEMINI_API_KEY' in st.secrets:
+            GEMINI_API_KEY = st.secrets["GEMINI_API_KEY"]
+        else:
+            st.error("Ops! A GEMINI_API_KEY não foi encontrada. Crie um ficheiro .env ou configure-a nos secrets do Streamlit Cloud.")
+            st.stop()
+
+    genai.configure(api_key=GEMINI_API_KEY)
+    # A inicialização do client foi movida para dentro das funções dos agentes
+    # para permitir a especificação do model_id por chamada, se necessário,
+    # ou para usar diferentes clientes/configurações por modelo no futuro.
+    # client = genai.Client() # Removido daqui
+    global_model_id = 'gemini-1.5-flash-latest' # Atualizado para um modelo mais recente e flexível
+    print("Configuração da API Gemini verificada.")
+except Exception as e:
+    st.error(f"Deu ruim na configuração do Gemini: {e}")
+    st.stop()
+
+# --- Funções dos Agentes (Simuladas e com Chamadas ao Gemini) ---
+
+def get_gemini_model(model_id_requested):
+    """Helper para obter o modelo generativo."""
+    try:
+        return genai.GenerativeModel(model_id_requested)
+    except Exception as e:
+        st.error(f"Erro ao carregar o modelo {model_id_requested}: {e}")
+        # Fallback para um modelo padrão se o solicitado falhar, ou poderia parar.
+        # Por simplicidade, tentaremos o global_model_id como fallback.
+        if model_id_requested != global_model_id:
+            try:
+                st.warning(f"Tentando fallback para {global_model_id}")
+                return genai.GenerativeModel(global_model_id)
+            except Exception as e_fallback:
+                st.error(f"Erro ao carregar modelo de fallback {global_model_id}: {e_fallback}")
+                raise e_fallback # Re-lança a exceção se o fallback também falhar
+        raise e # Re-lança a exceção original se o modelo solicitado já era o global ou se não há fallback
+
+# --- Cache Compartilhado (respostas do LLM, travas, cota da API, agregados de convidados) ---
+LIMITE_CHAMADAS_API_POR_MINUTO = int(os.getenv("GEMINI_LIMITE_POR_MINUTO", "15")) # Cota global, somando todos os workers
+TTL_CACHE_LLM = 6 * 60 * 60 # Respostas do LLM valem por 6 horas
+TTL_CACHE_CONVIDADOS = 24 * 60 * 60
+MAX_ERROS_EXIBIDOS = 50 # Linhas com problema listadas para o organizador
+
+@st.cache_resource
+def obter_cache():
+    """Um backend por processo; com REDIS_URL todos os processos compartilham o mesmo."""
+    return criar_cache()
+
+# --- Roteamento de Modelos por Agente ---
+# Níveis de modelo: o rápido atende nomes, dicas e transporte; o robusto fica para temas e locais.
+# Custos em US$ por 1 milhão de tokens (tabela pública do Gemini; ajuste conforme o contrato).
+NIVEIS_MODELO = {
+    "rapido": {
+        "model_id": os.getenv("MODELO_RAPIDO", "gemini-1.5-flash-8b"),
+        "max_output_tokens": 512, "temperature": 0.9,
+        "custo_entrada_1m": 0.0375, "custo_saida_1m": 0.15,
+    },
+    "robusto": {
+        "model_id": os.getenv("MODELO_ROBUSTO", "gemini-1.5-pro-latest"),
+        "max_output_tokens": 2048, "temperature": 0.7,
+        "custo_entrada_1m": 1.25, "custo_saida_1m": 5.00,
+    },
+}
+
+# Política por agente: nível inicial, ajustes de geração e para onde escalar se a resposta não parsear
+ROTAS_AGENTES = {
+    "otimizador": {"nivel": "rapido", "max_output_tokens": 400},
+    "batizador": {"nivel": "rapido", "max_output_tokens": 256, "temperature": 1.0, "escalar_para": "robusto"},
+    "transporte": {"nivel": "rapido", "max_output_tokens": 400},
+    "dietas": {"nivel": "rapido", "max_output_tokens": 300},
+    "combinada": {"nivel": "rapido", "max_output_tokens": 1024, "escalar_para": "robusto"},
+    "tema": {"nivel": "robusto", "escalar_para": None},
+    "localizacao": {"nivel": "robusto", "escalar_para": None},
+}
+CAMPOS_GERACAO = ("max_output_tokens", "temperature")
+
+def chamar_llm(model_id, prompt, generation_config=None, nivel="robusto"):
+    """Gera texto com cache compartilhado, single-flight e respeitando a cota global."""
+    cache = obter_cache()
+    assinatura = f"{model_id}\n{json.dumps(generation_config, sort_keys=True)}\n{prompt}"
+    chave = "llm:" + hashlib.sha256(assinatura.encode('utf-8')).hexdigest()
+    if em_modo_economico(): # Fila de planos lotada: só o que já estiver no cache
+        texto = cache.get(chave)
+        if texto is None:
+            raise CargaAlta("modo econômico: resposta fora do cache")
+        registrar_metrica_nivel(nivel, cache_hits=1)
+        return texto
+    gerou_agora = []
+
+    def _gerar():
+        consumir_cota(cache, "gemini", LIMITE_CHAMADAS_API_POR_MINUTO)
+        model = get_gemini_model(model_id)
+        inicio = time.perf_counter()
+        response = model.generate_content(prompt, generation_config=generation_config)
+        uso = getattr(response, "usage_metadata", None)
+        registrar_metrica_nivel(nivel, chamadas=1,
+                                latencia_ms=int((time.perf_counter() - inicio) * 1000),
+                                tokens_entrada=getattr(uso, "prompt_token_count", 0) or 0,
+                                tokens_saida=getattr(uso, "candidates_token_count", 0) or 0)
+        gerou_agora.append(True)
+        return response.text
+
+    texto = single_flight(cache, chave, _gerar, ttl=TTL_CACHE_LLM)
+    if not gerou_agora:
+        registrar_metrica_nivel(nivel, cache_hits=1)
+    return texto
+
+def chamar_agente_llm(agente, prompt, validar=None, generation_config=None, pronto=None):
+    """Chama o LLM no nível configurado para o agente, escalando se ``validar`` reprovar a resposta.
+
+    Se nem o nível escalado passar na validação, a última resposta é devolvida
+    e o parser do agente decide o fallback, como antes. No modo econômico, sem
+    a resposta no cache, devolve o texto ``pronto`` (no mesmo formato que o
+    LLM usaria), para o agente seguir o caminho normal sem alarde; sem
+    ``pronto``, a ``CargaAlta`` sobe para quem chamou.
+    """
+    rota = ROTAS_AGENTES.get(agente, {"nivel": "robusto"})
+    niveis = [rota["nivel"]] + ([rota["escalar_para"]] if rota.get("escalar_para") else [])
+    texto = None
+    for tentativa, nivel in enumerate(niveis):
+        config_nivel = NIVEIS_MODELO[nivel]
+        ajustes = rota if tentativa == 0 else {} # Ajustes finos do agente valem só para o nível inicial
+        config_geracao = {campo: ajustes.get(campo, config_nivel[campo]) for campo in CAMPOS_GERACAO}
+        config_geracao.update(generation_config or {})
+        try:
+            texto = chamar_llm(ajustes.get("model_id", config_nivel["model_id"]), prompt, config_geracao, nivel=nivel)
+        except CargaAlta:
+            if pronto is None:
+                raise
+            return pronto
+        if validar is None or validar(texto):
+            return texto
+        if tentativa + 1 < len(niveis):
+            print(f"Resposta do agente '{agente}' no nível '{nivel}' não passou na validação; escalando para '{niveis[tentativa + 1]}'.")
+            registrar_metrica_nivel(niveis[tentativa + 1], escalonamentos=1)
+    return texto
+
+def registrar_metrica_nivel(nivel, **valores):
+    """Acumula métricas por nível no cache compartilhado (somando todos os workers)."""
+    cache = obter_cache()
+    for nome, valor in valores.items():
+        if valor:
+            cache.incr(f"metricas:{nivel}:{nome}", valor)
+
+def relatorio_niveis():
+    """Latência, volume e custo estimado por nível de modelo."""
+    cache = obter_cache()
+    linhas = []
+    for nivel, config in NIVEIS_MODELO.items():
+        m = {nome: cache.get(f"metricas:{nivel}:{nome}") or 0
+             for nome in ("chamadas", "latencia_ms", "tokens_entrada", "tokens_saida", "cache_hits", "escalonamentos")}
+        custo = (m["tokens_entrada"] * config["custo_entrada_1m"] + m["tokens_saida"] * config["custo_saida_1m"]) / 1_000_000
+        linhas.append({
+            "Nível": nivel,
+            "Modelo": config["model_id"],
+            "Chamadas": m["chamadas"],
+            "Cache hits": m["cache_hits"],
+            "Escalonamentos recebidos": m["escalonamentos"],
+            "Latência média (ms)": round(m["latencia_ms"] / m["chamadas"]) if m["chamadas"] else 0,
+            "Tokens (entrada/saída)": f"{m['tokens_entrada']}/{m['tokens_saida']}",
+            "Custo estimado (US$)": round(custo, 6),
+        })
+    return linhas
+
+# Respostas prontas do modo econômico, no formato que cada prompt pede ao LLM
+PRONTO_OTIMIZADOR = """- Comida boa e farta resolve metade dos problemas; a outra metade é a playlist.
+- Discurso da diretoria: no máximo 5 minutos, ou o buffet esfria e a galera também.
+- Tenha um plano B para chuva, falta de luz e o tio do karaokê."""
+PRONTO_BATIZADOR = """Festa Surpresa do Chefe Que Não Sabe
+Reunião Que Podia Ser Um Churrasco
+Happy Hour Sem Pauta
+Confraternização Modo Avião
+O Grande Encerramento Sem PowerPoint"""
+PRONTO_TEMAS = """Nome: Viagem Gastronômica Global
+Descrição: Estações de comida de vários países, cada uma com sua bandeirinha. Perfeito para paladares aventureiros!
+Amigável às Dietas/Comida: Cada estação pode ter opções vegetarianas, veganas e sem glúten.
+
+Nome: Anos 80 na Firma
+Descrição: Ombreiras, neon e hits que todo mundo finge não saber cantar.
+Amigável às Dietas/Comida: Petiscos clássicos em versões com e sem glúten, e um bar de sucos para quem não bebe.
+
+Nome: Piquenique Corporativo
+Descrição: Toalhas xadrez, cestas e zero gravata. Descontraído e barato.
+Amigável às Dietas/Comida: Cestas montadas por tipo de dieta, com etiqueta para ninguém comer o que não pode."""
+PRONTO_LOCALIZACAO = """Opção 1: Salão de Festas versátil - Justificativa: Cabe todo mundo e aceita qualquer tema com um pouco de decoração. - Adequação às Dietas/Comida: Buffet terceirizado com estações separadas por dieta. - Contato Simulado: Dona Festança - (11) 90000-0001, a rainha do aluguel de salão
+Opção 2: Restaurante com espaço para grupos - Justificativa: Comida e serviço inclusos, menos coisa para organizar. - Adequação às Dietas/Comida: Peça o cardápio com antecedência e marque as opções veganas e sem glúten. - Contato Simulado: Chef Reserva Garantida - (11) 90000-0002, especialista em mesas compridas"""
+PRONTO_DIETAS = "Foco em variedade para agradar a todos!"
+
+def _resposta_json_valida(texto):
+    try:
+        return isinstance(json.loads(texto), dict)
+    except (TypeError, ValueError):
+        return False
+
+# --- Chamada Combinada: vários agentes pequenos numa única ida ao LLM ---
+def agente_chamada_combinada(tarefas):
+    """Empacota prompts independentes ({agente: prompt}) numa só chamada com resposta JSON.
+
+    Retorna {agente: texto} apenas para os agentes que vieram bem formatados;
+    quem faltar no retorno deve cair na chamada individual de sempre.
+    """
+    if not tarefas:
+        return {}
+    st.write(f"📦 **Chamada combinada:** {len(tarefas)} agentes pegando carona na mesma requisição!")
+    prompt_parts = [
+        "Você vai responder a várias tarefas independentes de uma só vez.",
+        "Responda APENAS com um objeto JSON cujas chaves são exatamente: " + ", ".join(f'"{agente}"' for agente in tarefas) + ".",
+        "O valor de cada chave é uma string com a resposta completa daquela tarefa, seguindo o formato pedido nela (use \\n para quebras de linha).",
+    ]
+    for agente, prompt_agente in tarefas.items():
+        prompt_parts.append(f"### Tarefa \"{agente}\"\n{prompt_agente.strip()}")
+    try:
+        texto_resposta = chamar_agente_llm("combinada", "\n\n".join(prompt_parts), validar=_resposta_json_valida,
+                                           generation_config={"response_mime_type": "application/json"})
+        dados = json.loads(texto_resposta)
+        respostas = {}
+        for agente in tarefas:
+            valor = dados.get(agente) if isinstance(dados, dict) else None
+            if isinstance(valor, list): # Alguns modelos devolvem listas em vez de texto com quebras
+                valor = "\n".join(str(item) for item in valor)
+            if isinstance(valor, str) and valor.strip():
+                respostas[agente] = valor
+        return respostas
+    except CargaAlta: # Modo econômico: cada agente cai na sua resposta pronta
+        return {}
+    except Exception as e:
+        st.warning(f"A chamada combinada não deu liga ({e}). Cada agente vai falar por si.")
+        return {}
+
+def prompt_otimizador_festas():
+    return """
+            Você é um consultor de eventos experiente e bem-humorado.
+            Com base em "pesquisas de satisfação de eventos corporativos anteriores" (use seu conhecimento geral sobre o que funciona e o que não funciona),
+            forneça 3 dicas de ouro engraçadas e úteis para garantir que um evento corporativo seja um sucesso.
+            Formate cada dica como um item de lista.
+            """
+
+def agente_otimizador_festas(usar_feedback_passado, texto_llm=None):
+    st.write("🧐 **Agente Otimizador de Festas consultando os universitários:** Relembrando os sucessos (e os micos) passados!")
+    if usar_feedback_passado:
+        try:
+            texto_resposta = texto_llm
+            if texto_resposta is None:
+                texto_resposta = chamar_agente_llm("otimizador", prompt_otimizador_festas(), pronto=PRONTO_OTIMIZADOR)
+            return texto_resposta.strip().split('\n')
+        except Exception as e:
+            st.error(f"O Agente Otimizador está com dor de cabeça: {e}")
+            return ["Dica de emergência: Sirva bolo. Todo mundo gosta de bolo."]
+    return ["Sem olhar para o passado desta vez? Ok, vida que segue, festa que surge! (Mas sério, um bom DJ faz milagres)."]
+
+def prompt_batizador_eventos(tipo_evento, objetivo_evento_str):
+    return f"""
+        Você é um especialista em criar nomes para eventos corporativos, com um toque de humor e criatividade.
+        Sugira 5 nomes engraçados e originais para um evento do tipo '{tipo_evento}'.
+        Os objetivos principais do evento são: '{objetivo_evento_str if objetivo_evento_str else 'Não especificado, use a criatividade!'}'
+        Liste os nomes, cada um em uma nova linha, sem numeração ou marcadores adicionais, apenas o nome.
+        """
+
+def agente_batizador_eventos(tipo_evento, objetivo_evento_str, texto_llm=None):
+    st.write("🕵️‍♂️ **Agente Batizador entrando em cena:** Preparando nomes tão bons que vão virar meme!")
+    try:
+        if texto_llm is None:
+            texto_llm = chamar_agente_llm("batizador", prompt_batizador_eventos(tipo_evento, objetivo_evento_str),
+                                          validar=lambda texto: len([l for l in texto.split('\n') if l.strip()]) >= 3,
+                                          pronto=PRONTO_BATIZADOR)
+        nomes_sugeridos = texto_llm.strip().split('\n')
+        return [nome.replace("- ", "").strip() for nome in nomes_sugeridos if nome.strip()]
+    except Exception as e:
+        st.error(f"O Agente Batizador tropeçou feio: {e}")
+        return ["Erro ao gerar nomes. Que tal 'Festa Surpresa do Chefe Que Não Sabe'?"]
+
+def agente_sugestao_tema_com_restricoes(tipo_evento, ideia_tema_inicial, resumo_restricoes_str, sugestoes_comida_str=None):
+    st.write("🎨 **Agente de Sugestão de Temas (com olhar clínico para dietas e cardápios) em ação!**")
+    try:
+        prompt_parts = [
+            f"Você é um planejador de eventos criativo e consciente, especializado em sugerir temas para eventos corporativos do tipo '{tipo_evento}'.",
+            "Sugira 3 temas originais e divertidos."
+        ]
+        if ideia_tema_inicial:
+            prompt_parts.append(f"O organizador teve uma ideia inicial de tema: '{ideia_tema_inicial}'. Você pode se inspirar nela, melhorá-la ou sugerir alternativas.")
+        
+        if resumo_restricoes_str and "nenhuma" not in resumo_restricoes_str.lower() and "aparentemente" not in resumo_restricoes_str.lower() and "entrada manual" not in resumo_restricoes_str.lower():
+            prompt_parts.append(f"Restrições alimentares predominantes no grupo: '{resumo_restricoes_str}'.")
+        
+        if sugestoes_comida_str and "nenhuma" not in sugestoes_comida_str.lower() and "flexível" not in sugestoes_comida_str.lower():
+            prompt_parts.append(f"Com base nas restrições, foram sugeridos os seguintes conceitos de comida: '{sugestoes_comida_str}'. Tente alinhar os temas com essas sugestões gastronômicas, se possível, ou sugira temas que naturalmente acomodem essas opções.")
+        else:
+            prompt_parts.append("Não foram especificadas restrições alimentares significativas ou sugestões de comida específicas, então foque na criatividade geral do tema, mas mencione a versatilidade gastronômica se possível.")
+
+        prompt_parts.extend([
+            "Para cada tema sugerido, forneça:",
+            "1. Nome do Tema (curto e chamativo)",
+            "2. Descrição do Tema (1-2 frases explicando o conceito e o tom)",
+            "3. Como o tema pode ser amigável às dietas e aos conceitos de comida sugeridos (se aplicável).",
+            "Formate a resposta claramente para cada tema.",
+            "Exemplo para um tema:",
+            "Nome: Viagem Gastronômica Global",
+            "Descrição: Uma celebração da culinária mundial, com estações representando diferentes países. Perfeito para paladares aventureiros!",
+            "Amigável às Dietas/Comida: Extremamente versátil! Cada estação pode ter opções vegetarianas, veganas, sem glúten, etc., e se alinha bem com um conceito de 'comida internacional'."
+        ])
+        prompt = "\n".join(prompt_parts)
+        
+        texto_resposta = chamar_agente_llm("tema", prompt, pronto=PRONTO_TEMAS)
+        sugestoes_formatadas = texto_resposta.strip().split('\n\n') 
+        if len(sugestoes_formatadas) < 2 and "\nNome:" in texto_resposta: 
+            sugestoes_formatadas = texto_resposta.split("Nome:")[1:]
+            sugestoes_formatadas = ["Nome: " + s.strip() for s in sugestoes_formatadas]
+
+        return [s.strip() for s in sugestoes_formatadas if s.strip()]
+    except Exception as e:
+        st.error(f"O Agente de Sugestão de Temas está com bloqueio criativo (e técnico): {e}")
+        return ["Tema Sugerido: 'A Festa do Improviso' (porque deu ruim aqui)."]
+
+def agente_localizacao(tipo_evento, tema_final_escolhido, tipo_local_desejado, resumo_restricoes_str=None, sugestoes_comida_str=None, local_interno_especifico=None):
+    st.write("🗺️ **Agente de Localização com o mapa na mão:** Procurando o esconderijo perfeito, considerando tema, dietas e tipos de comida!")
+    sugestoes = []
+    contatos_simulados = {}
+
+    if tipo_local_desejado == "Interno na Empresa":
+        if local_interno_especifico:
+            sugestoes.append(f"Local Interno: {local_interno_especifico} da empresa. Vantagens: Custo zero (esperamos!), já é de casa. Desvantagens: A galera pode não desligar do trabalho.")
+        else:
+            sugestoes.append("Local Interno: Algum espaço bacana aí na empresa. Confere o auditório ou aquela área de convivência!")
+        return sugestoes, contatos_simulados
+
+    elif tipo_local_desejado == "Externo":
+        try:
+            prompt_local_parts = [
+                "Você é um assistente de planejamento de eventos especializado em encontrar locais externos.",
+                f"Para um evento corporativo do tipo '{tipo_evento}'"
+            ]
+            if tema_final_escolhido and tema_final_escolhido != "(Nenhum tema específico / Estilo Livre)":
+                prompt_local_parts.append(f"O tema escolhido para o evento é: '{tema_final_escolhido}'. As sugestões de local devem, se possível, complementar ou ser adequadas a este tema.")
+
+            prompt_local_parts.append(f"Sugira 2 opções de tipos de locais externos adequados (ex: Restaurante Temático que combine com o tema, Salão de Festas versátil, Chácara com boa estrutura).")
+
+            if resumo_restricoes_str and "nenhuma" not in resumo_restricoes_str.lower() and "aparentemente" not in resumo_restricoes_str.lower() and "entrada manual" not in resumo_restricoes_str.lower() and "erro na leitura" not in resumo_restricoes_str.lower():
+                prompt_local_parts.append(f"Restrições alimentares predominantes no grupo: '{resumo_restricoes_str}'.")
+            
+            if sugestoes_comida_str and "nenhuma" not in sugestoes_comida_str.lower() and "flexível" not in sugestoes_comida_str.lower():
+                prompt_local_parts.append(f"Conceitos de comida sugeridos com base nas dietas: '{sugestoes_comida_str}'.")
+            
+            prompt_local_parts.append("Ao sugerir restaurantes ou locais com buffet, mencione brevemente como eles poderiam atender às restrições e aos conceitos de comida mencionados, ou se são conhecidos por ter boas opções para dietas variadas e os tipos de cozinha sugeridos.")
+            
+            prompt_local_parts.extend([
+                "Para cada sugestão, adicione uma breve justificativa (1 frase) e um \"contato simulado\" engraçado (ex: \"Falar com Chef Estrela Cadente - (11) 91234-5678, mestre em cardápios inclusivos\").",
+                "Use seu conhecimento geral para dar sugestões criativas.",
+                "Formate a resposta como:",
+                "Opção 1: [Nome/Tipo do Local 1] - Justificativa: [Justificativa 1] - Adequação às Dietas/Comida: [Comentário] - Contato Simulado: [Contato 1]",
+                "Opção 2: [Nome/Tipo do Local 2] - Justificativa: [Justificativa 2] - Adequação às Dietas/Comida: [Comentário] - Contato Simulado: [Contato 2]"
+            ])
+            prompt_local = "\n".join(prompt_local_parts)
+            
+            raw_sugestoes_bruto = chamar_agente_llm("localizacao", prompt_local, pronto=PRONTO_LOCALIZACAO).strip()
+            raw_sugestoes = []
+            if "Opção 1:" in raw_sugestoes_bruto:
+                partes_opcoes = raw_sugestoes_bruto.split("Opção ")[1:] 
+                for parte in partes_opcoes:
+                    raw_sugestoes.append("Opção " + parte.strip())
+            else: 
+                raw_sugestoes = raw_sugestoes_bruto.split('\n')
+
+            current_option_lines = []
+            for line_raw in raw_sugestoes:
+                line = line_raw.strip()
+                if line.startswith("Opção") and current_option_lines:
+                    sugestoes.append(" ".join(current_option_lines).strip())
+                    current_option_lines = [line]
+                elif line: 
+                    current_option_lines.append(line)
+            if current_option_lines:
+                sugestoes.append(" ".join(current_option_lines).strip())
+
+            for sug_completa in sugestoes:
+                if "Opção" in sug_completa and ("- Contato Simulado:" in sug_completa or "- Contato:" in sug_completa):
+                    try:
+                        contato_marker = "- Contato Simulado:" if "- Contato Simulado:" in sug_completa else "- Contato:"
+                        partes_principais = sug_completa.split(contato_marker)
+                        contato_info = partes_principais[-1].strip() if len(partes_principais) > 1 else "Contato Misterioso"
+                        info_local = partes_principais[0]
+                        nome_local_match = info_local.split(": ", 1)
+                        if len(nome_local_match) > 1:
+                            nome_local_contato = nome_local_match[1].split(" - Justificativa:")[0].strip()
+                        else:
+                            nome_local_contato = "Local Desconhecido"
+                        contatos_simulados[nome_local_contato] = contato_info
+                    except Exception as e_parse:
+                        print(f"Erro ao parsear sugestão de local para contato: {sug_completa} - Erro: {e_parse}")
+            if not sugestoes:
+                sugestoes.append("O Agente de Localização está consultando o Google Maps da alma... por enquanto, que tal um piquenique no parque se o tempo ajudar (e se não tiver restrição a formigas)?")
+        except Exception as e:
+            st.error(f"O Agente de Localização se perdeu no caminho: {e}")
+            sugestoes.append("Deu pane no GPS do Agente de Localização. Sugestão: festa no metaverso? Lá todo mundo come pixel!")
+        return sugestoes, contatos_simulados
+    return ["Tipo de local não especificado claramente."], contatos_simulados
+
+def agregar_convidados(registros):
+    """Valida e normaliza os registros (lista ou leitor em streaming), depois conta confirmados e restrições.
+
+    Retorna um dict serializável para o cache compartilhado.
+    """
+    lista = validar_e_normalizar(registros, max_erros=MAX_ERROS_EXIBIDOS)
+    return {
+        "num_convidados": lista.num_confirmados,
+        "restricoes": lista.histograma_restricoes(),
+        "num_erros": lista.num_erros,
+        "erros": lista.erros,
+        "total_lido": lista.total_lido,
+    }
+
+def agente_convidados_dietas(usar_json, arquivo_json_carregado):
+    st.write("📋 **Agente de Convidados e Dietas na área:** De olho na lista VIP e nos 'não posso isso, não como aquilo'!")
+    sugestoes_tipo_comida_str = "Cardápio flexível é uma boa pedida!" # Default
+    
+    if usar_json and arquivo_json_carregado:
+        try:
+            # Aceita UploadedFile ou caminho; JSON, JSONL ou CSV, lidos em blocos (ver convidados.ler_registros)
+            # O agregado é compartilhado entre workers: a mesma lista só é parseada uma vez
+            chave_agregado = "convidados:" + hash_arquivo(arquivo_json_carregado)
+            agregado = single_flight(obter_cache(), chave_agregado,
+                                     lambda: agregar_convidados(ler_registros(arquivo_json_carregado)),
+                                     ttl=TTL_CACHE_CONVIDADOS)
+            num_convidados = agregado["num_convidados"]
+            restricoes = agregado["restricoes"]
+            st.session_state.event_data['erros_lista_convidados'] = (agregado["num_erros"], agregado["total_lido"], agregado["erros"])
+            
+            resumo_para_prompt = "Nenhuma específica"
+            if not restricoes:
+                resumo_detalhado_restricoes = "Aparentemente, todo mundo come de tudo! Ou esqueceram de avisar as frescurinhas... digo, restrições."
+            else:
+                lista_simples_restricoes = list(restricoes.keys())
+                if len(lista_simples_restricoes) > 3:
+                    resumo_para_prompt = ", ".join(lista_simples_restricoes[:3]) + " e outras."
+                else:
+                    resumo_para_prompt = ", ".join(lista_simples_restricoes)
+                
+                resumo_detalhado_restricoes = "Resumo das 'dietas especiais' da galera:\n" + \
+                                            "\n".join([f"- {tipo}: {qtd} pessoa(s)" for tipo, qtd in restricoes.items()])
+                
+                # Nova chamada ao Gemini para sugerir tipos de comida
+                try:
+                    prompt_comida = f"""
+                    Com base nas seguintes restrições alimentares de um grupo: {resumo_para_prompt}.
+                    Sugira 2-3 tipos de culinária ou conceitos de buffet que seriam adequados e inclusivos para este grupo.
+                    Por exemplo: 'Buffet com estações separadas para veganos e sem glúten', 'Cozinha Mediterrânea (rica em vegetais e opções leves)', 'Rodízio de Pizzas com opções sem glúten e veganas'.
+                    Seja breve e direto nas sugestões.
+                    """
+                    sugestoes_tipo_comida_str = chamar_agente_llm("dietas", prompt_comida, pronto=PRONTO_DIETAS).strip()
+                except Exception as e_comida:
+                    st.warning(f"Agente de Dietas teve um soluço ao sugerir comidas: {e_comida}")
+                    sugestoes_tipo_comida_str = PRONTO_DIETAS
+
+            return num_convidados, resumo_detalhado_restricoes, resumo_para_prompt, sugestoes_tipo_comida_str
+        except Exception as e:
+            st.error(f"Ih, deu chabú ao ler o arquivo dos convidados: {e}")
+            return 0, "Não consegui ler a lista de convidados. Verifica o arquivo, por favor!", "Erro na leitura", sugestoes_tipo_comida_str
+    elif usar_json: # Se usar_json é True, mas arquivo_json_carregado é None
+        return 0, "Você disse que ia usar a lista, mas cadê o arquivo, meu consagrado?", "JSON não carregado", sugestoes_tipo_comida_str
+    
+    # Caso de não usar JSON (entrada manual de público)
+    return None, "Número de pessoas a ser definido manualmente (restrições não analisadas).", "Entrada manual de público", sugestoes_tipo_comida_str
+
+def agente_orcamentista(valor_disponivel, num_pessoas, tema_final_escolhido=None, sugestoes_locais_com_contatos=None, custo_transporte=None):
+    st.write("💰 **Agente Orçamentista fazendo as contas:** Money que é good nós não have, mas vamos ver o que dá pra fazer!")
+    feedback_geral = ""
+    if valor_disponivel is None or valor_disponivel == 0:
+        feedback_geral = "Orçamento? Que orçamento? Estamos na base do 'fiado deluxe'?"
+    elif num_pessoas is None or num_pessoas == 0:
+        feedback_geral = "Sem saber quantas bocas pra alimentar (ou entreter), fica difícil pro Agente Orçamentista dar um pitaco preciso no custo por pessoa!"
+    else:
+        valor_para_festa = valor_disponivel - (custo_transporte or 0) # O ônibus sai do mesmo bolso que a coxinha
+        if custo_transporte:
+            feedback_geral = f"O transporte já leva R${custo_transporte:.2f} do orçamento, sobrando R${valor_para_festa:.2f} para o resto da festa. "
+        valor_por_pessoa = valor_para_festa / num_pessoas
+        if valor_por_pessoa <= 0:
+            feedback_geral += "Ou seja: o dinheiro acabou no estacionamento. Hora de rever a frota ou pedir reforço ao financeiro!"
+        elif valor_por_pessoa < 50:
+            feedback_geral += f"Com R${valor_por_pessoa:.2f} por cabeça... vai ser um evento 'raiz', com coxinha e guaraná Dolly! Delícia!"
+        elif valor_por_pessoa < 150:
+            feedback_geral += f"R${valor_por_pessoa:.2f} por pessoa? Já dá pra pensar num churrasquinho honesto, talvez até com farofa gourmet!"
+        else:
+            feedback_geral += f"Uau! R${valor_por_pessoa:.2f} por pessoa? Prepara o caviar e o champagne, porque essa festa promete ser um luxo só!"
+
+    if tema_final_escolhido and tema_final_escolhido != "(Nenhum tema específico / Estilo Livre)":
+        feedback_geral += f"\nLembre-se que um tema como '{tema_final_escolhido}' pode adicionar uns trocados extras no orçamento para decoração e mimos temáticos, hein?! Planeje com carinho (e com a calculadora na mão)."
+
+    feedback_locais = []
+    if sugestoes_locais_com_contatos and (num_pessoas or 0) > 0:
+        feedback_locais.append("\n**Análise de Custo para Locais Externos (Estimativa da POC):**")
+        for nome_local, contato_str in sugestoes_locais_com_contatos.items(): 
+            custo_simulado_por_pessoa = 0
+            # Simulação de custo baseada no nome do local (apenas para POC)
+            if isinstance(nome_local, str) and ("restaurante" in nome_local.lower() or "bistrô" in nome_local.lower() or "bar" in nome_local.lower()):
+                # Tenta obter custo de variável de ambiente, senão usa um default pseudo-aleatório
+                custo_simulado_por_pessoa = float(os.getenv(f"CUSTO_POC_{nome_local.upper().replace(' ','_')}", default=75 + len(nome_local) % 50)) 
+                custo_total_local = custo_simulado_por_pessoa * (num_pessoas or 1) # Garante que num_pessoas não seja None
+                feedback_locais.append(
+                    f"- **{nome_local}:** Estimativa POC de R${custo_simulado_por_pessoa:.2f}/pessoa. "
+                    f"Custo total estimado para {num_pessoas or 'X'} pessoas: R${custo_total_local:.2f}. Contato (simulado): {contato_str}"
+                )
+            else: # Para locais não classificados como restaurantes, não simula custo
+                feedback_locais.append(f"- **{nome_local}:** Custo a verificar (não parece ser um restaurante para cálculo automático de POC). Contato (simulado): {contato_str}")
+    
+    final_feedback = feedback_geral
+    if feedback_locais:
+        final_feedback += "\n" + "\n".join(feedback_locais)
+    return final_feedback
+
+def prompt_transporte(num_pessoas, local_evento_nome_curto, resumo_frota=None):
+    frota = f" A frota já está decidida: {resumo_frota}" if resumo_frota else ""
+    return f"""
+        Você é um especialista em logística de transporte para eventos corporativos.
+        Um evento externo com aproximadamente {num_pessoas} pessoas vai acontecer em '{local_evento_nome_curto}'.{frota}
+        Escreva 2-3 frases curtas e bem-humoradas anunciando a caravana aos participantes (sem recalcular veículos ou custos).
+        """
+
+def agente_transporte(num_pessoas, local_evento_str, precisa_transporte_flag, texto_llm=None, plano=None, com_humor=False):
+    """Frota calculada localmente (``transporte.planejar_transporte``); o LLM só entra para o comentário espirituoso."""
+    st.write("🚌 **Agente de Transporte engatando a primeira:** Levando a galera pro rolê!")
+    if not precisa_transporte_flag:
+        return "Transporte por conta da galera? Menos uma preocupação (ou mais uma, dependendo do trânsito!)."
+    
+    local_evento_nome_curto = local_evento_str
+    # Tenta extrair apenas o nome do local da string completa
+    if isinstance(local_evento_str, str) and "-" in local_evento_str:
+        try: 
+            local_evento_nome_curto = local_evento_str.split(" - Justificativa:")[0].split(": ",1)[1].strip()
+        except:
+            pass # Mantém local_evento_str original se o parsing falhar
+
+    if not local_evento_nome_curto or "Interno na Empresa" in local_evento_nome_curto: # Se for interno, não precisa de transporte
+        return "Festa em casa (na empresa), então cada um com seu teletransporte (ou carro mesmo)."
+
+    if num_pessoas is None or num_pessoas == 0:
+        return "Sem saber quanta gente vai, fica difícil chamar o Uber ou o ônibus espacial."
+
+    if plano is None:
+        plano = planejar_transporte(num_pessoas)
+    texto = f"**Frota mais barata para {num_pessoas} pessoas:** {plano.resumo()}"
+    if texto_llm is None and com_humor:
+        try:
+            texto_llm = chamar_agente_llm("transporte", prompt_transporte(num_pessoas, local_evento_nome_curto, plano.resumo()),
+                                         pronto="") # Modo econômico: a frota sai, a piada fica para a próxima
+        except Exception as e:
+            st.warning(f"O Agente de Transporte perdeu a piada no caminho ({e}), mas a frota está garantida.")
+    if texto_llm:
+        sugestoes_transporte = texto_llm.strip().split('\n')
+        texto += "\n\n" + "\n".join([s.replace("- ","").strip() for s in sugestoes_transporte if s.strip()])
+    return texto
@@ -0,0 +1,212 @@
+"""Distribuição dos convidados confirmados em mesas e estações de buffet, sem LLM.
+
+1. Estações: cada restrição pode ser atendida por alguns tipos de estação
+   (``ESTACOES_COMPATIVEIS``). Escolhemos os tipos por cobertura gulosa e
+   depois uma busca local move grupos de restrição entre os tipos escolhidos
+   enquanto o número total de estações (com ``capacidade_estacao`` porções
+   cada) diminuir.
+2. Mesas: quem come na mesma estação senta junto. Os grupos enchem mesas
+   inteiras; as sobras são empacotadas por first-fit decreasing e os
+   convidados sem restrição completam os lugares vazios.
+"""
+import csv
+import io
+import math
+import time
+from dataclasses import dataclass, field
+
+from convidados import ROTULO_SEM_RESTRICAO
+
+ESTACAO_PRINCIPAL = "Buffet Principal"
+
+# Rótulo canônico da restrição -> tipos de estação que a atendem (o primeiro é o mais específico)
+ESTACOES_COMPATIVEIS = {
+    "Vegano": ["Vegana"],
+    "Vegetariano": ["Vegetariana", "Vegana"],
+    "Sem lactose": ["Sem lactose", "Vegana"],
+    "Sem glúten": ["Sem glúten"],
+    "Kosher": ["Kosher"],
+    "Halal": ["Halal"],
+    "Diabético": ["Sem açúcar"],
+}
+
+
+def estacoes_para(rotulo):
+    """Tipos de estação que atendem a restrição; alergias e afins ganham estação própria."""
+    return ESTACOES_COMPATIVEIS.get(rotulo, [f"Especial: {rotulo}"])
+
+
+@dataclass
+class PlanoAlocacao:
+    mesas: list = field(default_factory=list) # [{"mesa": n, "convidados": [ids], "estacoes": {tipo: qtd}}]
+    estacoes: list = field(default_factory=list) # [{"estacao": nome, "tipo": tipo, "porcoes": {rotulo: qtd}}]
+    tipo_por_restricao: dict = field(default_factory=dict)
+    estacao_por_convidado: dict = field(default_factory=dict)
+    porcoes_principal: int = 0
+
+    @property
+    def num_estacoes_especiais(self):
+        return len(self.estacoes)
+
+
+def _num_estacoes(porcoes, capacidade_estacao):
+    return math.ceil(porcoes / capacidade_estacao) if porcoes else 0
+
+
+def escolher_estacoes(contagem_por_restricao, capacidade_estacao):
+    """{rótulo: qtd} -> {rótulo: tipo de estação}, minimizando o total de estações."""
+    descobertos = set(contagem_por_restricao)
+    escolhidos = []
+    # Cobertura gulosa: o tipo que atende mais grupos (e mais gente) ainda descobertos
+    while descobertos:
+        candidatos = {}
+        for rotulo in descobertos:
+            for tipo in estacoes_para(rotulo):
+                grupos, pessoas = candidatos.get(tipo, (0, 0))
+                candidatos[tipo] = (grupos + 1, pessoas + contagem_por_restricao[rotulo])
+        melhor = max(candidatos, key=lambda tipo: (candidatos[tipo], tipo))
+        escolhidos.append(melhor)
+        descobertos = {rotulo for rotulo in descobertos if melhor not in estacoes_para(rotulo)}
+
+    # Cada grupo começa no tipo escolhido mais específico que o atende
+    atribuicao = {}
+    for rotulo in contagem_por_restricao:
+        atribuicao[rotulo] = next(tipo for tipo in estacoes_para(rotulo) if tipo in escolhidos)
+
+    def custo(atrib):
+        porcoes = {}
+        for rotulo, tipo in atrib.items():
+            porcoes[tipo] = porcoes.get(tipo, 0) + contagem_por_restricao[rotulo]
+        return sum(_num_estacoes(p, capacidade_estacao) for p in porcoes.values()), len(porcoes)
+
+    # Busca local: move um grupo para outro tipo escolhido se isso reduzir estações (ou tipos)
+    melhorou = True
+    while melhorou:
+        melhorou = False
+        custo_atual = custo(atribuicao)
+        for rotulo in sorted(atribuicao, key=lambda r: contagem_por_restricao[r]):
+            for tipo in estacoes_para(rotulo):
+                if tipo == atribuicao[rotulo] or tipo not in escolhidos:
+                    continue
+                tentativa = dict(atribuicao, **{rotulo: tipo})
+                custo_tentativa = custo(tentativa)
+                if custo_tentativa < custo_atual:
+                    atribuicao, custo_atual, melhorou = tentativa, custo_tentativa, True
+    return atribuicao
+
+
+def alocar_mesas_e_estacoes(lista, capacidade_mesa=10, capacidade_estacao=80):
+    """Monta o plano de mesas e estações para os convidados confirmados de uma ``ListaConvidados``."""
+    if capacidade_mesa < 1 or capacidade_estacao < 1:
+        raise ValueError("capacidades de mesa e de estação precisam ser positivas")
+    plano = PlanoAlocacao()
+    grupos = {} # tipo de estação (ou ESTACAO_PRINCIPAL) -> [ids]
+    confirmados_por_restricao = {}
+    for i, (codigo, confirmado) in enumerate(zip(lista.restricoes, lista.confirmados)):
+        if confirmado:
+            confirmados_por_restricao.setdefault(codigo, []).append(i)
+
+    contagem = {lista.rotulos[c]: len(ids) for c, ids in confirmados_por_restricao.items() if c}
+    plano.tipo_por_restricao = escolher_estacoes(contagem, capacidade_estacao)
+    for codigo, ids in confirmados_por_restricao.items():
+        tipo = plano.tipo_por_restricao[lista.rotulos[codigo]] if codigo else ESTACAO_PRINCIPAL
+        grupos.setdefault(tipo, []).extend(ids)
+    regulares = grupos.pop(ESTACAO_PRINCIPAL, [])
+    plano.porcoes_principal = len(regulares)
+
+    # Mesas: grupos especiais primeiro (maiores antes), mesas inteiras e depois as sobras por FFD
+    mesas = []
+    sobras = []
+    for tipo, ids in sorted(grupos.items(), key=lambda item: -len(item[1])):
+        cheias = len(ids) // capacidade_mesa
+        for m in range(cheias):
+            mesas.append(ids[m * capacidade_mesa:(m + 1) * capacidade_mesa])
+        if len(ids) % capacidade_mesa:
+            sobras.append(ids[cheias * capacidade_mesa:])
+    mesas_parciais = []
+    for pedaco in sorted(sobras, key=len, reverse=True):
+        destino = next((mesa for mesa in mesas_parciais if len(mesa) + len(pedaco) <= capacidade_mesa), None)
+        if destino is None:
+            mesas_parciais.append(list(pedaco))
+        else:
+            destino.extend(pedaco)
+    # Convidados sem restrição completam as mesas parciais e depois ocupam mesas novas
+    pos = 0
+    for mesa in mesas_parciais:
+        vagas = capacidade_mesa - len(mesa)
+        mesa.extend(regulares[pos:pos + vagas])
+        pos += vagas
+    mesas.extend(mesas_parciais)
+    for inicio in range(pos, len(regulares), capacidade_mesa):
+        mesas.append(regulares[inicio:inicio + capacidade_mesa])
+
+    # Estações: instâncias de cada tipo preenchidas na ordem das mesas, até a capacidade
+    tipo_do_convidado = {}
+    for codigo, ids in confirmados_por_restricao.items():
+        if codigo:
+            tipo = plano.tipo_por_restricao[lista.rotulos[codigo]]
+            for i in ids:
+                tipo_do_convidado[i] = tipo
+    instancias = {} # tipo -> estação aberta no momento
+    for numero, ids in enumerate(mesas, start=1):
+        estacoes_mesa = {}
+        for i in ids:
+            tipo = tipo_do_convidado.get(i)
+            if tipo is None:
+                nome_estacao = ESTACAO_PRINCIPAL
+            else:
+                estacao = instancias.get(tipo)
+                if estacao is None or sum(estacao["porcoes"].values()) >= capacidade_estacao:
+                    total_tipo = sum(1 for e in plano.estacoes if e["tipo"] == tipo)
+                    estacao = {"estacao": f"{tipo} {total_tipo + 1}", "tipo": tipo, "porcoes": {}}
+                    plano.estacoes.append(estacao)
+                    instancias[tipo] = estacao
+                rotulo = lista.rotulos[lista.restricoes[i]]
+                estacao["porcoes"][rotulo] = estacao["porcoes"].get(rotulo, 0) + 1
+                nome_estacao = estacao["estacao"]
+            plano.estacao_por_convidado[i] = nome_estacao
+            estacoes_mesa[nome_estacao] = estacoes_mesa.get(nome_estacao, 0) + 1
+        plano.mesas.append({"mesa": numero, "convidados": ids, "estacoes": estacoes_mesa})
+    return plano
+
+
+def exportar_csv(plano, lista):
+    """CSV (separado por ';', como o Excel em português espera) com mesa e estação de cada convidado."""
+    saida = io.StringIO()
+    escritor = csv.writer(saida, delimiter=";")
+    escritor.writerow(["mesa", "nome", "email", "restricao_alimentar", "estacao"])
+    for mesa in plano.mesas:
+        for i in mesa["convidados"]:
+            escritor.writerow([mesa["mesa"], lista.nomes[i], lista.emails[i],
+                               lista.rotulos[lista.restricoes[i]], plano.estacao_por_convidado[i]])
+    return saida.getvalue()
+
+
+def resumo_estacoes(plano):
+    """Linhas prontas para tabela: uma por estação, com as porções por restrição."""
+    linhas = [{"Estação": ESTACAO_PRINCIPAL, "Porções": plano.porcoes_principal,
+               "Detalhe": f"{ROTULO_SEM_RESTRICAO}: {plano.porcoes_principal}"}] if plano.porcoes_principal else []
+    for estacao in plano.estacoes:
+        linhas.append({
+            "Estação": estacao["estacao"],
+            "Porções": sum(estacao["porcoes"].values()),
+            "Detalhe": ", ".join(f"{rotulo}: {qtd}" for rotulo, qtd in estacao["porcoes"].items()),
+        })
+    return linhas
+
+
+def benchmark_alocacao(n=10_000):
+    from convidados import gerar_registros_sinteticos, validar_e_normalizar
+    lista = validar_e_normalizar(gerar_registros_sinteticos(n))
+    inicio = time.perf_counter()
+    plano = alocar_mesas_e_estacoes(lista)
+    decorrido = time.perf_counter() - inicio
+    print(f"{lista.num_confirmados} confirmados em {len(plano.mesas)} mesas e "
+          f"{plano.num_estacoes_especiais} estações especiais, em {decorrido * 1000:.1f} ms")
+    for linha in resumo_estacoes(plano):
+        print(linha)
+    return decorrido
+
+
+if __name__ == "__main__":
+    benchmark_alocacao()
@@ -1,31 +1,52 @@
+import importlib
+import json
+import os
+
 import streamlit as st
-from data import EventData
-
-# Configuração da página principal
-descricao_app = "Seu copiloto para eventos corporativos inesquecíveis!"
-st.set_page_config(page_title="Festa IA", layout="wide")
-st.title(":tada: Planejador de Eventos IA")
-st.markdown(descricao_app)
-
-# Inicialização do estado do evento
-if "event" not in st.session_state:
-    st.session_state.event = EventData()
-
-# Navegação pelas etapas
-pages = ["1. Tipo e Objetivos", "2. Orçamento e Convidados", "3. Data e Local", "4. Resultado"]
-st.sidebar.title("🎉 Menu")
-selected_page = st.sidebar.radio("Etapas do Planejamento", pages)
-
-# Renderiza a página conforme seleção
-if selected_page == "1. Tipo e Objetivos":
-    import pages.1_tipo_objetivos as p1
-    p1.render()
-elif selected_page == "2. Orçamento e Convidados":
-    import pages.2_orcamento_pessoas as p2
-    p2.render()
-elif selected_page == "3. Data e Local":
-    import pages.3_data_local as p3
-    p3.render()
-elif selected_page == "4. Resultado":
-    import pages.4_resultado as p4
-    p4.render()
\ No newline at end of file
+
+from convidados import GUEST_LIST_FILE
+from etapas import inicializar_estado
+
+# Cada etapa do wizard é um módulo em etapas/, importado só quando a etapa é aberta.
+# Os agentes (e o google-generativeai) só são carregados na página de resultados.
+ETAPAS = {
+    1: "etapas.tipo_objetivos",
+    2: "etapas.orcamento_convidados",
+    3: "etapas.data_local",
+    4: "etapas.ajustes",
+    5: "etapas.resultado",
+}
+
+
+def create_mock_guest_list():
+    if not os.path.exists(GUEST_LIST_FILE):
+        mock_data = [
+            {"nome": "Carlos Alberto Nóbrega", "email": "carlos@empresa.com", "presenca_confirmada": True, "restricao_alimentar": "Vegetariano"},
+            {"nome": "Maria Joaquina de Amaral Pereira Góes", "email": "maria.j@empresa.com", "presenca_confirmada": True, "restricao_alimentar": "Sem glúten"},
+            {"nome": "João Kleber", "email": "joao.k@empresa.com", "presenca_confirmada": False, "restricao_alimentar": "Nenhuma"},
+            {"nome": "Fausto Silva", "email": "fausto@empresa.com", "presenca_confirmada": True, "restricao_alimentar": "Nenhuma"},
+            {"nome": "Silvio Santos", "email": "silvio@empresa.com", "presenca_confirmada": True, "restricao_alimentar": "Sem lactose"},
+            {"nome": "Hebe Camargo", "email": "hebe@empresa.com", "presenca_confirmada": True, "restricao_alimentar": "Alérgico a camarão"}
+        ]
+        with open(GUEST_LIST_FILE, 'w', encoding='utf-8') as f:
+            json.dump(mock_data, f, indent=2, ensure_ascii=False)
+        print(f"Arquivo {GUEST_LIST_FILE} de exemplo criado.")
+
+
+def main():
+    # Configuração da página principal
+    st.set_page_config(page_title="Planejador de Festas Malucas IA", layout="wide")
+    st.image("https://placehold.co/800x200/007bff/FFFFFF?text=Planejador+de+Festas+Corporativas+IA&font=sans-serif", use_container_width=True) # Imagem de placeholder
+    st.title("🎉 Planejador de Festas Corporativas IA 🎉")
+    st.subheader("Seu copiloto para eventos tão épicos que nem o chefe vai esquecer!")
+
+    create_mock_guest_list()
+    inicializar_estado()
+
+    # Renderiza a etapa atual (o import é cacheado pelo Python depois da primeira vez)
+    etapa = importlib.import_module(ETAPAS[st.session_state.page])
+    etapa.render()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""Cold start e rerun de cada etapa: app.py (etapas importadas sob demanda) x app1.py monolítico.
+
+Roda cada combinação (caminho, página) num processo novo:
+
+* cold start: importar e executar o script pela primeira vez, como o
+  Streamlit faz quando uma sessão abre;
+* rerun: executar o script de novo no mesmo processo (módulos já
+  importados), como acontece a cada clique.
+
+Fora do ``streamlit run`` não há servidor, então o ``streamlit`` é trocado
+por um substituto que devolve o valor padrão de cada widget e ignora o
+resto. O LLM também é falso (resposta instantânea): o que se mede é o custo
+do app, não o do Gemini. ``google-generativeai`` e ``python-dotenv`` só são
+substituídos se não estiverem instalados; quando estão, o custo real do
+import entra na conta.
+
+O app1.py antigo é lido do git, do último commit antes de ``etapas/`` existir.
+
+    python benchmark_app.py [--reruns 20]
+"""
+import argparse
+import functools
+import importlib.util
+import json
+import os
+import runpy
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import types
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+
+# --- Substitutos (só dentro do processo filho) ---
+class _RerunFalso(Exception):
+    pass
+
+
+class _StopFalso(Exception):
+    pass
+
+
+class _EstadoSessao(dict):
+    def __getattr__(self, nome):
+        try:
+            return self[nome]
+        except KeyError:
+            raise AttributeError(nome)
+
+    def __setattr__(self, nome, valor):
+        self[nome] = valor
+
+    def __delattr__(self, nome):
+        del self[nome]
+
+
+class _Bloco:
+    """Container falso (expander, coluna, spinner...): repassa tudo ao módulo e serve de ``with``."""
+
+    def __init__(self, modulo):
+        self._modulo = modulo
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __getattr__(self, nome):
+        return getattr(self._modulo, nome)
+
+
+class _StreamlitFalso(types.ModuleType):
+    def __init__(self):
+        super().__init__("streamlit")
+        self.session_state = _EstadoSessao()
+        self.secrets = {}
+
+    def __getattr__(self, nome): # Qualquer elemento sem valor de retorno: title, markdown, dataframe...
+        if nome.startswith("__"):
+            raise AttributeError(nome)
+        return lambda *args, **kwargs: _Bloco(self)
+
+    # Widgets: devolvem o valor padrão
+    def radio(self, label, options, index=0, **kwargs):
+        return list(options)[index] if index is not None else None
+
+    selectbox = radio
+
+    def multiselect(self, label, options, default=None, **kwargs):
+        return list(default or [])
+
+    def text_input(self, label, value="", **kwargs):
+        return value
+
+    text_area = text_input
+
+    def number_input(self, label, min_value=None, max_value=None, value=None, **kwargs):
+        return value if value is not None else (min_value or 0)
+
+    def slider(self, label, min_value=None, max_value=None, value=None, **kwargs):
+        return value if value is not None else min_value
+
+    def checkbox(self, label, value=False, **kwargs):
+        return value
+
+    toggle = checkbox
+
+    def date_input(self, label, value=None, **kwargs):
+        return value
+
+    def button(self, *args, **kwargs):
+        return False
+
+    download_button = form_submit_button = button
+
+    def file_uploader(self, *args, **kwargs):
+        return None
+
+    def columns(self, spec, **kwargs):
+        return [_Bloco(self) for _ in range(spec if isinstance(spec, int) else len(spec))]
+
+    def tabs(self, nomes):
+        return [_Bloco(self) for _ in nomes]
+
+    def rerun(self):
+        raise _RerunFalso()
+
+    def stop(self):
+        raise _StopFalso()
+
+    # Decoradores
+    def cache_resource(self, func=None, **kwargs):
+        if func is None:
+            return lambda f: functools.cache(f)
+        return functools.cache(func)
+
+    cache_data = cache_resource
+
+    def fragment(self, func=None, **kwargs):
+        return func if func is not None else (lambda f: f)
+
+
+def _instalar_substitutos():
+    st = _StreamlitFalso()
+    runtime = types.ModuleType("streamlit.runtime")
+    scriptrunner = types.ModuleType("streamlit.runtime.scriptrunner")
+    scriptrunner.get_script_run_ctx = lambda: None
+    st.runtime, runtime.scriptrunner = runtime, scriptrunner
+    sys.modules.update({"streamlit": st, "streamlit.runtime": runtime, "streamlit.runtime.scriptrunner": scriptrunner})
+    substituidos = ["streamlit"]
+
+    if importlib.util.find_spec("dotenv") is None:
+        dotenv = types.ModuleType("dotenv")
+        dotenv.load_dotenv = lambda *args, **kwargs: True
+        sys.modules["dotenv"] = dotenv
+        substituidos.append("python-dotenv")
+
+    try:
+        tem_genai = importlib.util.find_spec("google.generativeai") is not None
+    except ModuleNotFoundError:
+        tem_genai = False
+    if not tem_genai:
+        class _Resposta:
+            text = "Opção 1: Salão Genérico - Justificativa: cabe todo mundo - Contato Simulado: Zé\nLinha 2\nLinha 3"
+            usage_metadata = None
+
+        class _Modelo:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def generate_content(self, *args, **kwargs):
+                return _Resposta()
+
+        genai = types.ModuleType("google.generativeai")
+        genai.configure = lambda **kwargs: None
+        genai.GenerativeModel = _Modelo
+        google = sys.modules.get("google") or types.ModuleType("google")
+        google.generativeai = genai
+        sys.modules.update({"google": google, "google.generativeai": genai})
+        substituidos.append("google-generativeai")
+    else: # Instalado: o import é real, mas a geração continua falsa
+        import google.generativeai as genai
+        genai.GenerativeModel.generate_content = lambda self, *a, **k: types.SimpleNamespace(
+            text="Linha 1\nLinha 2\nLinha 3", usage_metadata=None)
+    os.environ.setdefault("GEMINI_API_KEY", "chave-falsa-do-benchmark")
+    return st, substituidos
+
+
+def _executar(script):
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except (_RerunFalso, _StopFalso):
+        pass
+
+
+def medir(script, pagina, reruns):
+    """Processo filho: cold start e reruns de ``script`` parado na ``pagina``."""
+    st, substituidos = _instalar_substitutos()
+    sys.path.insert(0, RAIZ)
+    st.session_state.page = pagina
+
+    inicio = time.perf_counter()
+    _executar(script)
+    cold = time.perf_counter() - inicio
+
+    tempos = []
+    for _ in range(reruns):
+        inicio = time.perf_counter()
+        _executar(script)
+        tempos.append(time.perf_counter() - inicio)
+    print(json.dumps({"cold_ms": cold * 1000, "rerun_ms": statistics.median(tempos) * 1000,
+                      "modulos": len(sys.modules), "substituidos": substituidos}))
+
+
+# --- Processo pai ---
+def extrair_app1_antigo(destino):
+    """app1.py do último commit antes de ``etapas/`` existir."""
+    primeiro = subprocess.run(["git", "rev-list", "--reverse", "HEAD", "--", "etapas/"], cwd=RAIZ,
+                              capture_output=True, text=True, check=True).stdout.split()[0]
+    codigo = subprocess.run(["git", "show", f"{primeiro}^:app1.py"], cwd=RAIZ,
+                            capture_output=True, text=True, check=True).stdout
+    with open(destino, "w", encoding="utf-8") as f:
+        f.write(codigo)
+    return destino
+
+
+def benchmark_app(reruns=20):
+    with tempfile.TemporaryDirectory() as tmp:
+        caminhos = {"app.py (etapas)": os.path.join(RAIZ, "app.py"),
+                    "app1.py antigo": extrair_app1_antigo(os.path.join(tmp, "app1_antigo.py"))}
+        print(f"{'caminho':<17} {'página':>6} {'cold start':>11} {'rerun':>9} {'módulos':>8}")
+        substituidos = []
+        for nome, script in caminhos.items():
+            for pagina in range(1, 6):
+                saida = subprocess.run([sys.executable, __file__, "--filho", script, "--pagina", str(pagina),
+                                        "--reruns", str(reruns)], cwd=RAIZ, capture_output=True, text=True)
+                linhas = [l for l in saida.stdout.splitlines() if l.startswith("{")]
+                if saida.returncode or not linhas:
+                    erro = (saida.stderr.strip().splitlines() or ["sem saída"])[-1]
+                    print(f"{nome:<17} {pagina:>6}  falhou: {erro}")
+                    continue
+                r = json.loads(linhas[-1])
+                substituidos = r["substituidos"]
+                print(f"{nome:<17} {pagina:>6} {r['cold_ms']:>9.1f}ms {r['rerun_ms']:>7.2f}ms {r['modulos']:>8}")
+        print(f"Substituídos neste ambiente: {', '.join(substituidos)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--filho", help=argparse.SUPPRESS)
+    parser.add_argument("--pagina", type=int, default=1, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.filho:
+        medir(args.filho, args.pagina, args.reruns)
+    else:
+        benchmark_app(args.reruns)
@@ -0,0 +1,219 @@
+"""Camada de cache e coordenação compartilhada entre processos.
+
+Tudo o que antes vivia só no ``st.session_state`` de um processo (respostas do
+LLM, travas, cota da API, agregados da lista de convidados) passa por aqui.
+Com ``REDIS_URL`` definido, vários workers no mesmo host se comportam como um
+único cache lógico; sem ele, usamos um cache local em memória.
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+
+class CotaExcedida(Exception):
+    """A cota global de chamadas à API foi esgotada e não liberou a tempo."""
+
+
+class CacheBackend:
+    """Interface comum dos backends de cache/coordenação."""
+
+    def get(self, chave):
+        raise NotImplementedError
+
+    def set(self, chave, valor, ttl=None):
+        raise NotImplementedError
+
+    def add(self, chave, valor, ttl=None):
+        """Grava só se a chave ainda não existir. Retorna True se gravou."""
+        raise NotImplementedError
+
+    def delete(self, chave):
+        raise NotImplementedError
+
+    def delete_se_igual(self, chave, valor):
+        """Apaga a chave só se ela ainda guardar ``valor``, numa operação atômica. Retorna True se apagou."""
+        raise NotImplementedError
+
+    def incr(self, chave, quantidade=1, ttl=None):
+        """Incrementa um contador; o ``ttl`` só vale quando a chave é criada."""
+        raise NotImplementedError
+
+    @contextmanager
+    def lock(self, nome, timeout=30, espera=30):
+        """Trava exclusiva entre workers. Lança TimeoutError se não conseguir."""
+        token = uuid.uuid4().hex
+        chave = f"lock:{nome}"
+        limite = time.monotonic() + espera
+        while not self.add(chave, token, ttl=timeout):
+            if time.monotonic() > limite:
+                raise TimeoutError(f"Não consegui a trava '{nome}' em {espera}s")
+            time.sleep(0.05)
+        try:
+            yield
+        finally:
+            self.delete_se_igual(chave, token) # Só libera a trava se ainda for nossa
+
+
+class CacheLocal(CacheBackend):
+    """Cache em memória, seguro para as threads de um único processo."""
+
+    def __init__(self):
+        self._dados = {}
+        self._mutex = threading.Lock()
+
+    def _vivo(self, chave):
+        item = self._dados.get(chave)
+        if item is None:
+            return None
+        valor, expira_em = item
+        if expira_em is not None and expira_em <= time.monotonic():
+            del self._dados[chave]
+            return None
+        return item
+
+    @staticmethod
+    def _expiracao(ttl):
+        return time.monotonic() + ttl if ttl else None
+
+    def get(self, chave):
+        with self._mutex:
+            item = self._vivo(chave)
+            return item[0] if item else None
+
+    def set(self, chave, valor, ttl=None):
+        with self._mutex:
+            self._dados[chave] = (valor, self._expiracao(ttl))
+
+    def add(self, chave, valor, ttl=None):
+        with self._mutex:
+            if self._vivo(chave):
+                return False
+            self._dados[chave] = (valor, self._expiracao(ttl))
+            return True
+
+    def delete(self, chave):
+        with self._mutex:
+            self._dados.pop(chave, None)
+
+    def delete_se_igual(self, chave, valor):
+        with self._mutex:
+            item = self._vivo(chave)
+            if item is None or item[0] != valor:
+                return False
+            del self._dados[chave]
+            return True
+
+    def incr(self, chave, quantidade=1, ttl=None):
+        with self._mutex:
+            item = self._vivo(chave)
+            if item:
+                novo = item[0] + quantidade
+                self._dados[chave] = (novo, item[1])
+            else:
+                novo = quantidade
+                self._dados[chave] = (novo, self._expiracao(ttl))
+            return novo
+
+
+class CacheRedis(CacheBackend):
+    """Backend para qualquer servidor que fale o protocolo Redis.
+
+    Recebe um cliente já construído (``redis.Redis``, ``fakeredis.FakeRedis``
+    ou equivalente), o que permite usar um substituto local sem servidor.
+    Os valores são gravados como JSON.
+    """
+
+    # GET e DEL separados deixariam a trava expirar e ser pega por outro worker no meio
+    SCRIPT_DELETE_SE_IGUAL = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+    def __init__(self, cliente, prefixo="festa_ia:"):
+        self.cliente = cliente
+        self.prefixo = prefixo
+
+    def _k(self, chave):
+        return self.prefixo + chave
+
+    @staticmethod
+    def _ms(ttl):
+        return int(ttl * 1000) if ttl else None
+
+    def get(self, chave):
+        bruto = self.cliente.get(self._k(chave))
+        return json.loads(bruto) if bruto is not None else None
+
+    def set(self, chave, valor, ttl=None):
+        self.cliente.set(self._k(chave), json.dumps(valor, ensure_ascii=False), px=self._ms(ttl))
+
+    def add(self, chave, valor, ttl=None):
+        return bool(self.cliente.set(self._k(chave), json.dumps(valor, ensure_ascii=False), px=self._ms(ttl), nx=True))
+
+    def delete(self, chave):
+        self.cliente.delete(self._k(chave))
+
+    def delete_se_igual(self, chave, valor):
+        valor_json = json.dumps(valor, ensure_ascii=False)
+        return bool(self.cliente.eval(self.SCRIPT_DELETE_SE_IGUAL, 1, self._k(chave), valor_json))
+
+    def incr(self, chave, quantidade=1, ttl=None):
+        k = self._k(chave)
+        novo = self.cliente.incrby(k, quantidade)
+        if ttl and novo == quantidade: # Chave acabou de nascer: define a expiração
+            self.cliente.pexpire(k, self._ms(ttl))
+        return novo
+
+
+def criar_cache(url=None):
+    """Escolhe o backend: Redis se houver ``REDIS_URL``, senão cache local."""
+    url = url or os.getenv("REDIS_URL")
+    if not url:
+        return CacheLocal()
+    try:
+        import redis
+    except ImportError:
+        print("REDIS_URL definido, mas o pacote 'redis' não está instalado. Usando cache local.")
+        return CacheLocal()
+    return CacheRedis(redis.Redis.from_url(url))
+
+
+def single_flight(cache, chave, calcular, ttl=None, espera=60):
+    """Devolve ``cache[chave]`` ou calcula uma única vez entre todos os workers.
+
+    Quem chega enquanto outro worker calcula espera a trava e reaproveita o
+    resultado, em vez de disparar a mesma chamada cara de novo.
+    """
+    valor = cache.get(chave)
+    if valor is not None:
+        return valor
+    with cache.lock(f"sf:{chave}", timeout=espera, espera=espera):
+        valor = cache.get(chave)
+        if valor is None:
+            valor = calcular()
+            if valor is not None:
+                cache.set(chave, valor, ttl=ttl)
+    return valor
+
+
+def consumir_cota(cache, balde, limite, janela=60, espera_max=30):
+    """Consome uma unidade da cota global ``limite`` por ``janela`` segundos.
+
+    Janela fixa com contador compartilhado: todos os workers somam no mesmo
+    balde. Se a cota estourar, espera a próxima janela até ``espera_max``.
+    """
+    limite_espera = time.monotonic() + espera_max
+    while True:
+        inicio_janela = int(time.time() // janela)
+        usados = cache.incr(f"cota:{balde}:{inicio_janela}", ttl=janela * 2)
+        if usados <= limite:
+            return usados
+        restante = (inicio_janela + 1) * janela - time.time()
+        if time.monotonic() + restante > limite_espera:
+            raise CotaExcedida(f"Cota de {limite} chamadas/{janela}s esgotada para '{balde}'.")
+        time.sleep(max(restante, 0.05))
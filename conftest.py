@@ -0,0 +1 @@
+# Deixa os testes importarem os módulos da raiz (cache.py, convidados.py...) com `pytest` puro.
@@ -0,0 +1,484 @@
+"""Ingestão da lista de convidados: validação, normalização e deduplicação.
+
+Tudo numa passada só sobre os registros. O resultado é um ``ListaConvidados``
+em formato colunar (listas paralelas + códigos de restrição), bem mais leve
+que a lista de dicts original e pronto para histogramas e prompts.
+"""
+import codecs
+import csv
+import hashlib
+import io
+import json
+import os
+import random
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+ROTULO_SEM_RESTRICAO = "Nenhuma"
+
+# Chave normalizada (minúsculas, sem acento, espaços colapsados) -> rótulo canônico.
+# None significa "sem restrição".
+SINONIMOS_RESTRICAO = {
+    "": None, "-": None, "n/a": None, "na": None, "nao": None, "nenhum": None, "nenhuma": None,
+    "sem restricao": None, "sem restricoes": None, "nada": None, "none": None,
+    "vegetariano": "Vegetariano", "vegetariana": "Vegetariano", "ovolactovegetariano": "Vegetariano",
+    "vegano": "Vegano", "vegana": "Vegano", "vegan": "Vegano",
+    "sem gluten": "Sem glúten", "gluten free": "Sem glúten", "celiaco": "Sem glúten", "celiaca": "Sem glúten",
+    "intolerante a gluten": "Sem glúten", "intolerancia a gluten": "Sem glúten",
+    "sem lactose": "Sem lactose", "lactose free": "Sem lactose", "intolerante a lactose": "Sem lactose",
+    "intolerancia a lactose": "Sem lactose",
+    "kosher": "Kosher", "halal": "Halal",
+    "diabetico": "Diabético", "diabetica": "Diabético", "sem acucar": "Diabético",
+}
+
+VALORES_VERDADEIROS = {"true", "sim", "s", "yes", "y", "1", "x", "confirmado", "confirmada"}
+VALORES_FALSOS = {"false", "nao", "não", "n", "no", "0", "", "pendente"}
+
+# Extensão -> formato. Sem extensão conhecida, o formato é farejado no conteúdo.
+FORMATOS_POR_EXTENSAO = {".json": "json", ".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+TAMANHO_BLOCO = 64 * 1024
+
+
+def normalizar_chave(texto):
+    """Minúsculas, sem acentos e com espaços colapsados: 'Sem Glúten ' -> 'sem gluten'."""
+    sem_acento = unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode("ascii")
+    return " ".join(sem_acento.lower().split())
+
+
+def normalizar_restricao(texto):
+    """Rótulo canônico de uma restrição, ou None se for 'sem restrição'."""
+    chave = normalizar_chave(texto)
+    if chave in SINONIMOS_RESTRICAO:
+        return SINONIMOS_RESTRICAO[chave]
+    texto = " ".join(texto.split())
+    return texto[:1].upper() + texto[1:]
+
+
+class ErroValidacao(ValueError):
+    pass
+
+
+@dataclass
+class ListaConvidados:
+    """Lista de convidados normalizada, em colunas paralelas."""
+    nomes: list = field(default_factory=list)
+    emails: list = field(default_factory=list)
+    confirmados: bytearray = field(default_factory=bytearray)
+    restricoes: array = field(default_factory=lambda: array("I")) # Índices em ``rotulos`` (0 = sem restrição); "H" estouraria em 65.535 rótulos
+    rotulos: list = field(default_factory=lambda: [ROTULO_SEM_RESTRICAO])
+    erros: list = field(default_factory=list) # ("linha N" ou "registro N", mensagem), limitado a ``max_erros``
+    num_erros: int = 0
+    total_lido: int = 0
+
+    def __len__(self):
+        return len(self.emails)
+
+    @property
+    def num_confirmados(self):
+        return self.confirmados.count(1)
+
+    def histograma_restricoes(self, somente_confirmados=True):
+        """{rótulo: quantidade}, sem a categoria 'Nenhuma', do mais comum ao menos comum."""
+        contagem = [0] * len(self.rotulos)
+        if somente_confirmados:
+            for codigo, confirmado in zip(self.restricoes, self.confirmados):
+                if confirmado:
+                    contagem[codigo] += 1
+        else:
+            for codigo in self.restricoes:
+                contagem[codigo] += 1
+        pares = [(self.rotulos[c], n) for c, n in enumerate(contagem) if c and n]
+        return dict(sorted(pares, key=lambda par: -par[1]))
+
+    def registro(self, i):
+        return {
+            "nome": self.nomes[i],
+            "email": self.emails[i],
+            "presenca_confirmada": bool(self.confirmados[i]),
+            "restricao_alimentar": self.rotulos[self.restricoes[i]],
+        }
+
+
+def _booleano(valor):
+    if isinstance(valor, bool):
+        return valor
+    if isinstance(valor, int) and valor in (0, 1):
+        return bool(valor)
+    if isinstance(valor, str):
+        texto = valor.strip().lower()
+        if texto in VALORES_VERDADEIROS:
+            return True
+        if texto in VALORES_FALSOS:
+            return False
+    raise ErroValidacao(f"'presenca_confirmada' inválido: {valor!r}")
+
+
+def validar_e_normalizar(registros, max_erros=1000):
+    """Valida, normaliza e deduplica (por email) os registros numa única passada.
+
+    Aceita qualquer iterável de dicts, então funciona tanto com a lista já
+    carregada quanto com leitores em streaming. Registros com erro são
+    descartados e reportados em ``erros`` como ``(onde, motivo)``: "linha N"
+    do arquivo quando o leitor sabe (``ler_registros`` com CSV ou JSON Lines),
+    senão "registro N" (1 = primeiro registro).
+    """
+    lista = ListaConvidados()
+    codigo_por_rotulo = {ROTULO_SEM_RESTRICAO: 0}
+    linha_por_email = {}
+    rotulo_por_texto = {} # Os mesmos textos se repetem muito: normaliza cada um uma vez só
+    rotulo_por_chave = {}
+    nomes_append, emails_append = lista.nomes.append, lista.emails.append
+    confirmados_append, restricoes_append = lista.confirmados.append, lista.restricoes.append
+
+    com_linhas = isinstance(registros, RegistrosArquivo)
+
+    def onde(posicao):
+        return f"{'linha' if com_linhas and registros.linha is not None else 'registro'} {posicao}"
+
+    numero = 0
+    for numero, registro in enumerate(registros, start=1):
+        linha = (registros.linha or numero) if com_linhas else numero
+        try:
+            if isinstance(registro, ErroValidacao): # Linha que o leitor não conseguiu nem decodificar
+                raise registro
+            if not isinstance(registro, dict):
+                raise ErroValidacao("registro não é um objeto com campos")
+            nome = registro.get("nome")
+            if not isinstance(nome, str) or not nome.strip():
+                raise ErroValidacao("campo 'nome' ausente ou vazio")
+            email = registro.get("email")
+            if not isinstance(email, str) or "@" not in email:
+                raise ErroValidacao(f"campo 'email' inválido: {email!r}")
+            email = email.strip().lower()
+            if "presenca_confirmada" not in registro:
+                raise ErroValidacao("campo 'presenca_confirmada' ausente")
+            confirmado = _booleano(registro["presenca_confirmada"])
+            restricao = registro.get("restricao_alimentar")
+            if restricao is None:
+                rotulo = None
+            elif isinstance(restricao, str):
+                rotulo = rotulo_por_texto.get(restricao, "")
+                if rotulo == "":
+                    # Grafias diferentes fora da tabela de sinônimos ficam com o primeiro rótulo visto
+                    rotulo = rotulo_por_chave.setdefault(normalizar_chave(restricao), normalizar_restricao(restricao))
+                    rotulo_por_texto[restricao] = rotulo
+            else:
+                raise ErroValidacao(f"'restricao_alimentar' deveria ser texto: {restricao!r}")
+            if email in linha_por_email:
+                raise ErroValidacao(f"email duplicado (primeira ocorrência: {onde(linha_por_email[email])})")
+        except ErroValidacao as e:
+            lista.num_erros += 1
+            if len(lista.erros) < max_erros:
+                lista.erros.append((onde(linha), str(e)))
+            continue
+
+        linha_por_email[email] = linha
+        if rotulo is None:
+            codigo = 0
+        else:
+            codigo = codigo_por_rotulo.get(rotulo)
+            if codigo is None:
+                codigo = codigo_por_rotulo[rotulo] = len(lista.rotulos)
+                lista.rotulos.append(rotulo)
+        nomes_append(" ".join(nome.split()))
+        emails_append(email)
+        confirmados_append(1 if confirmado else 0)
+        restricoes_append(codigo)
+
+    lista.total_lido = numero
+    return lista
+
+
+class IndiceConvidados:
+    """Índices em memória sobre uma ``ListaConvidados``, construídos uma vez por upload.
+
+    - prefixo do nome (nome completo e cada palavra) e do email, normalizados:
+      arrays ordenados + busca binária;
+    - invertidos por restrição e por status de confirmação.
+
+    As buscas combinadas (prefixo e/ou dois filtros) são preguiçosas e nunca
+    olham mais que ``LIMITE_VARREDURA`` candidatos, por mais esparso que seja o
+    filtro ou funda a página: o custo não cresce com o tamanho da lista. Ao
+    bater no limite, o total vira uma estimativa "N+" e páginas além dos
+    candidatos vistos voltam vazias (hora de refinar a busca).
+    """
+    LIMITE_VARREDURA = 10_000
+
+    def __init__(self, lista):
+        self.lista = lista
+        pares_nome = []
+        chave_por_palavra = {} # Nomes repetem muito as mesmas palavras: normaliza cada uma uma vez só
+        por_restricao = {}
+        por_confirmacao = {True: array("I"), False: array("I")}
+        for i, (nome, codigo, confirmado) in enumerate(zip(lista.nomes, lista.restricoes, lista.confirmados)):
+            palavras = []
+            for palavra in nome.split():
+                chave_palavra = chave_por_palavra.get(palavra)
+                if chave_palavra is None:
+                    chave_palavra = chave_por_palavra[palavra] = normalizar_chave(palavra)
+                palavras.append(chave_palavra)
+            pares_nome.append((" ".join(palavras), i))
+            for palavra in set(palavras[1:]): # A primeira palavra já é prefixo do nome completo
+                pares_nome.append((palavra, i))
+            por_restricao.setdefault(codigo, array("I")).append(i)
+            por_confirmacao[bool(confirmado)].append(i)
+        pares_nome.sort()
+        self._chaves_nome = [chave for chave, _ in pares_nome]
+        self._ids_nome = array("I", (i for _, i in pares_nome))
+        ordem_email = sorted(range(len(lista.emails)), key=lista.emails.__getitem__)
+        self._chaves_email = [lista.emails[i] for i in ordem_email]
+        self._ids_email = array("I", ordem_email)
+        self.por_restricao = por_restricao
+        self.por_confirmacao = por_confirmacao
+
+    @staticmethod
+    def _faixa(chaves, ids, prefixo):
+        inicio = bisect_left(chaves, prefixo)
+        fim = bisect_left(chaves, prefixo + "\uffff", lo=inicio)
+        for k in range(inicio, fim):
+            yield ids[k]
+
+    def _por_prefixo(self, prefixo):
+        vistos = set() # O mesmo convidado pode casar pelo nome completo, por outra palavra e pelo email
+        for faixa in (self._faixa(self._chaves_nome, self._ids_nome, prefixo),
+                      self._faixa(self._chaves_email, self._ids_email, prefixo)):
+            for i in faixa:
+                if i not in vistos:
+                    vistos.add(i)
+                    yield i
+
+    def buscar(self, consulta="", restricao=None, confirmado=None, pagina=0, por_pagina=20):
+        """Busca por prefixo de nome/email com filtros opcionais.
+
+        ``restricao`` é um rótulo canônico (ex.: 'Sem glúten') ou 'Nenhuma';
+        ``confirmado`` é True, False ou None (todos). Retorna
+        ``(ids_da_pagina, total, total_exato)``.
+        """
+        lista = self.lista
+        codigo = None
+        if restricao is not None:
+            if restricao not in lista.rotulos:
+                return [], 0, True
+            codigo = lista.rotulos.index(restricao)
+        inicio, fim = pagina * por_pagina, (pagina + 1) * por_pagina
+
+        prefixo = normalizar_chave(consulta or "")
+        if not prefixo and not (codigo is not None and confirmado is not None):
+            # Um índice só responde sozinho: fatia direta, total exato
+            if codigo is not None:
+                base = self.por_restricao.get(codigo, array("I"))
+            elif confirmado is not None:
+                base = self.por_confirmacao[confirmado]
+            else:
+                base = range(len(lista))
+            return list(base[inicio:fim]), len(base), True
+
+        if prefixo:
+            candidatos = self._por_prefixo(prefixo)
+            precisa_restricao, precisa_confirmacao = codigo is not None, confirmado is not None
+        else:
+            # Restrição + confirmação: percorre a lista invertida menor e confere o outro campo
+            base_restricao = self.por_restricao.get(codigo, array("I"))
+            base_confirmacao = self.por_confirmacao[confirmado]
+            if len(base_restricao) <= len(base_confirmacao):
+                candidatos, precisa_restricao, precisa_confirmacao = iter(base_restricao), False, True
+            else:
+                candidatos, precisa_restricao, precisa_confirmacao = iter(base_confirmacao), True, False
+
+        restricoes, confirmados = lista.restricoes, lista.confirmados
+        ids_pagina, total, varridos = [], 0, 0
+        for i in candidatos:
+            varridos += 1
+            if (not precisa_restricao or restricoes[i] == codigo) and \
+               (not precisa_confirmacao or bool(confirmados[i]) == confirmado):
+                if inicio <= total < fim:
+                    ids_pagina.append(i)
+                total += 1
+            if varridos >= self.LIMITE_VARREDURA:
+                return ids_pagina, total, False
+        return ids_pagina, total, True
+
+
+def detectar_formato(buffer, nome=None):
+    """'json', 'jsonl' ou 'csv', pela extensão do nome ou pelo primeiro caractere útil."""
+    extensao = os.path.splitext(nome or "")[1].lower()
+    if extensao in FORMATOS_POR_EXTENSAO:
+        return FORMATOS_POR_EXTENSAO[extensao]
+    posicao = buffer.tell()
+    amostra = buffer.read(TAMANHO_BLOCO)
+    buffer.seek(posicao)
+    inicio = amostra.lstrip(b"\xef\xbb\xbf \t\r\n")[:1]
+    if inicio == b"[":
+        return "json"
+    if inicio == b"{":
+        return "jsonl"
+    return "csv"
+
+
+def detectar_codificacao(buffer):
+    """'utf-8-sig' se o começo do arquivo é UTF-8 (com ou sem BOM); senão 'cp1252', do Excel e do RH em PT-BR."""
+    posicao = buffer.tell()
+    amostra = buffer.read(TAMANHO_BLOCO)
+    buffer.seek(posicao)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(amostra, final=False) # Acento cortado no fim do bloco não conta
+    except UnicodeDecodeError:
+        return "cp1252"
+    return "utf-8-sig"
+
+
+# Os leitores anotam em ``posicao.linha`` a linha do arquivo onde termina o registro que vão entregar
+# (JSON de lista única não tem linha por registro)
+def _ler_csv(texto, posicao):
+    amostra = texto.read(TAMANHO_BLOCO)
+    texto.seek(0)
+    try:
+        dialeto = csv.Sniffer().sniff(amostra, delimiters=",;\t") # Exportações do Excel em PT costumam usar ';'
+    except csv.Error:
+        dialeto = csv.excel
+    leitor = csv.DictReader(texto, dialect=dialeto)
+    leitor.fieldnames = [(campo or "").strip() for campo in (leitor.fieldnames or [])]
+    for registro in leitor:
+        restricao = registro.get("restricao_alimentar")
+        if restricao is not None and not restricao.strip():
+            registro["restricao_alimentar"] = None
+        posicao.linha = leitor.line_num
+        yield registro
+
+
+def _ler_jsonl(texto, posicao):
+    for numero, linha in enumerate(texto, start=1):
+        if not linha.strip():
+            continue
+        posicao.linha = numero
+        try:
+            yield json.loads(linha)
+        except json.JSONDecodeError as e:
+            yield ErroValidacao(f"JSON inválido: {e.msg}")
+
+
+def _ler_json(texto, posicao):
+    dados = json.load(texto)
+    if not isinstance(dados, list):
+        raise ValueError("o arquivo JSON deveria conter uma lista de convidados")
+    yield from dados
+
+
+LEITORES = {"csv": _ler_csv, "jsonl": _ler_jsonl, "json": _ler_json}
+# Arquivo que não dá nem para percorrer: JSON que não é lista ou está truncado
+# (JSONDecodeError), texto em outra codificação (UnicodeDecodeError), CSV quebrado
+ERROS_LEITURA = (ValueError, csv.Error)
+
+
+class RegistrosArquivo:
+    """Registros de um arquivo (ver ``ler_registros``); ``linha`` é a linha do arquivo do último entregue."""
+
+    def __init__(self, arquivo, nome=None, formato=None):
+        self.arquivo, self.nome, self.formato = arquivo, nome, formato
+        self.linha = None
+
+    def __iter__(self):
+        return self._registros(self.arquivo, self.nome)
+
+    def _registros(self, arquivo, nome):
+        if isinstance(arquivo, (str, os.PathLike)):
+            with open(arquivo, "rb") as buffer:
+                yield from self._registros(buffer, nome or os.fspath(arquivo))
+            return
+        nome = nome or getattr(arquivo, "name", None)
+        arquivo.seek(0)
+        formato = self.formato or detectar_formato(arquivo, nome)
+        texto = io.TextIOWrapper(arquivo, encoding=detectar_codificacao(arquivo), newline="")
+        try:
+            yield from LEITORES[formato](texto, self)
+        finally:
+            texto.detach() # Não fecha o buffer de quem chamou
+            arquivo.seek(0)
+
+
+def ler_registros(arquivo, nome=None, formato=None):
+    """Registros de um arquivo JSON, JSON Lines ou CSV, lidos sem carregá-lo inteiro.
+
+    ``arquivo`` pode ser um caminho ou um buffer binário (como o ``UploadedFile``
+    do Streamlit); o buffer é lido em blocos e devolvido com o ponteiro no início.
+    CSV e JSONL são processados linha a linha; JSON (uma lista única) precisa
+    ser decodificado de uma vez. A codificação é UTF-8 (com ou sem BOM) ou,
+    se o começo do arquivo não for UTF-8, cp1252.
+    """
+    return RegistrosArquivo(arquivo, nome, formato)
+
+
+def hash_arquivo(arquivo):
+    """SHA-256 do conteúdo, lido em blocos (chave de cache da lista)."""
+    digest = hashlib.sha256()
+    if isinstance(arquivo, (str, os.PathLike)):
+        with open(arquivo, "rb") as buffer:
+            for bloco in iter(lambda: buffer.read(TAMANHO_BLOCO), b""):
+                digest.update(bloco)
+        return digest.hexdigest()
+    arquivo.seek(0)
+    for bloco in iter(lambda: arquivo.read(TAMANHO_BLOCO), b""):
+        digest.update(bloco)
+    arquivo.seek(0)
+    return digest.hexdigest()
+
+
+# Simulação do banco de dados de convidados (arquivo JSON de exemplo)
+GUEST_LIST_FILE = "lista_convidados_poc.json" # Criado por app.create_mock_guest_list
+
+
+def gerar_registros_sinteticos(n, semente=42):
+    """Registros falsos (com ruído de caixa, acento e espaços) para benchmarks."""
+    rng = random.Random(semente)
+    primeiros = ["Ana", "Bruno", "Carla", "Diego", "Eduarda", "Fábio", "Gabriela", "Heitor", "Isabela", "João",
+                 "Karina", "Lucas", "Mariana", "Nícolas", "Otávio", "Paula", "Rafael", "Sofia", "Tiago", "Vitória"]
+    sobrenomes = ["Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves", "Pereira", "Lima",
+                  "Gomes", "Costa", "Ribeiro", "Martins", "Carvalho", "Almeida", "Lopes", "Soares", "Araújo"]
+    restricoes = ["Nenhuma", "nenhuma", "", "Vegetariano", "vegetariana ", "Sem glúten", "sem gluten",
+                  "Sem Glúten ", "Vegano", "Sem lactose", "intolerante a lactose", "Alérgico a camarão"]
+    for i in range(n):
+        yield {
+            "nome": f"{rng.choice(primeiros)} {rng.choice(sobrenomes)} {rng.choice(sobrenomes)}",
+            "email": f"pessoa{i}@empresa.com",
+            "presenca_confirmada": rng.random() < 0.8,
+            "restricao_alimentar": rng.choice(restricoes),
+        }
+
+
+def benchmark_ingestao(n=1_000_000):
+    registros = list(gerar_registros_sinteticos(n))
+    inicio = time.perf_counter()
+    lista = validar_e_normalizar(registros)
+    decorrido = time.perf_counter() - inicio
+    print(f"{n} registros em {decorrido:.2f}s ({n / decorrido:,.0f} registros/s); "
+          f"{lista.num_confirmados} confirmados, {lista.num_erros} erros")
+    print(f"Histograma: {lista.histograma_restricoes()}")
+    return decorrido
+
+
+def benchmark_busca(n=1_000_000, repeticoes=200):
+    lista = validar_e_normalizar(gerar_registros_sinteticos(n))
+    inicio = time.perf_counter()
+    indice = IndiceConvidados(lista)
+    print(f"Índice de {n} convidados construído em {time.perf_counter() - inicio:.2f}s")
+    consultas = [
+        {"consulta": "mari"},
+        {"consulta": "pessoa12345"},
+        {"consulta": "silva", "restricao": "Vegano", "confirmado": True},
+        {"consulta": "", "restricao": "Sem glúten", "confirmado": False, "pagina": 3},
+        {"consulta": "", "confirmado": True, "pagina": 100},
+    ]
+    for filtros in consultas:
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            ids, total, exato = indice.buscar(**filtros)
+        media_ms = (time.perf_counter() - inicio) / repeticoes * 1000
+        print(f"{filtros}: {len(ids)} na página, total {total}{'' if exato else '+'}, {media_ms:.3f} ms/busca")
+
+
+if __name__ == "__main__":
+    benchmark_ingestao()
+    benchmark_busca()
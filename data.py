@@ -0,0 +1,92 @@
+"""Estado do evento em planejamento, compartilhado entre as etapas do wizard."""
+import datetime
+from dataclasses import dataclass, field, fields
+from typing import Any, Optional
+
+
+@dataclass
+class EventData:
+    """Tudo o que o organizador informou e o que os agentes calcularam.
+
+    Mantém a interface de dict que as páginas já usavam (``get``, ``[]``,
+    ``in``, ``del``). Um campo em ``None`` conta como "não preenchido": o
+    ``get`` devolve o default e o ``in`` responde False. Chaves fora do
+    esquema dão ``KeyError``, para pegar erros de digitação cedo.
+    """
+    # Página 1: tipo, nome e objetivos
+    tipo_evento: Optional[str] = None
+    nome_evento_input: Optional[str] = None
+    ajuda_nome: bool = False
+    objetivos_selecionados: list = field(default_factory=list)
+    objetivos_personalizados: list = field(default_factory=list)
+
+    # Página 2: orçamento e convidados
+    valor_disponivel: Optional[float] = None
+    fonte_convidados_raw: Optional[str] = None # "manual" ou "json" (qualquer lista carregada)
+    quantidade_pessoas_manual: Optional[int] = None
+    arquivo_json_obj: Any = None # UploadedFile da lista de presença
+
+    # Página 3: tema, data e local
+    festa_tematica: Optional[str] = None
+    festa_tematica_raw: Optional[str] = None # "Sim" ou "Não"
+    ideia_tema: Optional[str] = None
+    data_prevista: Optional[datetime.date] = None
+    data_prevista_dt: Optional[datetime.date] = None
+    tipo_local_desejado: Optional[str] = None
+    local_interno_especifico: Optional[str] = None
+    local_externo_tipo_pref: Optional[str] = None
+    local_externo_tipo_pref_idx: Optional[int] = None
+    evento_agendado_id: Optional[str] = None # Reserva na agenda compartilhada (agenda.py)
+    conflito_agenda_aceito: Optional[tuple] = None # (local, data) em que o organizador topou dividir o espaço
+
+    # Página 4: ajustes finais
+    usar_feedback_passado: bool = False
+    precisa_transporte: bool = False
+    pontos_embarque_raw: Optional[str] = None # Uma linha por ponto: "Nome: pessoas"
+    transporte_com_humor: bool = False # Pede ao LLM um comentário sobre a frota (a frota em si é calculada localmente)
+    chamada_combinada: bool = False
+
+    # Página 5: resultados dos agentes e escolhas finais
+    num_convidados_final_calculado: Optional[int] = None
+    resumo_restricoes_final_calculado: Optional[str] = None
+    resumo_restricoes_para_prompt_final: Optional[str] = None
+    sugestoes_comida_final: Optional[str] = None
+    erros_lista_convidados: Optional[tuple] = None # (num_erros, total_lido, [("linha N", motivo), ...])
+    num_mesas_final: Optional[int] = None
+    estacoes_buffet_final: Optional[list] = None # Linhas de alocacao.resumo_estacoes
+    nome_evento_escolhido: Optional[str] = None
+    nome_evento_escolhido_selectbox_raw: Optional[str] = None
+    nome_evento_digitado_final: Optional[str] = None
+    tema_final_escolhido: Optional[str] = None
+    tema_digitado_final: Optional[str] = None
+    sugestoes_locais_finais: Optional[list] = None
+    contatos_locais_finais: Optional[dict] = None
+
+    def _checar(self, chave):
+        if chave not in self.__dataclass_fields__:
+            raise KeyError(f"EventData não tem o campo '{chave}'")
+
+    def get(self, chave, default=None):
+        self._checar(chave)
+        valor = getattr(self, chave)
+        return default if valor is None else valor
+
+    def __getitem__(self, chave):
+        self._checar(chave)
+        return getattr(self, chave)
+
+    def __setitem__(self, chave, valor):
+        self._checar(chave)
+        setattr(self, chave, valor)
+
+    def __delitem__(self, chave):
+        self._checar(chave)
+        setattr(self, chave, None)
+
+    def __contains__(self, chave):
+        return chave in self.__dataclass_fields__ and getattr(self, chave) is not None
+
+    def to_dict(self):
+        """Campos preenchidos, sem o arquivo carregado (que não é serializável)."""
+        return {f.name: getattr(self, f.name) for f in fields(self)
+                if f.name != "arquivo_json_obj" and getattr(self, f.name) is not None}
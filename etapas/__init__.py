@@ -0,0 +1,145 @@
+"""Etapas do wizard. Cada módulo expõe ``render()`` e é importado só quando a etapa é aberta."""
+import os
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from admissao import CLASSE_BARATA, CLASSE_NORMAL, ControleAdmissao
+from agenda import AgendaLocais
+from cache import criar_cache
+from convidados import ERROS_LEITURA, IndiceConvidados, hash_arquivo, ler_registros, validar_e_normalizar
+from data import EventData
+
+# Caches da página de resultados: cada seção só recalcula quando as próprias entradas mudam
+CACHES_RESULTADOS = (
+    'sugestoes_nomes_cache', 'sugestoes_temas_cache', 'conceito_video_cache',
+    'respostas_combinadas_cache', # Chamada combinada (otimizador, batizador, transporte)
+    'dicas_otimizador_cache', 'resultado_dietas_cache', 'localizacao_cache', 'transporte_cache',
+    'alocacao_cache', # Plano de mesas e estações de buffet
+    'tema_das_secoes', # Tema com que local/orçamento/transporte foram renderizados
+    'admissao_plano', # "completo" ou "economico", decidido pelo controle de admissão
+    'baloes_exibidos',
+)
+
+
+def inicializar_estado():
+    """Controle do wizard (estado da sessão)."""
+    if 'page' not in st.session_state:
+        st.session_state.page = 1
+    if 'event_data' not in st.session_state:
+        st.session_state.event_data = EventData()
+    if 'objetivo_custom_temp_input' not in st.session_state:
+        st.session_state.objetivo_custom_temp_input = ""
+    for nome_cache in CACHES_RESULTADOS:
+        if nome_cache not in st.session_state:
+            st.session_state[nome_cache] = None
+
+
+def limpar_caches_resultados():
+    for nome_cache in CACHES_RESULTADOS:
+        st.session_state[nome_cache] = None
+
+
+def next_page():
+    st.session_state.page += 1
+    st.rerun()
+
+
+def prev_page():
+    st.session_state.page -= 1
+    st.rerun()
+
+
+def identidade_arquivo(arquivo):
+    """Chave barata para "é o mesmo arquivo?": sem ler o conteúdo, que pode ter centenas de MB.
+
+    Upload do Streamlit: ``file_id`` (novo a cada upload) ou nome + tamanho.
+    Caminho no disco: caminho + data de modificação + tamanho. Só o que não
+    se encaixa em nenhum dos dois cai no hash do conteúdo.
+    """
+    if getattr(arquivo, "file_id", None):
+        return ("upload", arquivo.file_id)
+    if getattr(arquivo, "name", None) and getattr(arquivo, "size", None) is not None:
+        return ("upload", arquivo.name, arquivo.size)
+    if isinstance(arquivo, (str, os.PathLike)):
+        info = os.stat(arquivo)
+        return ("caminho", os.path.abspath(arquivo), info.st_mtime_ns, info.st_size)
+    return ("conteudo", hash_arquivo(arquivo))
+
+
+def obter_lista_convidados(arquivo):
+    """Lista normalizada, lida uma vez por arquivo carregado (cache na sessão).
+
+    Roda a cada tecla na busca da página 2, então a checagem do cache não pode ler o arquivo.
+    Arquivo ilegível lança um dos ``ERROS_LEITURA``; a falha também fica no cache, para o
+    mesmo arquivo quebrado não ser lido de novo a cada rerun.
+    """
+    assinatura = identidade_arquivo(arquivo)
+    cache = st.session_state.get('lista_convidados_cache')
+    if cache is None or cache[0] != assinatura:
+        try:
+            with st.spinner("Lendo a lista de convidados..."):
+                lista = validar_e_normalizar(ler_registros(arquivo))
+        except ERROS_LEITURA as e:
+            lista = e
+        st.session_state.lista_convidados_cache = cache = (assinatura, lista)
+    if isinstance(cache[1], Exception):
+        raise cache[1]
+    return cache[1]
+
+
+def obter_indice_convidados(arquivo):
+    """Índice de busca da página 2 sobre a lista (só ela precisa dos prefixos ordenados, o passo caro)."""
+    lista = obter_lista_convidados(arquivo)
+    indice = st.session_state.get('indice_convidados_cache')
+    if indice is None or indice.lista is not lista:
+        with st.spinner("Indexando a lista de convidados..."):
+            st.session_state.indice_convidados_cache = indice = IndiceConvidados(lista)
+    return indice
+
+
+@st.cache_resource
+def obter_agenda():
+    """Agenda dos espaços, uma por processo; as reservas de outros workers chegam pelo arquivo."""
+    return AgendaLocais(cache=criar_cache())
+
+
+def reservar_local_evento():
+    """Grava (ou move) a reserva do espaço interno do evento. Lança ValueError se alguém chegou antes.
+
+    Se o organizador já topou dividir o espaço na página 3 (para este local e
+    esta data), a reserva sai mesmo com conflito.
+    """
+    data = st.session_state.event_data
+    agenda = obter_agenda()
+    id_atual = data.get('evento_agendado_id')
+    if data.get('tipo_local_desejado') != "Interno na Empresa" or not data.get('data_prevista'):
+        if id_atual: # Saiu do espaço interno: devolve a sala para a galera
+            agenda.cancelar(id_atual)
+            data['evento_agendado_id'] = None
+        return
+    local, dia = data.get('local_interno_especifico'), data.get('data_prevista')
+    reserva = agenda.eventos.get(id_atual)
+    if reserva and reserva["local"] == local and reserva["inicio"] == dia.toordinal():
+        return # Nada mudou desde a última geração do plano
+    nome = data.get('nome_evento_escolhido') or data.get('nome_evento_input') or data.get('tipo_evento')
+    aceitar_conflito = data.get('conflito_agenda_aceito') == (local, dia)
+    data['evento_agendado_id'] = agenda.reservar(local, dia, nome, substituir_id=id_atual,
+                                                 aceitar_conflito=aceitar_conflito)
+
+
+@st.cache_resource
+def obter_controle_admissao():
+    """Fila de geração de planos, compartilhada por todas as sessões do processo."""
+    return ControleAdmissao(vagas=int(os.getenv("PLANOS_SIMULTANEOS", "4")),
+                            max_fila=int(os.getenv("FILA_PLANOS_MAX", "20")))
+
+
+def id_sessao():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else "anonimo"
+
+
+def classe_do_plano(data):
+    """Local interno dispensa o Agente de Localização no LLM: plano barato, passa na frente."""
+    return CLASSE_BARATA if data.get('tipo_local_desejado') == "Interno na Empresa" else CLASSE_NORMAL
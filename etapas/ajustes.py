@@ -0,0 +1,57 @@
+"""Página 4: melhorias, transporte e considerações finais."""
+import streamlit as st
+
+from etapas import limpar_caches_resultados, prev_page, reservar_local_evento
+
+
+def render():
+    st.header("Página 4: Ajustes finos e a logística da galera!")
+    st.session_state.event_data['usar_feedback_passado'] = st.checkbox(
+        "Usar a sabedoria das pesquisas de satisfação passadas para turbinar este evento?",
+        value=st.session_state.event_data.get('usar_feedback_passado', False), key="check_feedback_pg4"
+    )
+    if st.session_state.event_data.get('tipo_local_desejado') == "Externo":
+        st.subheader("🚌 E a Caravana da Alegria? (Transporte)")
+        precisa_transporte_escolha = st.radio(
+            "Vamos precisar organizar um esquema de transporte para a galera chegar no local externo?",
+            ("Sim, por favor!", "Não, cada um por si (e a sorte por todos!)"),
+            index=1 if not st.session_state.event_data.get('precisa_transporte', False) else 0, # Default para Não
+            key="radio_transporte_pg4"
+        )
+        st.session_state.event_data['precisa_transporte'] = (precisa_transporte_escolha == "Sim, por favor!")
+        if st.session_state.event_data['precisa_transporte']:
+            st.session_state.event_data['pontos_embarque_raw'] = st.text_area(
+                "Pontos de embarque (opcional, um por linha no formato 'Nome: pessoas'):",
+                value=st.session_state.event_data.get('pontos_embarque_raw', ''), key="pontos_embarque_pg4",
+                placeholder="Sede Paulista: 80\nFilial Campinas: 25",
+                help="Quem não estiver em nenhum ponto embarca num ponto extra. Sem pontos, todo mundo sai do mesmo lugar."
+            )
+            st.session_state.event_data['transporte_com_humor'] = st.checkbox(
+                "Quero também um anúncio espirituoso da caravana (chama a IA; a frota e o custo são calculados na hora)",
+                value=st.session_state.event_data.get('transporte_com_humor', False), key="check_humor_transporte_pg4"
+            )
+    else: # Se o local for interno, não precisa de transporte
+        st.session_state.event_data['precisa_transporte'] = False
+        st.info("Como o evento é interno, a questão do transporte para o local não se aplica aqui.")
+
+    st.session_state.event_data['chamada_combinada'] = st.checkbox(
+        "Modo turbo: juntar os agentes mais simples (dicas, nomes e transporte) numa única chamada à IA",
+        value=st.session_state.event_data.get('chamada_combinada', False), key="check_chamada_combinada_pg4",
+        help="Menos idas e vindas ao Gemini. Se a resposta combinada vier torta, cada agente é chamado separadamente."
+    )
+
+    st.markdown("---")
+    st.subheader("Tudo pronto para o Orquestrador e seus Agentes entrarem em ação?")
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("⏪ Voltar (Detalhes, Data e Local)", on_click=prev_page, key="btn_voltar_4_final_new"): pass 
+    with col2:
+        if st.button("🥁 Gerar Plano Mestre da Festa! 🥁", type="primary", key="btn_gerar_plano_final"):
+            try:
+                reservar_local_evento() # Garante o espaço na agenda compartilhada antes de planejar o resto
+            except (ValueError, TimeoutError) as e:
+                st.error(f"Alguém foi mais rápido na reserva: {e}. Volte à página anterior e escolha outra data ou espaço.")
+            else:
+                st.session_state.page = 5
+                limpar_caches_resultados() # Limpar caches da página de resultados antes de regerar
+                st.rerun()
@@ -0,0 +1,143 @@
+"""Página 3: detalhes da confraternização, data e local."""
+import datetime
+
+import streamlit as st
+
+from etapas import next_page, obter_agenda, prev_page
+
+
+def usar_data_livre(dia):
+    st.session_state.data_prevista_pg3_new = dia # Callback: roda antes do date_input ser desenhado de novo
+    st.session_state.event_data['data_prevista_dt'] = dia
+    st.session_state.conflito_agenda_pg3 = None
+
+
+def checar_agenda(data):
+    """(conflitos, datas livres sugeridas) para o espaço interno escolhido; listas vazias se estiver livre."""
+    if data.get('tipo_local_desejado') != "Interno na Empresa":
+        return [], []
+    agenda = obter_agenda()
+    agenda.atualizar() # Pega as reservas que outros organizadores fizeram enquanto este preenchia o wizard
+    local, dia = data.get('local_interno_especifico'), data.get('data_prevista')
+    conflitos = agenda.conflitos(local, dia, ignorar_id=data.get('evento_agendado_id'))
+    if not conflitos:
+        return [], []
+    return conflitos, agenda.datas_livres_proximas(local, dia, ignorar_id=data.get('evento_agendado_id'))
+
+
+def render():
+    st.header("Página 3: Temperando a festa, definindo data e onde será o agito!") 
+    if st.session_state.event_data.get('tipo_evento') == "Confraternização":
+        st.markdown("Para confras: Vai ter fantasia ou a galera vai de 'look do dia corporativo'?")
+        festa_tematica_escolha = st.radio(
+            "Essa balada vai ser temática ou é cada um no seu estilo?",
+            ("Sim, vai ser temática!", "Não, estilo livre!"),
+            index=0 if st.session_state.event_data.get('festa_tematica_raw', "Sim") == "Sim" else 1,
+            key="radio_festa_tematica_pg3_new"
+        )
+        st.session_state.event_data['festa_tematica'] = festa_tematica_escolha # Salva a string completa
+        st.session_state.event_data['festa_tematica_raw'] = "Sim" if festa_tematica_escolha == "Sim, vai ser temática!" else "Não" # Salva 'Sim' ou 'Não'
+        if st.session_state.event_data['festa_tematica_raw'] == "Sim":
+            st.session_state.event_data['ideia_tema'] = st.text_input(
+                "Qual o tema da bagunça? (Opcional, deixe em branco se quiser sugestões da IA)",
+                value=st.session_state.event_data.get('ideia_tema', ''), key="ideia_tema_pg3_new",
+                placeholder="Ex: Anos 80, Baile de Máscaras, Hollywood..."
+            )
+        # else: # Se não for temática, não precisa limpar 'ideia_tema', pode ser útil se o usuário mudar de ideia
+        #    st.session_state.event_data['ideia_tema'] = ''
+    else: # Para outros tipos de evento, tema é opcional mas pode ser adicionado
+        st.info(f"Como é um evento de '{st.session_state.event_data.get('tipo_evento')}', a temática é opcional. Se quiser adicionar um tema, pode fazê-lo abaixo.")
+        st.session_state.event_data['festa_tematica_raw'] = st.radio(
+             "Gostaria de adicionar um tema a este evento?",
+            ("Sim", "Não"), index=1, key="radio_tema_opcional_pg3", horizontal=True
+        )
+        if st.session_state.event_data['festa_tematica_raw'] == "Sim":
+            st.session_state.event_data['ideia_tema'] = st.text_input(
+                "Qual seria o tema? (Opcional)",
+                value=st.session_state.event_data.get('ideia_tema', ''), key="ideia_tema_opcional_pg3",
+                placeholder="Ex: Inovação Futura, Conexões Estratégicas..."
+            )
+        else:
+             st.session_state.event_data['ideia_tema'] = ''
+
+
+    # Garantir que data_prevista_dt exista antes de usá-la como default
+    if 'data_prevista_dt' not in st.session_state.event_data or st.session_state.event_data['data_prevista_dt'] is None:
+        st.session_state.event_data['data_prevista_dt'] = datetime.date.today() + datetime.timedelta(days=30)
+    
+    # O valor do widget vem só da sessão (semeada aqui ao voltar à página, trocada por usar_data_livre):
+    # passar value= junto faz o Streamlit reclamar de valor padrão definido também pela Session State API
+    if 'data_prevista_pg3_new' not in st.session_state:
+        st.session_state.data_prevista_pg3_new = st.session_state.event_data['data_prevista_dt']
+
+    st.session_state.event_data['data_prevista'] = st.date_input( # Este será o objeto date retornado pelo date_input
+        "E quando vai rolar esse regabofe/aprendizado intensivo?", 
+        min_value=datetime.date.today(), # Não permitir datas passadas
+        key="data_prevista_pg3_new"
+    )
+    st.session_state.event_data['data_prevista_dt'] = st.session_state.event_data['data_prevista'] # Atualiza dt com o valor do input
+
+    st.subheader("📍 Onde vai ser o ponto de encontro dessa galera animada?")
+    tipo_local_opcoes = ["Interno na Empresa", "Externo"]
+    st.session_state.event_data['tipo_local_desejado'] = st.radio(
+        "O evento será dentro da empresa ou vamos explorar novos horizontes?", tipo_local_opcoes,
+        index=0 if st.session_state.event_data.get('tipo_local_desejado', tipo_local_opcoes[0]) == tipo_local_opcoes[0] else 1,
+        key="tipo_local_pg3_new"
+    )
+    if st.session_state.event_data['tipo_local_desejado'] == "Interno na Empresa":
+        locais_internos_opcoes = ["Auditório Principal", "Área de Lazer/Descompressão", "Refeitório (adaptado)", "Pátio/Área Externa da Empresa", "Outro Espaço Interno"]
+        st.session_state.event_data['local_interno_especifico'] = st.selectbox(
+            "Qual cantinho da firma vamos usar?", locais_internos_opcoes,
+            index=locais_internos_opcoes.index(st.session_state.event_data.get('local_interno_especifico', locais_internos_opcoes[0])),
+            key="local_interno_sel_pg3_new"
+        )
+        # Limpar preferências de local externo se interno for escolhido
+        if 'local_externo_tipo_pref' in st.session_state.event_data:
+            st.session_state.event_data['local_externo_tipo_pref'] = None
+    else: # Externo
+        st.session_state.event_data['local_externo_tipo_pref'] = st.selectbox(
+            "Que tipo de local externo te agrada mais?",
+            ["Restaurante/Bar com área reservada", "Salão de Festas", "Chácara/Sítio", "Espaço de Eventos Corporativos", "Outro tipo externo"],
+            index=st.session_state.event_data.get('local_externo_tipo_pref_idx', 0), # Salvar/restaurar índice
+            key="local_externo_sel_pg3_new"
+        )
+        # Salvar o índice para restaurar a seleção se o usuário voltar
+        st.session_state.event_data['local_externo_tipo_pref_idx'] = ["Restaurante/Bar com área reservada", "Salão de Festas", "Chácara/Sítio", "Espaço de Eventos Corporativos", "Outro tipo externo"].index(st.session_state.event_data['local_externo_tipo_pref'])
+        
+        if "Restaurante" in st.session_state.event_data['local_externo_tipo_pref'] and st.session_state.event_data.get('festa_tematica_raw') == "Sim":
+            st.info(f"Boa! O Agente de Localização vai tentar achar restaurantes que combinem com o tema '{st.session_state.event_data.get('ideia_tema', '(a ser sugerido)')}'!")
+        # Limpar local interno específico se externo for escolhido
+        if 'local_interno_especifico' in st.session_state.event_data:
+            st.session_state.event_data['local_interno_especifico'] = None
+
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("⏪ Voltar (Orçamento e Público)", on_click=prev_page, key="btn_voltar_3_final_new"): pass 
+    with col2:
+        if st.button("Próximo Passo: Ajustes Finais ✨", key="btn_prox_3_final_new"):
+            conflitos, sugestoes = checar_agenda(st.session_state.event_data)
+            local_e_data = (st.session_state.event_data.get('local_interno_especifico'),
+                            st.session_state.event_data.get('data_prevista'))
+            if not conflitos or st.session_state.event_data.get('conflito_agenda_aceito') == local_e_data:
+                st.session_state.conflito_agenda_pg3 = None
+                next_page()
+            st.session_state.conflito_agenda_pg3 = (*local_e_data, conflitos, sugestoes)
+
+    # Conflito de agenda: só vale enquanto local e data forem os mesmos da checagem
+    conflito = st.session_state.get('conflito_agenda_pg3')
+    if conflito and conflito[:2] == (st.session_state.event_data.get('local_interno_especifico'), st.session_state.event_data.get('data_prevista')):
+        local, dia, conflitos, sugestoes = conflito
+        nomes = ", ".join(f"'{c.get('nome') or 'Evento sem nome'}'" for c in conflitos)
+        st.error(f"Eita! O espaço '{local}' já está reservado em {dia.strftime('%d/%m/%Y')} para {nomes}. Duas festas no mesmo auditório vira congresso!")
+        if sugestoes:
+            st.markdown("**Datas livres mais próximas:**")
+            for i, livre in enumerate(sugestoes):
+                st.button(f"📅 Usar {livre.strftime('%d/%m/%Y')}", key=f"btn_data_livre_pg3_{i}",
+                          on_click=usar_data_livre, args=(livre,))
+        else:
+            st.info("Nenhuma data livre neste espaço no próximo ano. Que tal outro cantinho da firma?")
+        if st.button("Seguir assim mesmo (a gente se entende com o outro organizador)", key="btn_ignorar_conflito_pg3"):
+            st.session_state.event_data['conflito_agenda_aceito'] = (local, dia) # Trocou local ou data, perde o aceite
+            st.session_state.conflito_agenda_pg3 = None
+            next_page()
@@ -0,0 +1,95 @@
+"""Página 2: orçamento e público."""
+import streamlit as st
+
+from convidados import ERROS_LEITURA, GUEST_LIST_FILE
+from etapas import next_page, obter_indice_convidados, prev_page
+
+CONVIDADOS_POR_PAGINA = 25
+
+
+@st.fragment
+def busca_convidados(arquivo):
+    """Busca por nome/email e filtros sobre a lista carregada; reroda só esta seção."""
+    try:
+        indice = obter_indice_convidados(arquivo)
+    except ERROS_LEITURA as e:
+        st.error(f"Não consegui ler esse arquivo ({e}). Confere se é uma lista de convidados em JSON, "
+                 "JSON Lines ou CSV e carrega de novo, por favor!")
+        return
+    lista = indice.lista
+    with st.expander(f"🔎 Procurar na lista ({len(lista)} convidados, {lista.num_confirmados} confirmados)"):
+        col_busca, col_restricao, col_status = st.columns([0.5, 0.25, 0.25])
+        with col_busca:
+            consulta = st.text_input("Nome ou email (começo)", key="busca_convidados_pg2", placeholder="Ex: maria, joao.k@")
+        with col_restricao:
+            restricao = st.selectbox("Restrição alimentar", ["(Todas)"] + lista.rotulos, key="filtro_restricao_pg2")
+        with col_status:
+            status = st.selectbox("Presença", ["(Todos)", "Confirmados", "Não confirmados"], key="filtro_presenca_pg2")
+        filtros = {
+            "consulta": consulta,
+            "restricao": None if restricao == "(Todas)" else restricao,
+            "confirmado": {"Confirmados": True, "Não confirmados": False}.get(status),
+        }
+        # Voltar para a primeira página sempre que a busca mudar
+        if st.session_state.get('filtros_busca_convidados') != filtros:
+            st.session_state.filtros_busca_convidados = filtros
+            st.session_state.pagina_busca_pg2 = 1
+        pagina = st.number_input("Página", min_value=1, step=1, key="pagina_busca_pg2")
+        ids, total, exato = indice.buscar(pagina=pagina - 1, por_pagina=CONVIDADOS_POR_PAGINA, **filtros)
+        st.caption(f"{total}{'' if exato else '+'} convidado(s) encontrado(s).")
+        if ids:
+            st.dataframe([lista.registro(i) for i in ids], use_container_width=True, hide_index=True)
+        elif not exato:
+            st.write("Essa página ficou além do que a busca rápida alcança. Digite mais letras do nome ou email para afunilar!")
+        else:
+            st.write("Ninguém por aqui com esses filtros.")
+
+
+def render():
+    st.header("Página 2: Money, money, money... e a galera!") 
+    st.session_state.event_data['valor_disponivel'] = st.number_input(
+        "Quanto tem na carteira pra esse festerê? (Valor em R$)", min_value=0.0,
+        value=st.session_state.event_data.get('valor_disponivel', 0.0), step=100.0, format="%.2f", key="valor_disp_pg2_new"
+    )
+    st.subheader("E o público, como vai ser?")
+    fonte_convidados_escolha = st.radio(
+        "Como vamos saber quem vem?",
+        ("Informar quantidade manualmente", "Usar lista de presença (arquivo JSON, JSONL ou CSV)"),
+        index=0 if st.session_state.event_data.get('fonte_convidados_raw', "manual") == "manual" else 1,
+        key="radio_fonte_convidados_pg2_new"
+    )
+    st.session_state.event_data['fonte_convidados_raw'] = "manual" if fonte_convidados_escolha == "Informar quantidade manualmente" else "json"
+
+    if st.session_state.event_data['fonte_convidados_raw'] == "manual":
+        st.session_state.event_data['quantidade_pessoas_manual'] = st.number_input(
+            "Quantas almas (estimadas) participarão?", min_value=1,
+            value=st.session_state.event_data.get('quantidade_pessoas_manual', 10), step=1, key="qtd_manual_pg2_new"
+        )
+        # Limpar dados de JSON se o manual for escolhido
+        if 'arquivo_json_obj' in st.session_state.event_data:
+            st.session_state.event_data['arquivo_json_obj'] = None
+    else:
+        st.markdown(f"Ok, vamos de lista! Pode ser JSON (uma lista), JSON Lines (um convidado por linha) ou CSV (exportação do RH, com `,` ou `;`). Certifique-se que ele tem os campos: `nome`, `email`, `presenca_confirmada` (true/false, sim/não), `restricao_alimentar`.\nUm arquivo de exemplo (`{GUEST_LIST_FILE}`) já está na área!")
+        if 'uploader_key_count' not in st.session_state: # Para resetar o uploader se necessário
+            st.session_state.uploader_key_count = 0
+        
+        arquivo_json_carregado = st.file_uploader(
+            "Carregue o arquivo da lista de presença:", 
+            type=['json', 'jsonl', 'ndjson', 'csv'], 
+            key=f"uploader_convidados_pg2_new_{st.session_state.uploader_key_count}" # Chave dinâmica para permitir re-upload
+            )
+        st.session_state.event_data['arquivo_json_obj'] = arquivo_json_carregado # Salva o objeto do arquivo
+        if arquivo_json_carregado:
+            st.success(f"Arquivo '{arquivo_json_carregado.name}' carregado!")
+            busca_convidados(arquivo_json_carregado)
+        else: st.warning("Esperando o arquivo dos convidados...")
+        # Limpar dados manuais se JSON for escolhido
+        if 'quantidade_pessoas_manual' in st.session_state.event_data:
+            st.session_state.event_data['quantidade_pessoas_manual'] = None
+
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("⏪ Voltar (Tipo de Evento)", on_click=prev_page, key="btn_voltar_2_final_new"): pass 
+    with col2:
+        if st.button("Próximo Passo: Detalhes, Data e Local 🗓️📍", on_click=next_page, key="btn_prox_2_final_new"): pass 
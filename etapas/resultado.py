@@ -0,0 +1,472 @@
+"""Página 5: orquestração dos agentes e o plano mestre."""
+import datetime
+from contextlib import contextmanager
+
+import streamlit as st
+
+from agentes import (
+    agente_batizador_eventos, agente_chamada_combinada, agente_convidados_dietas, agente_localizacao,
+    agente_orcamentista, agente_otimizador_festas, agente_sugestao_tema_com_restricoes, agente_transporte,
+    prompt_batizador_eventos, prompt_otimizador_festas, prompt_transporte, relatorio_niveis,
+)
+from admissao import CLASSE_BARATA, modo_economico
+from alocacao import alocar_mesas_e_estacoes, exportar_csv, resumo_estacoes
+from convidados import ERROS_LEITURA, GUEST_LIST_FILE
+from data import EventData
+from etapas import (
+    classe_do_plano, id_sessao, limpar_caches_resultados, obter_controle_admissao, obter_lista_convidados,
+)
+from transporte import ler_pontos_embarque, planejar_transporte
+
+# Cada seção do plano é um st.fragment: mexer no seletor de nome ou de tema reroda só aquela
+# seção, sem refazer os expanders, os balões e o resumo. As seções sem widgets (local,
+# orçamento, transporte) guardam o resultado na sessão e só recalculam se as entradas mudarem.
+
+ESPERA_MAX_FILA = 45 # Segundos na fila antes de servir o plano em modo econômico
+
+@contextmanager
+def secao_com_llm():
+    """Envolve cada chamada de agente feita por uma seção: respeita o que a fila decidiu para o plano.
+
+    Na primeira execução a seção já está dentro da vaga (ou do modo econômico)
+    do plano e nada muda. Num rerun de fragmento (trocar o tema, por exemplo),
+    plano econômico continua econômico e plano completo volta à fila, como
+    pedido barato, antes de chamar o LLM.
+    """
+    if st.session_state.admissao_plano == "economico":
+        with modo_economico():
+            yield
+    else:
+        with obter_controle_admissao().vaga(id_sessao(), CLASSE_BARATA, ESPERA_MAX_FILA, medir=False):
+            yield
+
+@st.fragment
+def fragmento_nome_evento(data, objetivos_para_prompt_str, respostas_combinadas):
+    nome_final_evento = data.get('nome_evento_input', "Evento Surpresa") 
+    if data.get('ajuda_nome') and not data.get('nome_evento_input'): # Se pediu ajuda E não digitou nome
+        if st.session_state.sugestoes_nomes_cache is None: 
+            with st.spinner("Agente Batizador quebrando a cabeça para os nomes..."), secao_com_llm():
+                st.session_state.sugestoes_nomes_cache = agente_batizador_eventos(
+                    data.get('tipo_evento'), objetivos_para_prompt_str, respostas_combinadas.get('batizador')
+                )
+
+        if st.session_state.sugestoes_nomes_cache and st.session_state.sugestoes_nomes_cache[0] != "Erro ao gerar nomes. Que tal 'Festa Surpresa do Chefe Que Não Sabe'?":
+            opcoes_nomes = ["(Digitar meu próprio nome)"] + st.session_state.sugestoes_nomes_cache
+            default_nome_index = 0
+            # Restaurar escolha anterior se existir
+            nome_ja_escolhido_ou_digitado = st.session_state.event_data.get('nome_evento_escolhido') or st.session_state.event_data.get('nome_evento_digitado_final')
+            if nome_ja_escolhido_ou_digitado:
+                if nome_ja_escolhido_ou_digitado in opcoes_nomes: default_nome_index = opcoes_nomes.index(nome_ja_escolhido_ou_digitado)
+                elif st.session_state.event_data.get('nome_evento_escolhido_selectbox_raw') == "(Digitar meu próprio nome)": default_nome_index = 0
+
+            nome_escolhido_select = st.selectbox(
+                "O Agente Batizador sugere (escolha um ou digite o seu abaixo):",
+                options=opcoes_nomes, index=default_nome_index, key="select_nome_evento_final"
+            )
+            st.session_state.event_data['nome_evento_escolhido_selectbox_raw'] = nome_escolhido_select # Salva a escolha do selectbox
+            if nome_escolhido_select == "(Digitar meu próprio nome)":
+                nome_final_evento = st.text_input("Então, qual vai ser o nome?", 
+                                                value=st.session_state.event_data.get('nome_evento_digitado_final', nome_final_evento), # Usa o valor já digitado se houver
+                                                key="input_nome_final_evento")
+                st.session_state.event_data['nome_evento_digitado_final'] = nome_final_evento # Salva o nome digitado
+            else:
+                nome_final_evento = nome_escolhido_select
+                if 'nome_evento_digitado_final' in st.session_state.event_data: # Limpa se uma sugestão foi escolhida
+                    del st.session_state.event_data['nome_evento_digitado_final']
+        else: # Falha do agente ou não há sugestões
+            st.warning("O Agente Batizador falhou em sugerir nomes. Pode digitar um nome abaixo.")
+            nome_final_evento = st.text_input("Qual o nome da festa, então?", value=nome_final_evento, key="input_nome_final_evento_falha")
+            st.session_state.event_data['nome_evento_digitado_final'] = nome_final_evento
+    elif data.get('nome_evento_input'): # Usar o nome que o usuário digitou na primeira página
+        nome_final_evento = data.get('nome_evento_input')
+    st.session_state.event_data['nome_evento_escolhido'] = nome_final_evento # Este é o nome final para o resumo
+    st.markdown(f"📛 **Nome Final do Evento:** {nome_final_evento or 'A definir pelo organizador'}")
+
+@st.fragment
+def fragmento_tema(data):
+    tema_final_para_agentes = data.get('ideia_tema', "(Nenhum tema específico / Estilo Livre)") 
+    if data.get('festa_tematica_raw') == "Sim": # Se o usuário indicou que quer tema
+        with st.expander("🎨 Sugestões de Tema do Agente Especializado (considerando dietas e sugestões de comida!)", expanded=True):
+            if st.session_state.sugestoes_temas_cache is None: # Gerar apenas se não houver cache
+                with st.spinner("Agente de Temas buscando inspiração..."), secao_com_llm():
+                    st.session_state.sugestoes_temas_cache = agente_sugestao_tema_com_restricoes(
+                        data.get('tipo_evento'),
+                        data.get('ideia_tema'), # Ideia inicial do usuário
+                        st.session_state.event_data.get('resumo_restricoes_para_prompt_final'),
+                        st.session_state.event_data.get('sugestoes_comida_final') # Passa sugestões de comida
+                    )
+            
+            if st.session_state.sugestoes_temas_cache:
+                opcoes_temas_nomes = []
+                ideia_original_formatada = f"Minha Ideia Original: {data.get('ideia_tema')}"
+                if data.get('ideia_tema'): # Adicionar ideia original do usuário se houver
+                    opcoes_temas_nomes.append(ideia_original_formatada)
+
+                # Extrair nomes dos temas das sugestões completas
+                for sugestao_completa in st.session_state.sugestoes_temas_cache:
+                    nome_tema_extraido = sugestao_completa.split('\n')[0] # Pega a primeira linha como nome
+                    if "Nome:" in sugestao_completa: # Tenta um parse mais específico
+                        try: nome_tema_extraido = sugestao_completa.split("Nome:")[1].split("\n")[0].strip()
+                        except: pass # Mantém o parse anterior se falhar
+                    # Adicionar apenas se não for duplicado da ideia original já formatada
+                    if nome_tema_extraido not in opcoes_temas_nomes and (not data.get('ideia_tema') or nome_tema_extraido != data.get('ideia_tema')):
+                        opcoes_temas_nomes.append(nome_tema_extraido)
+                
+                opcoes_temas_nomes.append("(Digitar outro tema / Estilo Livre)") # Opção para digitar
+                opcoes_temas_finais_unicas = list(dict.fromkeys(opcoes_temas_nomes)) # Garantir unicidade
+
+                default_tema_idx = 0
+                # Restaurar escolha anterior do tema
+                if data.get('tema_final_escolhido') in opcoes_temas_finais_unicas: default_tema_idx = opcoes_temas_finais_unicas.index(data.get('tema_final_escolhido'))
+                elif data.get('ideia_tema') and ideia_original_formatada in opcoes_temas_finais_unicas: default_tema_idx = opcoes_temas_finais_unicas.index(ideia_original_formatada)
+
+
+                tema_selecionado_selectbox = st.selectbox(
+                    "Escolha o tema final para a festa (ou digite o seu):",
+                    options=opcoes_temas_finais_unicas, index=default_tema_idx, key="select_tema_final"
+                )
+
+                if tema_selecionado_selectbox == "(Digitar outro tema / Estilo Livre)":
+                    tema_final_para_agentes = st.text_input(
+                        "Qual será o tema então (ou deixe em branco para estilo livre)?",
+                        value=st.session_state.event_data.get('tema_digitado_final', ''), key="input_tema_final_usuario"
+                    )
+                    st.session_state.event_data['tema_digitado_final'] = tema_final_para_agentes
+                elif tema_selecionado_selectbox.startswith("Minha Ideia Original: "):
+                    tema_final_para_agentes = data.get('ideia_tema') # Usa a ideia original
+                else:
+                    tema_final_para_agentes = tema_selecionado_selectbox # Usa a sugestão da IA
+                
+                st.session_state.event_data['tema_final_escolhido'] = tema_final_para_agentes if tema_final_para_agentes else "(Nenhum tema específico / Estilo Livre)"
+
+                # Mostrar detalhes das sugestões da IA
+                st.markdown("**Detalhes das Sugestões do Agente (se houver):**")
+                if st.session_state.sugestoes_temas_cache[0].startswith("Tema Sugerido:"): # Caso de erro do agente
+                    st.write(st.session_state.sugestoes_temas_cache[0])
+                else:
+                    for i, sugestao_completa in enumerate(st.session_state.sugestoes_temas_cache):
+                        with st.container():
+                            st.markdown(f"--- Sugestão IA {i+1} ---")
+                            st.markdown(sugestao_completa) # Mostra a sugestão completa
+            else: # Se o agente não retornou nada
+                st.write("O Agente de Temas está tirando uma soneca criativa.")
+                st.session_state.event_data['tema_final_escolhido'] = data.get('ideia_tema', "(Nenhum tema específico / Estilo Livre)")
+        st.markdown("---")
+    else: # Se o usuário indicou que NÃO quer tema
+        st.session_state.event_data['tema_final_escolhido'] = "(Nenhum tema específico / Estilo Livre)"
+
+    # Local, orçamento e transporte dependem do tema: só os invalidamos se ele mudou de verdade
+    tema_das_secoes = st.session_state.tema_das_secoes
+    if tema_das_secoes is not None and st.session_state.event_data['tema_final_escolhido'] != tema_das_secoes:
+        # Marca o tema novo antes do rerun: na execução completa este fragmento roda antes do de
+        # localização, e com o tema antigo ainda aqui o rerun dispararia de novo, sem fim.
+        # O localizacao_cache é chaveado pelo tema, então o local é recalculado do mesmo jeito.
+        st.session_state.tema_das_secoes = st.session_state.event_data['tema_final_escolhido']
+        st.rerun()
+
+@st.fragment
+def fragmento_localizacao(data):
+    tema_escolhido = st.session_state.event_data.get('tema_final_escolhido')
+    entradas = (
+        data.get('tipo_evento'), tema_escolhido, data.get('tipo_local_desejado'),
+        st.session_state.event_data.get('resumo_restricoes_para_prompt_final'),
+        st.session_state.event_data.get('sugestoes_comida_final'),
+        data.get('local_interno_especifico') if data.get('tipo_local_desejado') == "Interno na Empresa" else None,
+    )
+    with st.expander("🗺️ Sugestões do Agente de Localização", expanded=True):
+        if st.session_state.localizacao_cache is None or st.session_state.localizacao_cache[0] != entradas:
+            with secao_com_llm():
+                st.session_state.localizacao_cache = (entradas, agente_localizacao(*entradas))
+        sugestoes_locais_texto, contatos_locais_simulados = st.session_state.localizacao_cache[1]
+        for sug in sugestoes_locais_texto:
+            st.markdown(f"- {sug}") 
+    st.session_state.event_data['sugestoes_locais_finais'] = sugestoes_locais_texto
+    st.session_state.event_data['contatos_locais_finais'] = contatos_locais_simulados
+    st.session_state.tema_das_secoes = tema_escolhido
+    st.markdown("---")
+
+def plano_transporte(data):
+    """Frota calculada localmente (instantâneo, sem LLM); None quando não há transporte a organizar."""
+    if data.get('tipo_local_desejado') != "Externo" or not data.get('precisa_transporte'):
+        return None
+    return planejar_transporte(st.session_state.event_data.get('num_convidados_final_calculado'),
+                               ler_pontos_embarque(data.get('pontos_embarque_raw')))
+
+@st.fragment
+def fragmento_orcamento(data):
+    plano = plano_transporte(data)
+    with st.expander("💰 Considerações do Agente Orçamentista", expanded=True):
+        feedback_orcamento = agente_orcamentista(
+            data.get('valor_disponivel'),
+            st.session_state.event_data.get('num_convidados_final_calculado'),
+            st.session_state.event_data.get('tema_final_escolhido'),
+            st.session_state.event_data.get('contatos_locais_finais'), # Passa os contatos para simular custos
+            plano.custo_total if plano else None
+        )
+        st.markdown(feedback_orcamento)
+    st.markdown("---")
+
+@st.fragment
+def fragmento_mesas(data):
+    with st.expander("🍽️ Mesas e Estações de Buffet (quem senta onde e come o quê)", expanded=True):
+        arquivo = data.get('arquivo_json_obj') or GUEST_LIST_FILE
+        try:
+            lista = obter_lista_convidados(arquivo)
+        except ERROS_LEITURA:
+            # O Agente de Convidados e Dietas já explicou o problema com o arquivo lá em cima
+            st.info("Sem lista legível, sem mapa de mesas. Corrija o arquivo na página 2 e gere o plano de novo!")
+            st.session_state.event_data['num_mesas_final'] = None # Nada de mapa velho no resumo
+            return
+        col_mesa, col_estacao = st.columns(2)
+        capacidade_mesa = col_mesa.number_input("Lugares por mesa:", min_value=2, max_value=30, value=10, key="capacidade_mesa_pg5")
+        capacidade_estacao = col_estacao.number_input("Porções por estação especial:", min_value=10, max_value=1000, value=80, step=10, key="capacidade_estacao_pg5")
+
+        entradas = (st.session_state.lista_convidados_cache[0], capacidade_mesa, capacidade_estacao)
+        if st.session_state.alocacao_cache is None or st.session_state.alocacao_cache[0] != entradas:
+            plano = alocar_mesas_e_estacoes(lista, capacidade_mesa, capacidade_estacao)
+            st.session_state.alocacao_cache = (entradas, plano, exportar_csv(plano, lista))
+        _, plano, csv_alocacao = st.session_state.alocacao_cache
+
+        st.write(f"**{lista.num_confirmados} confirmados em {len(plano.mesas)} mesas, "
+                 f"com {plano.num_estacoes_especiais} estação(ões) especial(is).** Ninguém fica de pé, ninguém come o que não pode!")
+        st.dataframe(resumo_estacoes(plano), use_container_width=True, hide_index=True)
+        st.download_button("📥 Baixar mapa de mesas (CSV)", data=csv_alocacao, file_name="mapa_de_mesas.csv",
+                           mime="text/csv", key="download_mapa_mesas")
+    st.session_state.event_data['num_mesas_final'] = len(plano.mesas)
+    st.session_state.event_data['estacoes_buffet_final'] = resumo_estacoes(plano)
+    st.markdown("---")
+
+@st.fragment
+def fragmento_transporte(data, respostas_combinadas):
+    with st.expander("🚌 Ideias do Agente de Transporte", expanded=True):
+        local_str_para_transporte = "Local Externo Genérico" # Default
+        # Tenta usar o primeiro local sugerido para o prompt de transporte
+        if st.session_state.event_data.get('sugestoes_locais_finais') and \
+           isinstance(st.session_state.event_data['sugestoes_locais_finais'], list) and \
+           len(st.session_state.event_data['sugestoes_locais_finais']) > 0:
+            local_str_para_transporte = st.session_state.event_data['sugestoes_locais_finais'][0]
+
+        plano = plano_transporte(data)
+        entradas = (st.session_state.event_data.get('num_convidados_final_calculado'), local_str_para_transporte,
+                    data.get('pontos_embarque_raw'), data.get('transporte_com_humor'))
+        if st.session_state.transporte_cache is None or st.session_state.transporte_cache[0] != entradas:
+            with secao_com_llm():
+                feedback_transporte = agente_transporte(
+                    entradas[0],
+                    local_str_para_transporte, # Passa o nome do local (ou o primeiro sugerido)
+                    data.get('precisa_transporte'),
+                    respostas_combinadas.get('transporte'),
+                    plano=plano,
+                    com_humor=data.get('transporte_com_humor')
+                )
+            st.session_state.transporte_cache = (entradas, feedback_transporte)
+        st.markdown(st.session_state.transporte_cache[1])
+        if plano and plano.pessoas_a_mais:
+            st.warning(f"Os pontos de embarque somam {plano.pessoas_a_mais} pessoa(s) a mais que os "
+                       f"{entradas[0]} convidados: a frota abaixo leva todo mundo dos pontos, inclusive quem não existe. "
+                       "Confira as contagens na página 4 para não pagar assento de fantasma!")
+        if plano and plano.por_ponto:
+            st.dataframe(plano.linhas(), use_container_width=True, hide_index=True)
+    st.markdown("---")
+
+
+def orquestrar_agentes(data):
+    """Todas as seções dos agentes, na ordem do plano (cada uma com seu cache na sessão)."""
+    st.subheader("🗣️ Atenção! Os Agentes Especializados estão entrando em Ação:")
+
+    # 1. Agente Otimizador de Festas (preenchido mais abaixo, depois da eventual chamada combinada)
+    container_otimizador = st.container()
+
+    # 2. Agente de Convidados e Dietas
+    num_convidados_final = 0
+    resumo_restricoes_detalhado_final = "Aguardando processamento..."
+    resumo_restricoes_para_prompt_final = "" 
+    sugestoes_comida_do_agente_dietas = "Nenhuma sugestão de comida específica por enquanto."
+
+    with st.expander("📋 Análise do Agente de Convidados e Dietas (e sugestões de rango!)", expanded=True):
+        if st.session_state.resultado_dietas_cache is None:
+            num_convidados_calc, resumo_detalhado_calc, resumo_prompt_calc, sugestoes_comida_calc = 0, "N/A", "", ""
+            # Garantir que 'arquivo_json_obj' seja passado corretamente
+            arquivo_json_para_agente = data.get('arquivo_json_obj') if data.get('fonte_convidados_raw') == "json" else GUEST_LIST_FILE
+
+            with secao_com_llm(): # O Agente de Dietas pede ao LLM sugestões de comida
+                if data.get('fonte_convidados_raw') == "json":
+                    # Verifica se o arquivo foi carregado, senão usa o mock como fallback
+                    if data.get('arquivo_json_obj'):
+                        num_convidados_calc, resumo_detalhado_calc, resumo_prompt_calc, sugestoes_comida_calc = agente_convidados_dietas(True, data.get('arquivo_json_obj'))
+                    else:
+                        st.warning(f"A lista de convidados não foi carregada pelo utilizador. Usando o arquivo de exemplo '{GUEST_LIST_FILE}' para o Agente de Convidados e Dietas.")
+                        num_convidados_calc, resumo_detalhado_calc, resumo_prompt_calc, sugestoes_comida_calc = agente_convidados_dietas(True, GUEST_LIST_FILE)
+                elif data.get('fonte_convidados_raw') == "manual":
+                    num_convidados_calc = data.get('quantidade_pessoas_manual', 0)
+                    # Para manual, não há arquivo JSON, então passamos False e None
+                    _, resumo_detalhado_calc, resumo_prompt_calc, sugestoes_comida_calc = agente_convidados_dietas(False, None)
+            st.session_state.resultado_dietas_cache = (num_convidados_calc, resumo_detalhado_calc, resumo_prompt_calc, sugestoes_comida_calc)
+        num_convidados_calc, resumo_detalhado_calc, resumo_prompt_calc, sugestoes_comida_calc = st.session_state.resultado_dietas_cache
+
+        if num_convidados_calc is not None:
+            num_convidados_final = num_convidados_calc
+        resumo_restricoes_detalhado_final = resumo_detalhado_calc
+        resumo_restricoes_para_prompt_final = resumo_prompt_calc
+        sugestoes_comida_do_agente_dietas = sugestoes_comida_calc
+        
+        st.session_state.event_data['num_convidados_final_calculado'] = num_convidados_final
+        st.session_state.event_data['resumo_restricoes_final_calculado'] = resumo_restricoes_detalhado_final
+        st.session_state.event_data['resumo_restricoes_para_prompt_final'] = resumo_restricoes_para_prompt_final
+        st.session_state.event_data['sugestoes_comida_final'] = sugestoes_comida_do_agente_dietas # Salva para outros agentes
+        
+        st.write(f"**Estimativa de Almas Presentes:** {num_convidados_final} pessoas.")
+        st.markdown(f"**Relatório de Dietas Especiais:**\n{resumo_restricoes_detalhado_final}")
+        st.markdown(f"**Sugestões de Tipo de Comida/Culinária (baseado nas dietas):**\n{sugestoes_comida_do_agente_dietas}")
+        if data.get('fonte_convidados_raw') == "json" and data.get('erros_lista_convidados') and data['erros_lista_convidados'][0]:
+            num_erros_lista, total_lido_lista, erros_lista = data['erros_lista_convidados']
+            st.warning(f"{num_erros_lista} de {total_lido_lista} registro(s) foram ignorados por problemas no formato:")
+            st.dataframe([{"Onde": onde, "Problema": motivo} for onde, motivo in erros_lista],
+                         use_container_width=True, hide_index=True)
+    st.markdown("---")
+
+    # 2b. Mesas e estações (só com lista de presença: precisamos saber quem come o quê)
+    if data.get('fonte_convidados_raw') == "json":
+        fragmento_mesas(data)
+
+    # Chamada combinada: otimizador, batizador e transporte numa única ida ao LLM (opcional)
+    objetivos_finais_lista_temp = data.get('objetivos_selecionados', []) + data.get('objetivos_personalizados', [])
+    objetivos_para_prompt_str_temp = "; ".join(objetivos_finais_lista_temp) if objetivos_finais_lista_temp else "Não especificado"
+    respostas_combinadas = {}
+    if data.get('chamada_combinada'):
+        if st.session_state.respostas_combinadas_cache is None:
+            tarefas_combinadas = {}
+            if data.get('usar_feedback_passado'):
+                tarefas_combinadas['otimizador'] = prompt_otimizador_festas()
+            if data.get('ajuda_nome') and not data.get('nome_evento_input') and st.session_state.sugestoes_nomes_cache is None:
+                tarefas_combinadas['batizador'] = prompt_batizador_eventos(data.get('tipo_evento'), objetivos_para_prompt_str_temp)
+            if data.get('tipo_local_desejado') == "Externo" and data.get('precisa_transporte') and data.get('transporte_com_humor') and num_convidados_final:
+                # O local exato ainda não foi sugerido aqui; o tipo de local preferido basta para o comentário
+                tarefas_combinadas['transporte'] = prompt_transporte(num_convidados_final, data.get('local_externo_tipo_pref') or "Local Externo Genérico",
+                                                                     plano_transporte(data).resumo())
+            if len(tarefas_combinadas) > 1: # Combinar uma tarefa só não economiza nada
+                with st.spinner("Agentes dividindo o mesmo táxi até a IA..."), secao_com_llm():
+                    st.session_state.respostas_combinadas_cache = agente_chamada_combinada(tarefas_combinadas)
+            else:
+                st.session_state.respostas_combinadas_cache = {}
+        respostas_combinadas = st.session_state.respostas_combinadas_cache
+
+    with container_otimizador:
+        with st.expander("🧐 Dicas do Agente Otimizador de Festas", expanded=True):
+            if st.session_state.dicas_otimizador_cache is None:
+                with secao_com_llm():
+                    st.session_state.dicas_otimizador_cache = agente_otimizador_festas(data.get('usar_feedback_passado'), respostas_combinadas.get('otimizador'))
+            for dica in st.session_state.dicas_otimizador_cache:
+                st.markdown(f"- _{dica}_")
+        st.markdown("---")
+
+    # 3. Agente Batizador
+    fragmento_nome_evento(data, objetivos_para_prompt_str_temp, respostas_combinadas)
+
+    # 4. Agente de Sugestão de Temas
+    fragmento_tema(data)
+
+    # 5. Agente de Localização
+    fragmento_localizacao(data)
+
+    # 6. Agente Orçamentista
+    fragmento_orcamento(data)
+
+    # 7. Agente de Transporte
+    if data.get('tipo_local_desejado') == "Externo" and data.get('precisa_transporte'):
+        fragmento_transporte(data, respostas_combinadas)
+
+
+def render():
+    st.header("📜 O Plano Mestre da Sua Festa Maluca! 📜")
+    if not st.session_state.baloes_exibidos: # Festa se comemora uma vez só, não a cada rerun
+        st.balloons()
+        st.session_state.baloes_exibidos = True
+    data = st.session_state.event_data
+
+    # --- ORQUESTRAÇÃO DOS AGENTES ---
+    # Só a primeira execução depois do "Gerar Plano" passa pela fila; as seguintes reaproveitam os caches,
+    # e a seção que precisar do LLM de novo respeita a decisão da fila (secao_com_llm)
+    if st.session_state.admissao_plano is None:
+        aviso_fila = st.empty()
+
+        def mostrar_posicao(posicao, tamanho_fila):
+            aviso_fila.info(f"🎟️ Tem muita festa sendo planejada agora! Você é o {posicao}º da fila "
+                            f"({tamanho_fila} esperando). Segura o confete que já é a sua vez...")
+
+        with obter_controle_admissao().vaga(id_sessao(), classe_do_plano(data), ESPERA_MAX_FILA, mostrar_posicao) as admitido:
+            aviso_fila.empty()
+            st.session_state.admissao_plano = "completo" if admitido else "economico"
+            orquestrar_agentes(data)
+    else:
+        orquestrar_agentes(data)
+
+    if st.session_state.admissao_plano == "economico":
+        st.warning("Os agentes estão atolados de pedidos, então este plano saiu no modo econômico: "
+                   "só sugestões já prontas, sem novas consultas à IA.")
+        if st.button("🔁 Tentar de novo com os agentes completos", key="btn_refazer_plano_completo"):
+            limpar_caches_resultados()
+            st.rerun()
+
+    st.subheader("\n\n✨ Seu Plano Mestre Detalhado ✨")
+    # O nome final aparece na seção do Agente Batizador, que reroda sozinha quando o nome muda
+    st.write(f"**Tipo de Evento:** {data.get('tipo_evento', 'Não definido')}")
+    objetivos_finais_lista = data.get('objetivos_selecionados', []) + data.get('objetivos_personalizados', [])
+    if objetivos_finais_lista:
+        st.write("**Objetivos:**")
+        for obj_final in objetivos_finais_lista: st.markdown(f"  - {obj_final}")
+    
+    st.write(f"**Tema Escolhido:** {st.session_state.event_data.get('tema_final_escolhido', '(Nenhum tema específico / Estilo Livre)')}")
+
+    data_prevista_obj = data.get('data_prevista')
+    if isinstance(data_prevista_obj, datetime.date):
+        st.write(f"**Data Prevista:** {data_prevista_obj.strftime('%d/%m/%Y')}")
+    else:
+        st.write(f"**Data Prevista:** {data_prevista_obj if data_prevista_obj else 'A definir'}") # Caso seja string ou None
+    
+    local_final_str = "A definir"
+    if data.get('tipo_local_desejado') == "Interno na Empresa":
+        local_final_str = data.get('local_interno_especifico', "Espaço interno não especificado")
+    elif st.session_state.event_data.get('sugestoes_locais_finais'):
+        # Formata as sugestões de local para exibição
+        locais_formatados = []
+        for item_local in st.session_state.event_data['sugestoes_locais_finais']:
+            # Remove a parte do contato simulado para uma exibição mais limpa no resumo
+            item_sem_contato = item_local.split(" - Contato Simulado:")[0].split(" - Contato:")[0]
+            locais_formatados.append(f"  - {item_sem_contato.strip()}")
+        local_final_str = "\n".join(locais_formatados) if locais_formatados else "Nenhuma sugestão específica."
+
+
+    st.markdown(f"**Local Previsto/Sugerido:**\n{local_final_str}")
+
+    st.write(f"**Orçamento Total Estimado:** R$ {data.get('valor_disponivel', 0.0):.2f}")
+    plano_caravana = plano_transporte(data)
+    if plano_caravana and plano_caravana.por_ponto:
+        st.write(f"**Transporte:** {plano_caravana.resumo()}")
+    st.write(f"**Público Estimado:** {st.session_state.event_data.get('num_convidados_final_calculado', 0)} pessoas")
+    st.markdown(f"**Restrições Alimentares Notáveis:** \n{st.session_state.event_data.get('resumo_restricoes_final_calculado', 'Não processado')}")
+    st.markdown(f"**Sugestões de Tipo de Comida (baseado nas dietas):** \n{st.session_state.event_data.get('sugestoes_comida_final', 'Nenhuma específica')}")
+    if st.session_state.event_data.get('num_mesas_final'):
+        estacoes_str = ", ".join(f"{linha['Estação']} ({linha['Porções']} porções)" for linha in st.session_state.event_data['estacoes_buffet_final'])
+        st.markdown(f"**Mesas e Estações:** {st.session_state.event_data['num_mesas_final']} mesas; {estacoes_str}")
+
+
+    with st.expander("📊 Relatório de Modelos (latência e custo por nível, somando todos os workers)"):
+        st.dataframe(relatorio_niveis(), use_container_width=True, hide_index=True)
+
+    st.success("Voilà! Este é o seu rascunho inicial turbinado. Agora é só alegria... e um pouquinho mais de trabalho!")
+
+    if st.button("Planejar Outra Festa Épica? 🚀", key="btn_planejar_outra_final"):
+        # Limpar todos os dados do evento e caches para um novo planejamento
+        st.session_state.page = 1
+        st.session_state.event_data = EventData()
+        st.session_state.objetivo_custom_temp_input = ""
+        limpar_caches_resultados()
+
+        # Resetar o uploader de arquivo (o EventData novo já vem sem o arquivo)
+        if 'arquivo_json_obj' in st.session_state: # Para o caso de estar diretamente no session_state
+             del st.session_state['arquivo_json_obj']
+
+        st.session_state.uploader_key_count = st.session_state.get('uploader_key_count', 0) + 1 # Incrementar para forçar o reset do file_uploader
+        
+        st.rerun()
@@ -0,0 +1,65 @@
+"""Página 1: tipo de evento, nome e objetivos."""
+import streamlit as st
+
+from etapas import next_page
+
+
+def render():
+    st.header("Página 1: O pontapé inicial da bagunça!")
+    tipo_evento_opcoes = ["Confraternização", "Treinamento", "Team Building", "Workshop", "Lançamento de Produto", "Outro"]
+    st.session_state.event_data['tipo_evento'] = st.selectbox(
+        "Qual o tipo de evento que vamos aprontar?", tipo_evento_opcoes,
+        index=tipo_evento_opcoes.index(st.session_state.event_data.get('tipo_evento', tipo_evento_opcoes[0])),
+        key="tipo_evento_pg1"
+    )
+    st.session_state.event_data['nome_evento_input'] = st.text_input(
+        "Qual o nome da criança... digo, do evento? (Opcional, viu?)",
+        value=st.session_state.event_data.get('nome_evento_input', ''), key="nome_evento_input_pg1"
+    )
+    st.session_state.event_data['ajuda_nome'] = st.checkbox(
+        "Preciso de uma luz divina (ou da IA) para batizar essa festança!",
+        value=st.session_state.event_data.get('ajuda_nome', False), key="ajuda_nome_pg1"
+    )
+    if st.session_state.event_data['ajuda_nome'] and not st.session_state.event_data.get('nome_evento_input'):
+        st.info("Maravilha! Na página de resultados, o Agente Batizador vai te dar umas ideias.")
+
+    st.subheader("🎯 E qual é o grande objetivo por trás disso tudo?")
+    opcoes_objetivos_comuns = [
+        "Fazer a galera se enturmar (Integração)", "Celebrar as vitórias e conquistas do ano",
+        "Apresentar novo produto/serviço com impacto", "Treinamento/Capacitação da equipe",
+        "Fortalecer a cultura da empresa", "Networking e novas conexões",
+        "Reconhecimento e premiação de colaboradores"
+    ]
+    st.session_state.event_data['objetivos_selecionados'] = st.multiselect(
+        "Escolha os objetivos principais (pode marcar vários):", options=opcoes_objetivos_comuns,
+        default=st.session_state.event_data.get('objetivos_selecionados', []), key="objetivos_sel_pg1"
+    )
+    st.markdown("##### Quer adicionar um objetivo super secreto ou específico?")
+    st.session_state.objetivo_custom_temp_input = st.text_input(
+        "Digite seu objetivo personalizado aqui:",
+        value=st.session_state.get('objetivo_custom_temp_input', ""),
+        placeholder="Ex: Dominar o mundo (começando pela festa!)", key="obj_custom_input_pg1"
+    )
+    if st.button("Adicionar Objetivo Personalizado", key="btn_add_obj_pg1"):
+        if st.session_state.objetivo_custom_temp_input:
+            if 'objetivos_personalizados' not in st.session_state.event_data:
+                st.session_state.event_data['objetivos_personalizados'] = []
+            st.session_state.event_data['objetivos_personalizados'].append(st.session_state.objetivo_custom_temp_input)
+            st.session_state.objetivo_custom_temp_input = "" # Limpar o campo
+            st.rerun()
+        else:
+            st.warning("Escreva alguma coisa aí, ué! Objetivo em branco não vale.")
+    if st.session_state.event_data.get('objetivos_personalizados'):
+        st.write("**Seus Objetivos Personalizados (até agora):**")
+        objetivos_para_remover = []
+        for i, obj_custom in enumerate(st.session_state.event_data['objetivos_personalizados']):
+            col1_obj, col2_obj = st.columns([0.9, 0.1])
+            with col1_obj: st.markdown(f"- {obj_custom}")
+            with col2_obj:
+                if st.button(f"🗑️", key=f"del_custom_obj_pg1_{i}", help="Remover este objetivo personalizado"):
+                    objetivos_para_remover.append(i) # Adicionar índice para remoção
+        if objetivos_para_remover:
+            for index_to_remove in sorted(objetivos_para_remover, reverse=True): # Remover de trás para frente
+                st.session_state.event_data['objetivos_personalizados'].pop(index_to_remove)
+            st.rerun()
+    if st.button("Próximo Passo: Orçamento e Convidados 👥", on_click=next_page, key="btn_prox_1_final_v2"): pass 
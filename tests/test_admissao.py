@@ -0,0 +1,126 @@
+"""Testes do controle de admissão da geração de planos."""
+import threading
+import time
+
+import pytest
+
+from admissao import CLASSE_BARATA, CLASSE_NORMAL, ControleAdmissao, em_modo_economico
+
+
+def _ocupar(controle, usuario="ocupante"):
+    ficha = controle.entrar(usuario)
+    assert controle.aguardar(ficha, espera_max=0)
+    return ficha
+
+
+def test_classe_barata_passa_na_frente():
+    controle = ControleAdmissao(vagas=1)
+    _ocupar(controle)
+    normal = controle.entrar("normal", CLASSE_NORMAL)
+    barata = controle.entrar("barata", CLASSE_BARATA)
+    assert (controle.posicao(barata), controle.posicao(normal)) == (1, 2)
+
+
+def test_quem_foi_menos_atendido_passa_na_frente():
+    controle = ControleAdmissao(vagas=1)
+    controle.liberar(_ocupar(controle, "veterano")) # Já gerou um plano
+    ocupante = _ocupar(controle)
+    veterano = controle.entrar("veterano")
+    novato = controle.entrar("novato")
+    assert (controle.posicao(novato), controle.posicao(veterano)) == (1, 2)
+    controle.liberar(ocupante)
+
+
+def test_mesmo_usuario_ocupa_uma_ficha_so():
+    controle = ControleAdmissao(vagas=1)
+    assert controle.entrar("a") is controle.entrar("a")
+    assert controle.estatisticas()["na_fila"] == 1
+
+
+def test_envelhecimento_promove_quem_espera_demais():
+    controle = ControleAdmissao(vagas=1, envelhecimento=0.05)
+    _ocupar(controle)
+    antigo = controle.entrar("antigo", CLASSE_NORMAL)
+    time.sleep(0.08)
+    barato = controle.entrar("barato", CLASSE_BARATA)
+    assert (controle.posicao(antigo), controle.posicao(barato)) == (1, 2)
+
+
+def test_timeout_tira_a_ficha_da_fila():
+    controle = ControleAdmissao(vagas=1)
+    _ocupar(controle)
+    assert controle.aguardar(controle.entrar("b"), espera_max=0.05) is False
+    assert controle.estatisticas()["na_fila"] == 0
+
+
+def test_excecao_no_aviso_libera_a_ficha():
+    controle = ControleAdmissao(vagas=1)
+    ocupante = _ocupar(controle)
+
+    def aba_fechada(posicao, tamanho_fila):
+        raise KeyboardInterrupt # BaseException, como a StopException do Streamlit
+
+    with pytest.raises(KeyboardInterrupt):
+        controle.aguardar(controle.entrar("fugitivo"), espera_max=5, ao_esperar=aba_fechada)
+    assert controle.estatisticas()["na_fila"] == 0
+
+    controle.liberar(ocupante)
+    inicio = time.monotonic()
+    with controle.vaga("novo", espera_max=5) as admitido:
+        assert admitido
+    assert time.monotonic() - inicio < 0.5
+
+
+def test_aviso_roda_fora_da_trava():
+    controle = ControleAdmissao(vagas=1)
+    ocupante = _ocupar(controle)
+    outras_threads_andam = []
+
+    def aviso(posicao, tamanho_fila):
+        # A trava é reentrante: só outra thread denuncia se ela ainda estiver na nossa mão
+        vizinha = threading.Thread(target=controle.estatisticas)
+        vizinha.start()
+        vizinha.join(timeout=1)
+        outras_threads_andam.append(not vizinha.is_alive())
+        controle.liberar(ocupante)
+
+    assert controle.aguardar(controle.entrar("b"), espera_max=5, ao_esperar=aviso)
+    assert outras_threads_andam == [True]
+
+
+def test_espera_estimada_longa_vai_direto_para_o_modo_economico():
+    controle = ControleAdmissao(vagas=1, duracao_inicial=60)
+    ocupante = _ocupar(controle)
+    with controle.vaga("b", espera_max=1) as admitido:
+        assert admitido is False and em_modo_economico()
+    assert not em_modo_economico()
+    assert controle.estatisticas()["na_fila"] == 0
+    controle.liberar(ocupante)
+
+
+def test_vaga_liberada_admite_o_proximo():
+    controle = ControleAdmissao(vagas=1)
+    ocupante = _ocupar(controle)
+    resultado = []
+    espera = threading.Thread(target=lambda: resultado.append(controle.aguardar(controle.entrar("b"), espera_max=5)))
+    espera.start()
+    time.sleep(0.05)
+    controle.liberar(ocupante)
+    espera.join()
+    assert resultado == [True]
+
+
+def test_vaga_dentro_da_propria_vaga_nao_devolve_a_vaga():
+    controle = ControleAdmissao(vagas=1)
+    with controle.vaga("a", espera_max=1) as admitido:
+        with controle.vaga("a", espera_max=1) as secao:
+            assert admitido and secao
+        assert controle.estatisticas()["rodando"] == 1 # A seção não soltou a vaga do plano
+    assert controle.estatisticas()["rodando"] == 0
+
+
+def test_secao_avulsa_nao_entra_na_media_de_duracao():
+    controle = ControleAdmissao(vagas=1, duracao_inicial=10.0)
+    with controle.vaga("a", medir=False):
+        pass
+    assert controle.duracao_media == 10.0
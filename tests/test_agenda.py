@@ -0,0 +1,75 @@
+"""Testes da agenda compartilhada dos espaços."""
+import datetime
+import multiprocessing
+import time
+
+import pytest
+
+import agenda as modulo_agenda
+from agenda import AgendaLocais
+from cache import CacheLocal
+
+DIA = datetime.date(2030, 12, 20)
+
+
+@pytest.fixture
+def agenda(tmp_path):
+    return AgendaLocais(str(tmp_path / "agenda.jsonl"), cache=CacheLocal())
+
+
+def test_reserva_em_conflito_e_recusada(agenda):
+    agenda.reservar("Auditório", DIA, "Festa A")
+    with pytest.raises(ValueError):
+        agenda.reservar("Auditório", DIA, "Festa B")
+
+
+def test_aceitar_conflito_grava_mesmo_assim(agenda):
+    primeiro = agenda.reservar("Auditório", DIA, "Festa A")
+    segundo = agenda.reservar("Auditório", DIA, "Festa B", aceitar_conflito=True)
+    assert {c["id"] for c in agenda.conflitos("Auditório", DIA)} == {primeiro, segundo}
+
+
+def test_mover_reserva_cancela_a_antiga(agenda):
+    antigo = agenda.reservar("Auditório", DIA, "Festa A")
+    novo = agenda.reservar("Auditório", DIA + datetime.timedelta(days=1), "Festa A", substituir_id=antigo)
+    assert agenda.conflitos("Auditório", DIA) == []
+    assert [c["id"] for c in agenda.conflitos("Auditório", DIA + datetime.timedelta(days=1))] == [novo]
+
+
+def test_outro_worker_enxerga_reservas_pelo_arquivo(agenda):
+    outro = AgendaLocais(agenda.caminho)
+    agenda.reservar("Auditório", DIA, "Festa A")
+    outro.atualizar()
+    assert len(outro.conflitos("Auditório", DIA)) == 1
+
+
+def _disputar_reserva(caminho, largada, resultados):
+    agenda = AgendaLocais(caminho, cache=CacheLocal()) # Sem Redis: cada worker com sua trava de cache local
+    gravar = agenda._acrescentar
+
+    def gravar_devagar(registros):
+        time.sleep(0.05) # Alarga a janela entre checar e gravar
+        gravar(registros)
+
+    agenda._acrescentar = gravar_devagar
+    largada.wait()
+    try:
+        agenda.reservar("Auditório", DIA, "Festa")
+        resultados.put("reservou")
+    except ValueError:
+        resultados.put("conflito")
+
+
+@pytest.mark.skipif(modulo_agenda.fcntl is None, reason="flock só existe em sistemas POSIX")
+def test_workers_sem_redis_nao_reservam_o_mesmo_dia(tmp_path):
+    contexto = multiprocessing.get_context("fork")
+    largada, resultados = contexto.Event(), contexto.Queue()
+    caminho = str(tmp_path / "agenda.jsonl")
+    workers = [contexto.Process(target=_disputar_reserva, args=(caminho, largada, resultados)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    largada.set()
+    for worker in workers:
+        worker.join(timeout=10)
+    assert sorted(resultados.get(timeout=1) for _ in workers) == ["conflito"] * 3 + ["reservou"]
+    assert len(AgendaLocais(caminho).conflitos("Auditório", DIA)) == 1
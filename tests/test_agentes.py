@@ -0,0 +1,35 @@
+"""Modo econômico dos agentes: respostas prontas, sem banners de erro."""
+import pytest
+
+st = pytest.importorskip("streamlit")
+pytest.importorskip("google.generativeai")
+
+import agentes
+from admissao import modo_economico
+from cache import CacheLocal
+
+
+@pytest.fixture(autouse=True)
+def sem_llm(monkeypatch):
+    alertas = []
+    monkeypatch.setattr(agentes, "obter_cache", lambda cache=CacheLocal(): cache)
+    monkeypatch.setattr(st, "error", lambda *args, **kwargs: alertas.append(args))
+    monkeypatch.setattr(st, "warning", lambda *args, **kwargs: alertas.append(args))
+    with modo_economico():
+        yield alertas
+    assert alertas == []
+
+
+def test_batizador_sugere_nomes_de_verdade():
+    assert agentes.agente_batizador_eventos("Confraternização", "") == agentes.PRONTO_BATIZADOR.split("\n")
+
+
+def test_temas_e_locais_seguem_o_formato_do_llm():
+    assert len(agentes.agente_sugestao_tema_com_restricoes("Confraternização", None, "Vegano", "Buffet")) == 3
+    sugestoes, contatos = agentes.agente_localizacao("Confraternização", None, "Externo")
+    assert len(sugestoes) == 2 and len(contatos) == 2
+
+
+def test_chamada_combinada_deixa_cada_agente_no_pronto():
+    assert agentes.agente_chamada_combinada({"otimizador": "a", "batizador": "b"}) == {}
+    assert len(agentes.agente_otimizador_festas(True)) == 3
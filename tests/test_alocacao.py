@@ -0,0 +1,64 @@
+"""Testes da distribuição em mesas e estações de buffet."""
+import math
+import random
+
+import pytest
+
+from alocacao import ESTACAO_PRINCIPAL, alocar_mesas_e_estacoes, escolher_estacoes, estacoes_para
+from convidados import gerar_registros_sinteticos, validar_e_normalizar
+
+
+def _limite_ingenuo(contagem, capacidade_estacao):
+    """Uma estação própria por restrição: o plano nunca pode ser pior que isso."""
+    return sum(math.ceil(qtd / capacidade_estacao) for qtd in contagem.values())
+
+
+@pytest.mark.parametrize("semente", range(20))
+def test_escolher_estacoes_atende_todos_sem_passar_do_limite(semente):
+    rng = random.Random(semente)
+    rotulos = ["Vegano", "Vegetariano", "Sem lactose", "Sem glúten", "Kosher", "Diabético", "Alérgico a camarão"]
+    contagem = {rotulo: rng.randint(1, 200) for rotulo in rng.sample(rotulos, rng.randint(1, len(rotulos)))}
+    capacidade = rng.choice((10, 30, 80))
+    atribuicao = escolher_estacoes(contagem, capacidade)
+    assert set(atribuicao) == set(contagem)
+    porcoes = {}
+    for rotulo, tipo in atribuicao.items():
+        assert tipo in estacoes_para(rotulo)
+        porcoes[tipo] = porcoes.get(tipo, 0) + contagem[rotulo]
+    assert sum(math.ceil(p / capacidade) for p in porcoes.values()) <= _limite_ingenuo(contagem, capacidade)
+
+
+def test_escolher_estacoes_junta_grupos_que_cabem_na_mesma_estacao():
+    # 30 veganos + 30 vegetarianos cabem numa estação vegana só
+    assert escolher_estacoes({"Vegano": 30, "Vegetariano": 30}, 80) == {"Vegano": "Vegana", "Vegetariano": "Vegana"}
+
+
+@pytest.mark.parametrize("capacidade_mesa, capacidade_estacao", [(2, 10), (7, 25), (10, 80), (30, 1000)])
+def test_alocacao_respeita_capacidades_e_atende_cada_confirmado_uma_vez(capacidade_mesa, capacidade_estacao):
+    lista = validar_e_normalizar(gerar_registros_sinteticos(2_000))
+    plano = alocar_mesas_e_estacoes(lista, capacidade_mesa, capacidade_estacao)
+
+    sentados = [i for mesa in plano.mesas for i in mesa["convidados"]]
+    confirmados = [i for i in range(len(lista)) if lista.confirmados[i]]
+    assert sorted(sentados) == confirmados # Todo confirmado numa mesa só, e ninguém mais
+    assert all(len(mesa["convidados"]) <= capacidade_mesa for mesa in plano.mesas)
+    assert sorted(plano.estacao_por_convidado) == confirmados # Exatamente uma estação por confirmado
+
+    estacoes = {estacao["estacao"]: estacao for estacao in plano.estacoes}
+    assert all(sum(estacao["porcoes"].values()) <= capacidade_estacao for estacao in plano.estacoes)
+    for i in confirmados:
+        rotulo = lista.rotulos[lista.restricoes[i]]
+        nome_estacao = plano.estacao_por_convidado[i]
+        if lista.restricoes[i] == 0:
+            assert nome_estacao == ESTACAO_PRINCIPAL
+        else:
+            assert estacoes[nome_estacao]["tipo"] in estacoes_para(rotulo)
+
+    contagem = lista.histograma_restricoes()
+    assert plano.num_estacoes_especiais <= _limite_ingenuo(contagem, capacidade_estacao)
+    assert plano.porcoes_principal + sum(contagem.values()) == len(confirmados)
+
+
+def test_alocacao_rejeita_capacidade_zero():
+    with pytest.raises(ValueError):
+        alocar_mesas_e_estacoes(validar_e_normalizar([]), capacidade_mesa=0)
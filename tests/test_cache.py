@@ -0,0 +1,181 @@
+"""Testes da camada de cache: backend local e Redis (com um cliente falso em memória)."""
+import json
+import threading
+import time
+
+import pytest
+
+from cache import CacheLocal, CacheRedis, CotaExcedida, consumir_cota, single_flight
+
+
+class RedisFalso:
+    """O mínimo do protocolo Redis que o CacheRedis usa, com expiração em milissegundos."""
+
+    def __init__(self):
+        self.dados = {}
+        self.mutex = threading.Lock()
+
+    def _vivo(self, chave):
+        item = self.dados.get(chave)
+        if item and item[1] is not None and item[1] <= time.monotonic():
+            del self.dados[chave]
+            return None
+        return item
+
+    def get(self, chave):
+        with self.mutex:
+            item = self._vivo(chave)
+            return item[0] if item else None
+
+    def set(self, chave, valor, px=None, nx=False):
+        with self.mutex:
+            if nx and self._vivo(chave):
+                return None
+            self.dados[chave] = (valor, time.monotonic() + px / 1000 if px else None)
+            return True
+
+    def delete(self, chave):
+        with self.mutex:
+            self.dados.pop(chave, None)
+
+    def eval(self, script, numkeys, *chaves_e_args):
+        """Só o script que o CacheRedis usa: apagar a chave se ela ainda guardar o valor (atômico)."""
+        assert script == CacheRedis.SCRIPT_DELETE_SE_IGUAL and numkeys == 1
+        chave, valor = chaves_e_args
+        with self.mutex:
+            item = self._vivo(chave)
+            if item is None or item[0] != valor:
+                return 0
+            del self.dados[chave]
+            return 1
+
+    def incrby(self, chave, quantidade):
+        with self.mutex:
+            item = self._vivo(chave)
+            novo = (int(item[0]) if item else 0) + quantidade
+            self.dados[chave] = (str(novo).encode(), item[1] if item else None)
+            return novo
+
+    def pexpire(self, chave, ms):
+        with self.mutex:
+            item = self._vivo(chave)
+            if item:
+                self.dados[chave] = (item[0], time.monotonic() + ms / 1000)
+
+
+@pytest.fixture(params=["local", "redis"])
+def cache(request):
+    return CacheLocal() if request.param == "local" else CacheRedis(RedisFalso())
+
+
+def test_add_so_grava_se_a_chave_nao_existe(cache):
+    assert cache.add("k", "primeiro") is True
+    assert cache.add("k", "segundo") is False
+    assert cache.get("k") == "primeiro"
+
+
+def test_add_volta_a_gravar_depois_do_ttl(cache):
+    assert cache.add("k", 1, ttl=0.05)
+    time.sleep(0.08)
+    assert cache.add("k", 2)
+    assert cache.get("k") == 2
+
+
+def test_incr_ttl_vale_so_na_criacao(cache):
+    assert cache.incr("contador", ttl=0.1) == 1
+    time.sleep(0.06)
+    assert cache.incr("contador", ttl=0.1) == 2 # Não renova a expiração
+    time.sleep(0.06)
+    assert cache.incr("contador", ttl=0.1) == 1
+
+
+def test_lock_libera_ao_sair_e_em_excecao(cache):
+    with cache.lock("x"):
+        assert cache.get("lock:x") is not None
+    assert cache.get("lock:x") is None
+    with pytest.raises(RuntimeError):
+        with cache.lock("x"):
+            raise RuntimeError("boom")
+    assert cache.add("lock:x", "livre")
+
+
+def test_lock_ocupado_estoura_timeout(cache):
+    with cache.lock("x"):
+        with pytest.raises(TimeoutError):
+            with cache.lock("x", espera=0.1):
+                pass
+
+
+def test_lock_nao_apaga_trava_de_outro_dono(cache):
+    with cache.lock("x", timeout=0.05):
+        time.sleep(0.08) # Nossa trava expirou...
+        assert cache.add("lock:x", "outro") # ...e outro worker a pegou
+    assert cache.get("lock:x") == "outro"
+
+
+class RedisComCorrida(RedisFalso):
+    """Depois de cada GET da trava, ela expira e outro worker a pega antes do próximo comando."""
+
+    def __init__(self):
+        super().__init__()
+        self.apagados = []
+
+    def get(self, chave):
+        valor = super().get(chave)
+        if chave.endswith("lock:x") and valor is not None:
+            self.set(chave, json.dumps("outro"))
+        return valor
+
+    def delete(self, chave):
+        self.apagados.append(super().get(chave))
+        super().delete(chave)
+
+
+def test_liberar_trava_nao_corre_contra_a_expiracao():
+    cliente = RedisComCorrida()
+    with CacheRedis(cliente).lock("x"):
+        pass
+    assert json.dumps("outro") not in cliente.apagados # Nunca apaga a trava que outro worker pegou
+
+
+def test_delete_se_igual(cache):
+    cache.set("k", "meu")
+    assert cache.delete_se_igual("k", "outro") is False
+    assert cache.delete_se_igual("k", "meu") is True
+    assert cache.get("k") is None
+
+
+def test_single_flight_calcula_uma_vez_entre_workers():
+    cliente = RedisFalso()
+    workers = [CacheRedis(cliente), CacheRedis(cliente)] # Dois processos, mesmo servidor
+    chamadas = []
+
+    def calcular():
+        chamadas.append(1)
+        time.sleep(0.1)
+        return {"resposta": 42}
+
+    resultados = []
+    threads = [threading.Thread(target=lambda c=c: resultados.append(single_flight(c, "llm:x", calcular, espera=5)))
+               for c in workers * 3]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(chamadas) == 1
+    assert resultados == [{"resposta": 42}] * 6
+
+
+def test_cota_compartilhada_entre_dois_backends():
+    cliente = RedisFalso()
+    a, b = CacheRedis(cliente), CacheRedis(cliente)
+    janela = 3600 # Janela longa: o teste não atravessa a virada por acaso
+    assert [consumir_cota(c, "gemini", 3, janela=janela) for c in (a, b, a)] == [1, 2, 3]
+    with pytest.raises(CotaExcedida):
+        consumir_cota(b, "gemini", 3, janela=janela, espera_max=0)
+
+
+def test_prefixo_isola_apps_no_mesmo_servidor():
+    cliente = RedisFalso()
+    CacheRedis(cliente, prefixo="a:").set("k", 1)
+    assert CacheRedis(cliente, prefixo="b:").get("k") is None
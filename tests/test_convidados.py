@@ -0,0 +1,185 @@
+"""Testes da ingestão da lista de convidados e do índice de busca."""
+import io
+
+import pytest
+
+from convidados import (
+    ERROS_LEITURA, IndiceConvidados, detectar_formato, gerar_registros_sinteticos, ler_registros, validar_e_normalizar,
+)
+
+
+@pytest.fixture(scope="module")
+def indice():
+    return IndiceConvidados(validar_e_normalizar(gerar_registros_sinteticos(5_000)))
+
+
+def _todos(indice, **filtros):
+    """Resposta de referência: varre a lista inteira com os mesmos critérios."""
+    lista = indice.lista
+    codigo = lista.rotulos.index(filtros["restricao"]) if filtros.get("restricao") else None
+    return [i for i in range(len(lista))
+            if (codigo is None or lista.restricoes[i] == codigo)
+            and (filtros.get("confirmado") is None or bool(lista.confirmados[i]) == filtros["confirmado"])]
+
+
+def test_filtro_unico_tem_total_exato(indice):
+    ids, total, exato = indice.buscar(confirmado=False, por_pagina=10)
+    esperado = _todos(indice, confirmado=False)
+    assert exato and total == len(esperado)
+    assert ids == esperado[:10]
+
+
+def test_varredura_limitada_mesmo_em_pagina_funda(indice, monkeypatch):
+    monkeypatch.setattr(IndiceConvidados, "LIMITE_VARREDURA", 100)
+    restricao = indice.lista.rotulos[1]
+    ids, total, exato = indice.buscar(restricao=restricao, confirmado=False, pagina=10_000)
+    assert ids == [] and not exato
+    assert total <= 100 # Contou só o que viu: a interface mostra "N+"
+
+
+def test_varredura_abaixo_do_limite_continua_exata(indice):
+    restricao = indice.lista.rotulos[1]
+    ids, total, exato = indice.buscar(restricao=restricao, confirmado=True, por_pagina=5)
+    esperado = _todos(indice, restricao=restricao, confirmado=True)
+    assert exato and total == len(esperado)
+    assert ids == esperado[:5]
+
+
+@pytest.mark.parametrize("nome, conteudo", [
+    ("objeto.json", b'{"nome": "Ana"}'),
+    ("truncado.json", b'[{"nome": "Ana", "em'),
+    ("binario.csv", b"nome,email\n\x81\x8d\x8f\x90\n"), # Nem UTF-8 nem cp1252
+])
+def test_arquivo_ilegivel_lanca_erro_de_leitura(nome, conteudo):
+    buffer = io.BytesIO(conteudo)
+    try:
+        validar_e_normalizar(ler_registros(buffer, nome=nome))
+    except ERROS_LEITURA:
+        assert buffer.tell() == 0 # O buffer de quem chamou volta para o começo
+    else:
+        pytest.fail("arquivo ilegível foi aceito")
+
+
+def _ler(conteudo, nome):
+    return validar_e_normalizar(ler_registros(io.BytesIO(conteudo), nome=nome))
+
+
+@pytest.mark.parametrize("nome, conteudo, formato", [
+    ("lista.json", b"", "json"),
+    ("lista.JSONL", b"", "jsonl"),
+    ("lista.ndjson", b"", "jsonl"),
+    ("lista.csv", b"[", "csv"), # A extensão manda
+    (None, b"  \n[{}]", "json"),
+    (None, b"\xef\xbb\xbf{}\n{}", "jsonl"), # BOM antes do primeiro caractere útil
+    ("exportacao.txt", b"nome;email", "csv"),
+])
+def test_detectar_formato(nome, conteudo, formato):
+    buffer = io.BytesIO(conteudo)
+    assert detectar_formato(buffer, nome) == formato
+    assert buffer.tell() == 0
+
+
+@pytest.mark.parametrize("separador", [",", ";"])
+def test_csv_descobre_o_separador(separador):
+    linhas = [["nome", "email", "presenca_confirmada", "restricao_alimentar"],
+              ["Ana Lima", "ana@x.com", "sim", "Vegano"],
+              ["Bruno Souza", "bruno@x.com", "não", ""]]
+    conteudo = "\n".join(separador.join(campos) for campos in linhas).encode("utf-8")
+    lista = _ler(conteudo, "rh.csv")
+    assert lista.nomes == ["Ana Lima", "Bruno Souza"]
+    assert [lista.rotulos[c] for c in lista.restricoes] == ["Vegano", "Nenhuma"]
+    assert lista.num_erros == 0
+
+
+def test_csv_com_bom_le_o_primeiro_campo():
+    conteudo = "\ufeffnome,email,presenca_confirmada\nAna,ana@x.com,sim\n".encode("utf-8")
+    assert _ler(conteudo, "rh.csv").nomes == ["Ana"]
+
+
+def test_csv_do_excel_em_cp1252():
+    conteudo = ("nome;email;presenca_confirmada;restricao_alimentar\n"
+                "João Araújo;joao@x.com;sim;Sem glúten\n").encode("cp1252")
+    lista = _ler(conteudo, "rh.csv")
+    assert lista.nomes == ["João Araújo"]
+    assert lista.rotulos[lista.restricoes[0]] == "Sem glúten"
+
+
+def test_csv_reporta_a_linha_do_arquivo():
+    conteudo = b"nome,email,presenca_confirmada\nAna,ana@x.com,sim\nBruno,sem-arroba,sim\n"
+    assert [onde for onde, _ in _ler(conteudo, "rh.csv").erros] == ["linha 3"] # Linha 1 é o cabeçalho
+
+
+def test_jsonl_linhas_ruins_viram_erro_com_a_linha_certa():
+    conteudo = (b'{"nome": "Ana", "email": "ana@x.com", "presenca_confirmada": true}\n'
+                b"\n" # Linha em branco: ignorada, mas conta na numeração
+                b'{"nome": "Bruno", "email": \n'
+                b'{"nome": "Carla", "email": "carla@x.com", "presenca_confirmada": false}\n'
+                b'{"nome": "Ana de novo", "email": "ANA@x.com", "presenca_confirmada": true}\n')
+    lista = _ler(conteudo, "lista.jsonl")
+    assert lista.nomes == ["Ana", "Carla"]
+    assert lista.num_erros == 2 and lista.total_lido == 4
+    (onde_json, motivo_json), (onde_dup, motivo_dup) = lista.erros
+    assert onde_json == "linha 3" and "JSON inválido" in motivo_json
+    assert onde_dup == "linha 5" and "linha 1" in motivo_dup
+
+
+def test_json_sem_linhas_reporta_o_registro():
+    conteudo = b'[{"nome": "Ana", "email": "ana@x.com", "presenca_confirmada": true}, {"nome": ""}]'
+    assert [onde for onde, _ in _ler(conteudo, "lista.json").erros] == ["registro 2"]
+
+
+def _convidado(i, **campos):
+    return {"nome": f"Convidado {i}", "email": f"c{i}@x.com", "presenca_confirmada": True, **campos}
+
+
+def test_grafias_da_mesma_restricao_viram_um_rotulo():
+    grafias = ["Sem glúten", "sem gluten", "Sem Glúten ", "  SEM   GLUTEN", "celíaca", "Gluten free"]
+    lista = validar_e_normalizar(_convidado(i, restricao_alimentar=g) for i, g in enumerate(grafias))
+    assert lista.rotulos == ["Nenhuma", "Sem glúten"]
+    assert list(lista.restricoes) == [1] * len(grafias)
+
+
+def test_sinonimos_e_restricoes_fora_da_tabela():
+    textos = ["vegana", "Vegan", "n/a", "Nenhuma", None, "diabética", "alergia a   camarão", "Alergia a camarao"]
+    lista = validar_e_normalizar(_convidado(i, restricao_alimentar=t) for i, t in enumerate(textos))
+    assert [lista.registro(i)["restricao_alimentar"] for i in range(len(lista))] == [
+        "Vegano", "Vegano", "Nenhuma", "Nenhuma", "Nenhuma", "Diabético",
+        "Alergia a camarão", "Alergia a camarão", # Fora da tabela: fica a primeira grafia vista, sem espaços sobrando
+    ]
+    assert lista.histograma_restricoes() == {"Vegano": 2, "Diabético": 1, "Alergia a camarão": 2}
+
+
+def test_email_duplicado_ignora_caixa_e_espacos():
+    registros = [_convidado(1, email="Ana@X.com"), _convidado(2, email=" ana@x.com "), _convidado(3)]
+    lista = validar_e_normalizar(registros)
+    assert lista.emails == ["ana@x.com", "c3@x.com"]
+    assert lista.erros == [("registro 2", "email duplicado (primeira ocorrência: registro 1)")]
+
+
+def test_erros_por_registro_e_limite_da_lista():
+    registros = [
+        _convidado(1),
+        {"email": "b@x.com", "presenca_confirmada": True},
+        _convidado(3, email="sem-arroba"),
+        {"nome": "Davi", "email": "d@x.com"},
+        _convidado(5, presenca_confirmada="talvez"),
+        _convidado(6, restricao_alimentar=["vegano"]),
+        "não sou um objeto",
+        _convidado(8, presenca_confirmada="Não"),
+    ]
+    lista = validar_e_normalizar(registros, max_erros=4)
+    assert lista.nomes == ["Convidado 1", "Convidado 8"] and list(lista.confirmados) == [1, 0]
+    assert lista.num_erros == 6 and lista.total_lido == 8
+    assert lista.erros == [
+        ("registro 2", "campo 'nome' ausente ou vazio"),
+        ("registro 3", "campo 'email' inválido: 'sem-arroba'"),
+        ("registro 4", "campo 'presenca_confirmada' ausente"),
+        ("registro 5", "'presenca_confirmada' inválido: 'talvez'"),
+    ]
+
+
+def test_mais_de_65535_rotulos_distintos():
+    n = 70_000
+    lista = validar_e_normalizar(_convidado(i, restricao_alimentar=f"Alergia {i}") for i in range(n))
+    assert len(lista.rotulos) == n + 1
+    assert lista.registro(n - 1)["restricao_alimentar"] == f"Alergia {n - 1}"
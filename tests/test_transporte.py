@@ -0,0 +1,66 @@
+"""Testes do dimensionamento da frota e da leitura dos pontos de embarque."""
+import itertools
+import math
+import time
+
+import pytest
+
+from transporte import (CATALOGO_VEICULOS, PONTO_RESTANTE, PONTO_UNICO, Veiculo, frota_mais_barata,
+                        ler_pontos_embarque, planejar_transporte)
+
+# Lugares nada múltiplos e um veículo caro por lugar: força combinações mistas
+CATALOGO_TORTO = (Veiculo("Kombi", 7, 300.0), Veiculo("Van", 15, 640.0), Veiculo("Ônibus", 46, 1600.0))
+# Lugares pequenos: o atalho do veículo mais barato por lugar entra já a partir de (5 - 1) x 7 = 28 pessoas
+CATALOGO_MINI = (Veiculo("Buggy", 3, 70.0), Veiculo("Jipe", 5, 100.0), Veiculo("Kombi", 7, 150.0))
+
+
+def _forca_bruta(pessoas, catalogo):
+    """Menor custo testando todas as quantidades de viagens que cabem no problema."""
+    limites = [math.ceil(pessoas / v.lugares) for v in catalogo]
+    melhor = math.inf
+    for quantidades in itertools.product(*(range(limite + 1) for limite in limites)):
+        if sum(q * v.lugares for q, v in zip(quantidades, catalogo)) >= pessoas:
+            melhor = min(melhor, sum(q * v.custo_viagem for q, v in zip(quantidades, catalogo)))
+    return melhor
+
+
+@pytest.mark.parametrize("catalogo", [CATALOGO_VEICULOS, CATALOGO_TORTO, CATALOGO_MINI],
+                         ids=["padrao", "torto", "mini"])
+def test_frota_mais_barata_igual_a_forca_bruta(catalogo):
+    for pessoas in range(0, 100):
+        viagens, lugares, custo = frota_mais_barata(pessoas, catalogo)
+        assert custo == pytest.approx(_forca_bruta(pessoas, catalogo) if pessoas else 0.0), pessoas
+        por_nome = {v.nome: v for v in catalogo}
+        assert lugares == sum(qtd * por_nome[nome].lugares for nome, qtd in viagens.items()) >= pessoas
+        assert custo == pytest.approx(sum(qtd * por_nome[nome].custo_viagem for nome, qtd in viagens.items()))
+
+
+def test_frota_mais_barata_grande_usa_so_o_resto_na_dp():
+    inicio = time.perf_counter()
+    viagens, lugares, custo = frota_mais_barata(1_000_000)
+    assert time.perf_counter() - inicio < 0.5
+    assert lugares >= 1_000_000
+    # Perto do limite inferior: quase tudo de ônibus, o mais barato por lugar
+    assert custo <= math.ceil(1_000_000 / 46) * 1600.0
+    assert viagens["Ônibus"] >= 1_000_000 // 46 - 46
+
+
+def test_planejar_transporte_completa_com_ponto_restante():
+    plano = planejar_transporte(100, {"Sede": 60})
+    assert {nome: p["pessoas"] for nome, p in plano.por_ponto.items()} == {"Sede": 60, PONTO_RESTANTE: 40}
+    assert plano.pessoas_a_mais == 0
+    assert list(planejar_transporte(30).por_ponto) == [PONTO_UNICO]
+
+
+def test_planejar_transporte_anota_pontos_que_passam_do_total():
+    plano = planejar_transporte(50, {"Sede": 40, "Filial": 25})
+    assert plano.pessoas_a_mais == 15
+    assert set(plano.por_ponto) == {"Sede", "Filial"}
+    assert planejar_transporte(None, {"Sede": 40}).pessoas_a_mais == 0 # Sem total, não há com o que comparar
+
+
+def test_ler_pontos_embarque():
+    texto = "Sede Paulista: 80\n  Filial Campinas = 25 \nMetrô Sé - 10\nsem número\n\nSede Paulista: 5\nMeia dúzia: 6.5"
+    assert ler_pontos_embarque(texto) == {"Sede Paulista": 85, "Filial Campinas": 25, "Metrô Sé": 10}
+    assert ler_pontos_embarque("") == {}
+    assert ler_pontos_embarque(None) == {}
@@ -0,0 +1,136 @@
+"""Dimensionamento da frota para eventos externos: conta de padeiro, sem LLM.
+
+Para cada ponto de embarque, uma programação dinâmica sobre o número de
+lugares acha a combinação de viagens (van, micro-ônibus, ônibus) de menor
+custo que leva todo mundo. ``dp[s]`` é o menor custo para oferecer pelo menos
+``s`` lugares; cada viagem de um veículo com ``c`` lugares leva de ``s`` para
+``s - c``. A DP só roda sobre um resto limitado pelo catálogo: o grosso vai
+em viagens do veículo de menor custo por lugar (ver ``frota_mais_barata``),
+então o custo não cresce com o número de pessoas.
+"""
+import math
+import re
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Veiculo:
+    nome: str
+    lugares: int
+    custo_viagem: float # Ida e volta, com motorista (R$)
+
+
+CATALOGO_VEICULOS = (
+    Veiculo("Van", 15, 650.0),
+    Veiculo("Micro-ônibus", 30, 1100.0),
+    Veiculo("Ônibus", 46, 1600.0),
+)
+
+PONTO_UNICO = "Ponto de encontro único"
+PONTO_RESTANTE = "Demais convidados"
+
+
+@dataclass
+class PlanoTransporte:
+    por_ponto: dict = field(default_factory=dict) # {ponto: {"pessoas", "viagens": {veiculo: n}, "lugares", "custo"}}
+    viagens_por_veiculo: int = 1
+    pessoas_a_mais: int = 0 # Quanto os pontos informados passam do total de convidados
+
+    @property
+    def custo_total(self):
+        return sum(ponto["custo"] for ponto in self.por_ponto.values())
+
+    @property
+    def total_viagens(self):
+        return sum(sum(ponto["viagens"].values()) for ponto in self.por_ponto.values())
+
+    def veiculos_necessarios(self):
+        """Veículos a contratar por tipo: cada um faz até ``viagens_por_veiculo`` viagens (somando os pontos)."""
+        viagens = {}
+        for ponto in self.por_ponto.values():
+            for nome, qtd in ponto["viagens"].items():
+                viagens[nome] = viagens.get(nome, 0) + qtd
+        return {nome: math.ceil(qtd / self.viagens_por_veiculo) for nome, qtd in viagens.items()}
+
+    def linhas(self):
+        """Uma linha por ponto de embarque, pronta para ``st.dataframe``."""
+        return [{
+            "Ponto de embarque": nome,
+            "Pessoas": ponto["pessoas"],
+            "Viagens": ", ".join(f"{qtd}x {veiculo}" for veiculo, qtd in ponto["viagens"].items()) or "-",
+            "Lugares": ponto["lugares"],
+            "Custo (R$)": round(ponto["custo"], 2),
+        } for nome, ponto in self.por_ponto.items()]
+
+    def resumo(self):
+        if not self.por_ponto:
+            return "Ninguém para transportar."
+        frota = ", ".join(f"{qtd}x {nome}" for nome, qtd in self.veiculos_necessarios().items())
+        return (f"{self.total_viagens} viagem(ns) saindo de {len(self.por_ponto)} ponto(s), "
+                f"com {frota}: R$ {self.custo_total:.2f} no total.")
+
+
+def frota_mais_barata(pessoas, catalogo=CATALOGO_VEICULOS):
+    """Menor custo para levar ``pessoas``: ({nome do veículo: viagens}, lugares, custo).
+
+    Existe solução ótima com menos de ``L`` viagens dos outros veículos, sendo
+    ``L`` os lugares do veículo de menor custo por lugar: entre ``L`` viagens
+    quaisquer, algum subconjunto soma um múltiplo de ``L`` lugares e pode
+    trocar de veículo sem encarecer. Tudo além de ``(L - 1) x maior veículo``
+    vai direto nesse veículo; a DP só resolve o resto.
+    """
+    if pessoas <= 0:
+        return {}, 0, 0.0
+    base = min(catalogo, key=lambda v: v.custo_viagem / v.lugares)
+    maior = max(v.lugares for v in catalogo)
+    viagens_base = max(0, (pessoas - (base.lugares - 1) * maior) // base.lugares)
+    resto = pessoas - viagens_base * base.lugares
+    custo = [0.0] + [math.inf] * resto
+    escolha = [None] * (resto + 1)
+    for s in range(1, resto + 1):
+        for i, veiculo in enumerate(catalogo):
+            candidato = custo[max(0, s - veiculo.lugares)] + veiculo.custo_viagem
+            if candidato < custo[s]:
+                custo[s], escolha[s] = candidato, i
+    viagens = {base.nome: viagens_base} if viagens_base else {}
+    lugares, s = viagens_base * base.lugares, resto
+    while s > 0:
+        veiculo = catalogo[escolha[s]]
+        viagens[veiculo.nome] = viagens.get(veiculo.nome, 0) + 1
+        lugares += veiculo.lugares
+        s = max(0, s - veiculo.lugares)
+    # Ordem do catálogo, para a tabela não embaralhar a cada cálculo
+    viagens = {v.nome: viagens[v.nome] for v in catalogo if v.nome in viagens}
+    return viagens, lugares, viagens_base * base.custo_viagem + custo[resto]
+
+
+def planejar_transporte(num_pessoas, pontos_embarque=None, catalogo=CATALOGO_VEICULOS, viagens_por_veiculo=1):
+    """Frota mais barata por ponto de embarque ({nome: pessoas}).
+
+    Quem não estiver em nenhum ponto informado embarca num ponto extra
+    (``PONTO_RESTANTE``); sem pontos, todos saem de ``PONTO_UNICO``. Se os
+    pontos somarem mais que ``num_pessoas``, o plano segue os pontos (não dá
+    para adivinhar de qual deles cortar) e anota o excesso em ``pessoas_a_mais``.
+    """
+    pontos = dict(pontos_embarque or {})
+    restante = (num_pessoas or 0) - sum(pontos.values())
+    if restante > 0:
+        pontos[PONTO_RESTANTE if pontos else PONTO_UNICO] = restante
+    plano = PlanoTransporte(viagens_por_veiculo=max(1, viagens_por_veiculo),
+                            pessoas_a_mais=-restante if num_pessoas and restante < 0 else 0)
+    for nome, pessoas in pontos.items():
+        if pessoas > 0:
+            viagens, lugares, custo = frota_mais_barata(pessoas, catalogo)
+            plano.por_ponto[nome] = {"pessoas": pessoas, "viagens": viagens, "lugares": lugares, "custo": custo}
+    return plano
+
+
+def ler_pontos_embarque(texto):
+    """Converte linhas "Nome: pessoas" em {nome: pessoas}; linhas fora do formato são ignoradas."""
+    pontos = {}
+    for linha in (texto or "").splitlines():
+        casamento = re.match(r"\s*(.+?)\s*[:=-]\s*(\d+)\s*$", linha)
+        if casamento:
+            nome = casamento.group(1)
+            pontos[nome] = pontos.get(nome, 0) + int(casamento.group(2))
+    return pontos